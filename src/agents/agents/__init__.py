@@ -2,8 +2,13 @@
 # Base agent classes and agent runner implementations
 
 from src.agents.agents.base import BaseAgent
+from src.agents.agents.cache import LLMCache
+from src.agents.agents.semantic_cache import SemanticCache
 from src.agents.agents.runner import (
     AgentRunner,
+    get_http_client,
+    close_http_client,
+    warm_http_client,
     LLM_BASE_URL,
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
@@ -19,6 +24,11 @@ from src.agents.agents.tool_agent import (
 __all__ = [
     "BaseAgent",
     "AgentRunner",
+    "LLMCache",
+    "SemanticCache",
+    "get_http_client",
+    "close_http_client",
+    "warm_http_client",
     "LLM_BASE_URL",
     "DEFAULT_TEMPERATURE",
     "DEFAULT_MAX_TOKENS",
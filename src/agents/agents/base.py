@@ -6,6 +6,8 @@ Prompts are loaded from .agents/prompts/{agent-name}/core.yaml.
 """
 
 from dataclasses import dataclass, field
+from typing import List, Optional
+
 from src.agents.prompts.loader import load_agent_prompt
 
 
@@ -19,12 +21,16 @@ class BaseAgent:
         name: Human-readable name (e.g., "Spec Analyst")
         prompt_path: Directory name under .agents/prompts/
         description: Brief description of the agent's role
+        depends_on: IDs of earlier chain agents whose outputs this agent needs.
+                    None (default) means every earlier agent; an explicit list
+                    lets a chain run this agent alongside others it does not need.
     """
 
     id: str
     name: str
     prompt_path: str
     description: str = field(default="")
+    depends_on: Optional[List[str]] = field(default=None)
 
     def load_prompt(self) -> str:
         """
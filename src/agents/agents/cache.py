@@ -0,0 +1,88 @@
+"""
+LLM Cache - In-process cache for deterministic LLM responses.
+
+Single Responsibility: Remember LLM replies for identical temperature-0 requests.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.agents.agents.config import LLM_CACHE_TTL, LLM_CACHE_SIZE
+
+
+class LLMCache:
+    """
+    LRU cache with per-entry expiry for LLM response content.
+
+    Keys are sha256 digests of the request (model, messages, temperature,
+    max_tokens); values are the assistant's reply content. Callers should only
+    cache requests made with temperature 0, since only those are repeatable.
+
+    Attributes:
+        ttl: Seconds an entry stays valid after it is stored
+        maxsize: Maximum number of entries kept before evicting the oldest
+        stats: Counters for hits, misses and (approximate) tokens saved
+    """
+
+    def __init__(self, ttl: float = LLM_CACHE_TTL, maxsize: int = LLM_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Hash a request into a cache key."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached content for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        content = entry[1]
+        self.stats["hits"] += 1
+        # Roughly four characters per token; the reply's usage is not kept
+        self.stats["tokens_saved"] += len(content) // 4
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """Store content under key, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic() + self.ttl, content)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the stats."""
+        self._entries.clear()
+        self.stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+
+__all__ = ["LLMCache"]
@@ -4,12 +4,40 @@ Agent Configuration - Constants for agent execution.
 Single Responsibility: Centralize agent and LLM configuration.
 """
 
+import importlib.util
+import os
+
 # LLM service configuration
 LLM_BASE_URL = "http://192.168.51.22:8080"
 DEFAULT_MODEL = "gpt-oss"  # Default model for agent execution
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_MAX_TOKENS = 4096
 LLM_TIMEOUT = 120.0  # seconds
+LLM_CONNECT_TIMEOUT = 10.0  # seconds
+
+# Shared HTTP connection pool for LLM calls
+LLM_MAX_CONNECTIONS = int(os.getenv("AGENT_HTTP_MAX_CONN", "200"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("AGENT_HTTP_KEEPALIVE", "64"))
+LLM_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+LLM_HTTP2 = (
+    os.getenv("AGENT_HTTP2", "1") != "0"
+    and importlib.util.find_spec("h2") is not None
+)
+LLM_WARMUP_TIMEOUT = 2.0  # seconds
+
+# Requests with more messages than this are encoded/hashed in a worker thread
+LLM_OFFLOAD_MESSAGE_COUNT = 8
+
+# Response cache for deterministic (temperature 0) LLM calls
+LLM_CACHE_TTL = 3600.0  # seconds
+LLM_CACHE_SIZE = 1024
+
+# Semantic (embedding similarity) cache for temperature-0 LLM calls
+SEMANTIC_CACHE_COLLECTION = "llm_cache"
+SEMANTIC_CACHE_THRESHOLD = 0.92  # minimum cosine similarity for a hit
+SEMANTIC_CACHE_TTL = 3600.0  # seconds
 
 __all__ = [
     "LLM_BASE_URL",
@@ -17,4 +45,16 @@ __all__ = [
     "DEFAULT_TEMPERATURE",
     "DEFAULT_MAX_TOKENS",
     "LLM_TIMEOUT",
+    "LLM_CONNECT_TIMEOUT",
+    "LLM_MAX_CONNECTIONS",
+    "LLM_MAX_KEEPALIVE_CONNECTIONS",
+    "LLM_KEEPALIVE_EXPIRY",
+    "LLM_HTTP2",
+    "LLM_WARMUP_TIMEOUT",
+    "LLM_OFFLOAD_MESSAGE_COUNT",
+    "LLM_CACHE_TTL",
+    "LLM_CACHE_SIZE",
+    "SEMANTIC_CACHE_COLLECTION",
+    "SEMANTIC_CACHE_THRESHOLD",
+    "SEMANTIC_CACHE_TTL",
 ]
@@ -83,6 +83,10 @@ def build_messages(
     """
     Build the messages list for an LLM call.
 
+    The system prompt is sent on its own so every call for an agent starts
+    with the same bytes, letting the provider reuse its prompt-prefix cache.
+    Per-request memories and context go into the final user message instead.
+
     Args:
         system_prompt: The agent's system prompt
         memory_context: List of relevant memories
@@ -93,28 +97,27 @@ def build_messages(
     Returns:
         List of messages in OpenAI format
     """
-    messages = []
+    messages = [{"role": "system", "content": system_prompt}]
+
+    # Add conversation history if provided
+    if conversation_history:
+        messages.extend(conversation_history)
 
-    # Build combined system prompt
-    system_parts = [system_prompt]
+    user_parts = []
 
     # Add memory context if available
     if memory_context:
         memory_str = "\n".join(f"- {mem}" for mem in memory_context)
-        system_parts.append(f"## Relevant Memories\n{memory_str}")
+        user_parts.append(f"## Relevant Memories\n{memory_str}")
 
     # Add context from previous agents
     if context:
-        system_parts.append(f"## Context from Previous Agents\n{context}")
+        user_parts.append(f"## Context from Previous Agents\n{context}")
 
-    messages.append({"role": "system", "content": "\n\n".join(system_parts)})
-
-    # Add conversation history if provided
-    if conversation_history:
-        messages.extend(conversation_history)
+    # Add the current user message last
+    user_parts.append(user_message)
 
-    # Add the current user message
-    messages.append({"role": "user", "content": user_message})
+    messages.append({"role": "user", "content": "\n\n".join(user_parts)})
 
     return messages
 
@@ -4,8 +4,17 @@ LLM Client - Communication with the LLM service.
 Single Responsibility: Make LLM API calls with logging and error handling.
 """
 
+import asyncio
+import json
+import logging
+import re
 import time
-from typing import List, Dict, Optional, Any, Union
+from typing import AsyncIterator, List, Dict, Optional, Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 from src.agents.logging_config import get_logger, LogEvent
 from src.agents.agents.config import (
@@ -14,10 +23,51 @@ from src.agents.agents.config import (
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
     LLM_TIMEOUT,
+    LLM_OFFLOAD_MESSAGE_COUNT,
 )
 
 logger = get_logger("agents.llm")
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a request payload to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Payloads are pre-encoded and sent as content=, bypassing httpx's json= encoder
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+async def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Encode a request payload, off the event loop when the history is long."""
+    if len(payload["messages"]) > LLM_OFFLOAD_MESSAGE_COUNT:
+        return await asyncio.to_thread(_json_dumps, payload)
+    return _json_dumps(payload)
+
+
+# One SSE "data:" field per line; matched on raw bytes so other lines are never decoded
+_SSE_DATA_RE = re.compile(rb"^data: ?(.*?)\r?$", re.MULTILINE)
+
+
+async def _iter_sse_data(response) -> AsyncIterator[bytes]:
+    """Yield the payload of each SSE data line from a streamed response body."""
+    buffer = b""
+    async for block in response.aiter_bytes():
+        buffer += block
+        # Only scan complete lines; keep the partial tail for the next block
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            continue
+        for match in _SSE_DATA_RE.finditer(buffer, 0, end):
+            yield match.group(1)
+        buffer = buffer[end + 1:]
+    for match in _SSE_DATA_RE.finditer(buffer):
+        yield match.group(1)
+
 
 async def call_llm(
     http_client,
@@ -83,14 +133,16 @@ async def call_llm(
         }
     )
 
-    # Debug: log the FULL payload being sent
-    import json as json_module
-    logger.info(f"FULL_REQUEST_DEBUG: {json_module.dumps(payload, indent=2, default=str)}")
+    # Debug: log the FULL payload being sent (only serialized when debug logging is on)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"FULL_REQUEST_DEBUG: {json.dumps(payload, indent=2, default=str)}")
 
     try:
+        body = await _encode_payload(payload)
         response = await http_client.post(
             url,
-            json=payload,
+            content=body,
+            headers=_JSON_HEADERS,
             timeout=LLM_TIMEOUT
         )
         response.raise_for_status()
@@ -115,6 +167,7 @@ async def call_llm(
                 "prompt_tokens": usage.get("prompt_tokens"),
                 "completion_tokens": usage.get("completion_tokens"),
                 "total_tokens": usage.get("total_tokens"),
+                "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens"),
                 "response_preview": (content[:200] + "..." if len(content) > 200 else content) if content else "[tool_calls]"
             }
         )
@@ -137,4 +190,103 @@ async def call_llm(
         raise
 
 
-__all__ = ["call_llm"]
+async def stream_llm(
+    http_client,
+    messages: List[Dict[str, Any]],
+    temperature: float = DEFAULT_TEMPERATURE,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    model: str = DEFAULT_MODEL,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Call the LLM service with streaming enabled and yield chunks as they arrive.
+
+    Args:
+        http_client: Async HTTP client for making requests
+        messages: List of chat messages in OpenAI format
+        temperature: Sampling temperature (0.0-2.0)
+        max_tokens: Maximum tokens to generate
+        model: Model name to use
+        tools: Optional list of tool definitions for function calling
+        tool_choice: Optional tool choice strategy ("auto", "none", or specific tool)
+
+    Yields:
+        Each OpenAI-format "chat.completion.chunk" dict, up to "data: [DONE]"
+
+    Raises:
+        RuntimeError: If HTTP client is not provided
+        Exception: If the LLM service is unavailable or returns an error
+    """
+    if http_client is None:
+        raise RuntimeError("HTTP client not initialized")
+
+    url = f"{LLM_BASE_URL}/v1/chat/completions"
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "stream": True
+    }
+
+    if tools:
+        payload["tools"] = tools
+    if tool_choice is not None:
+        payload["tool_choice"] = tool_choice
+
+    start_time = time.time()
+    logger.info(
+        LogEvent.LLM_CALLING,
+        extra={
+            "url": url,
+            "model": model,
+            "message_count": len(messages),
+            "stream": True,
+            "has_tools": bool(tools)
+        }
+    )
+
+    chunk_count = 0
+    try:
+        body = await _encode_payload(payload)
+        async with http_client.stream(
+            "POST", url, content=body, headers=_JSON_HEADERS, timeout=LLM_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            async for data in _iter_sse_data(response):
+                if data == b"[DONE]":
+                    break
+                chunk_count += 1
+                yield _json_loads(data)
+
+        duration_ms = (time.time() - start_time) * 1000
+        logger.info(
+            LogEvent.LLM_RESPONSE,
+            extra={
+                "model": model,
+                "stream": True,
+                "chunk_count": chunk_count,
+                "duration_ms": round(duration_ms, 2)
+            }
+        )
+
+    except Exception as e:
+        duration_ms = (time.time() - start_time) * 1000
+        logger.error(
+            LogEvent.LLM_ERROR,
+            extra={
+                "url": url,
+                "model": model,
+                "stream": True,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "duration_ms": round(duration_ms, 2)
+            },
+            exc_info=True
+        )
+        raise
+
+
+__all__ = ["call_llm", "stream_llm"]
@@ -4,37 +4,214 @@ AgentRunner - Executes agents by loading prompts and calling the LLM.
 Handles agent execution with memory integration.
 """
 
-from typing import List, Dict, Optional, TYPE_CHECKING
+import asyncio
+from typing import AsyncIterator, Awaitable, List, Dict, Optional, Set, TYPE_CHECKING
 
+import httpx
+
+from src.agents.logging_config import get_logger, LogEvent
 from src.agents.agents.base import BaseAgent
-from src.agents.agents.config import DEFAULT_TEMPERATURE, DEFAULT_MAX_TOKENS
-from src.agents.agents.llm import call_llm
+from src.agents.agents.cache import LLMCache
+from src.agents.agents.config import (
+    DEFAULT_MODEL,
+    DEFAULT_TEMPERATURE,
+    DEFAULT_MAX_TOKENS,
+    LLM_OFFLOAD_MESSAGE_COUNT,
+    LLM_CONNECT_TIMEOUT,
+    LLM_HTTP2,
+    LLM_WARMUP_TIMEOUT,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+)
+from src.agents.agents.llm import call_llm, stream_llm
 from src.agents.agents.context import retrieve_memories, build_messages
 
 if TYPE_CHECKING:
+    from src.agents.agents.semantic_cache import SemanticCache
     from src.agents.memory.client import MemoryClient
 
 # Re-export config for backward compatibility
 from src.agents.agents.config import LLM_BASE_URL, LLM_TIMEOUT  # noqa: F401
 
+logger = get_logger("agents.runner")
+
+# Process-wide client so LLM calls reuse pooled keep-alive connections
+_shared_client: Optional[httpx.AsyncClient] = None
+# Event loop the shared client was built on (None if built outside a loop)
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+# Closes of clients replaced after an event loop change, still in progress
+_closing_clients: Set[asyncio.Task] = set()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    """Close a replaced client, ignoring errors from its old loop's transports."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug(f"Closing replaced HTTP client failed: {e}")
+
+
+def _discard_client(
+    client: httpx.AsyncClient, client_loop: asyncio.AbstractEventLoop
+) -> None:
+    """Close a client built on another event loop without blocking the caller."""
+    if client_loop.is_running():
+        # Still alive in another thread: close it there
+        asyncio.run_coroutine_threadsafe(_close_quietly(client), client_loop)
+        return
+    task = asyncio.get_running_loop().create_task(_close_quietly(client))
+    _closing_clients.add(task)
+    task.add_done_callback(_closing_clients.discard)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared httpx.AsyncClient for LLM calls, creating it on first use.
+
+    Pooled connections are bound to the loop that opened them, so a client
+    built on one event loop is replaced when requested from another, e.g.
+    after a TestClient or asyncio.run() loop has gone away. The old client
+    is closed in the background so its pool is not leaked.
+
+    Returns:
+        The process-wide client with pooled keep-alive connections
+    """
+    global _shared_client, _shared_client_loop
+    loop = _running_loop()
+    if (
+        _shared_client is not None
+        and loop is not None
+        and _shared_client_loop is not None
+        and _shared_client_loop is not loop
+    ):
+        logger.debug("Shared HTTP client belongs to another event loop; rebuilding")
+        _discard_client(_shared_client, _shared_client_loop)
+        _shared_client = None
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client_loop = loop
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+            http2=LLM_HTTP2,
+        )
+    return _shared_client
+
+
+async def warm_http_client() -> None:
+    """
+    Open a connection to the LLM service ahead of the first real request.
+
+    Sends a HEAD to /v1/models on the shared client so connection setup
+    (and TLS, for https endpoints) is paid at startup. Failures are ignored.
+    """
+    try:
+        await get_http_client().head(
+            f"{LLM_BASE_URL}/v1/models", timeout=LLM_WARMUP_TIMEOUT
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"LLM connection warm-up failed: {e}")
+
+
+async def close_http_client() -> None:
+    """Close the shared client; the next get_http_client() call builds a new one."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        _shared_client_loop = None
+
+
+async def _cache_key(
+    messages: List[Dict[str, str]], temperature: float, max_tokens: int
+) -> str:
+    """Hash a request for the response caches, off the event loop for long histories."""
+    if len(messages) > LLM_OFFLOAD_MESSAGE_COUNT:
+        return await asyncio.to_thread(
+            LLMCache.make_key, DEFAULT_MODEL, messages, temperature, max_tokens
+        )
+    return LLMCache.make_key(DEFAULT_MODEL, messages, temperature, max_tokens)
+
 
 class AgentRunner:
     """
     Executes agents by loading their prompts and calling the LLM service.
 
     Attributes:
-        http_client: Async HTTP client for LLM calls (injected for testing)
+        http_client: Async HTTP client for LLM calls (injected for testing,
+                     otherwise the shared client, looked up on each call)
+        cache: Optional LLMCache for temperature-0 responses
     """
 
-    def __init__(self, http_client=None):
+    def __init__(
+        self,
+        http_client=None,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional["SemanticCache"] = None
+    ):
         """
         Initialize the AgentRunner.
 
         Args:
             http_client: Optional httpx.AsyncClient for LLM calls.
-                        If None, calls will fail (requires injection).
+                        If None, the shared client from get_http_client() is used.
+            cache: Optional LLMCache; identical temperature-0 calls are
+                   answered from it without contacting the LLM.
+            semantic_cache: Optional SemanticCache; temperature-0 calls whose
+                            final user message closely matches an earlier one
+                            (with identical preceding messages) reuse its reply.
+        """
+        self._injected_client = http_client
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        # Semantic cache stores still running after their reply was returned
+        self._pending_stores: Set[asyncio.Task] = set()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The injected client, or the current shared client.
+
+        Resolved per call so a runner outlives close_http_client() and
+        event loop changes instead of holding on to a closed client.
+        """
+        if self._injected_client is not None:
+            return self._injected_client
+        return get_http_client()
+
+    def _store_in_background(self, store: Awaitable[None]) -> None:
+        """Run a cache store without holding up the reply; aclose() waits for it."""
+        task = asyncio.ensure_future(store)
+        self._pending_stores.add(task)
+        task.add_done_callback(self._pending_stores.discard)
+
+    async def aclose(self) -> None:
+        """
+        Wait for pending background cache stores.
+
+        HTTP clients are never closed here: an injected client belongs to
+        its owner, and the shared client is closed by the gateway lifespan
+        (close_http_client()), since other runners are using it.
         """
-        self._http_client = http_client
+        if self._pending_stores:
+            await asyncio.gather(*self._pending_stores, return_exceptions=True)
+
+    async def __aenter__(self) -> "AgentRunner":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
 
     async def call_llm(
         self,
@@ -53,13 +230,74 @@ class AgentRunner:
         Returns:
             The assistant's response content as a string
         """
+        # Only temperature-0 replies are repeatable, so only those are cached
+        key = None
+        if self.cache is not None and temperature == 0.0:
+            key = await _cache_key(messages, temperature, max_tokens)
+            content = self.cache.get(key)
+            if content is not None:
+                logger.info(LogEvent.LLM_CACHE_HIT, extra=dict(self.cache.stats))
+                return content
+
+        # Near-duplicate lookup on the final user turn, scoped to everything before it
+        scope = None
+        vector = None
+        if (
+            self.semantic_cache is not None
+            and temperature == 0.0
+            and messages
+            and messages[-1].get("role") == "user"
+        ):
+            scope = await _cache_key(messages[:-1], temperature, max_tokens)
+            content, vector = await self.semantic_cache.lookup(messages[-1]["content"], scope)
+            if content is not None:
+                logger.info(LogEvent.LLM_CACHE_HIT, extra={"semantic": True})
+                return content
+
         message = await call_llm(
-            http_client=self._http_client,
+            http_client=self.http_client,
             messages=messages,
             temperature=temperature,
             max_tokens=max_tokens
         )
-        return message.get("content", "")
+        content = message.get("content", "")
+        if content:
+            if key is not None:
+                self.cache.put(key, content)
+            if scope is not None:
+                # Reuse the lookup's embedding and store off the reply path
+                self._store_in_background(
+                    self.semantic_cache.put(messages[-1]["content"], content, scope, vector)
+                )
+        return content
+
+    async def stream_llm(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = DEFAULT_TEMPERATURE,
+        max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> AsyncIterator[str]:
+        """
+        Stream the LLM's reply as content deltas, as soon as each one arrives.
+
+        Args:
+            messages: List of chat messages in OpenAI format
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Non-empty content fragments; joined they equal call_llm's result
+        """
+        async for chunk in stream_llm(
+            http_client=self.http_client,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        ):
+            for choice in chunk.get("choices", ()):
+                content = choice.get("delta", {}).get("content")
+                if content:
+                    yield content
 
     async def run_agent(
         self,
@@ -88,11 +326,25 @@ class AgentRunner:
         Returns:
             The agent's response as a string
         """
-        system_prompt = agent.load_prompt()
+        # Fast path: nothing to retrieve or merge, so skip straight to the LLM
+        if memory_client is None and not context and not conversation_history:
+            return await self.call_llm(
+                messages=[
+                    {"role": "system", "content": agent.load_prompt()},
+                    {"role": "user", "content": user_message}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
 
-        memory_context = await retrieve_memories(
-            agent, user_message, memory_client, user_id
-        )
+        # The prompt loader is cached, so this is a dict lookup after the first call
+        system_prompt = agent.load_prompt()
+        if memory_client and user_id:
+            memory_context = await retrieve_memories(
+                agent, user_message, memory_client, user_id
+            )
+        else:
+            memory_context = []
 
         messages = build_messages(
             system_prompt, memory_context, context, conversation_history, user_message
@@ -121,6 +373,7 @@ async def run_agent(
 
     This is a convenience function that creates an AgentRunner instance
     and runs the agent. For multiple agent calls, use AgentRunner directly.
+    Without an http_client, the shared pooled client is used.
     """
     runner = AgentRunner(http_client=http_client)
     return await runner.run_agent(
@@ -135,4 +388,13 @@ async def run_agent(
     )
 
 
-__all__ = ["AgentRunner", "run_agent", "LLM_BASE_URL", "LLM_TIMEOUT"]
+__all__ = [
+    "AgentRunner",
+    "LLMCache",
+    "run_agent",
+    "get_http_client",
+    "close_http_client",
+    "warm_http_client",
+    "LLM_BASE_URL",
+    "LLM_TIMEOUT",
+]
@@ -0,0 +1,168 @@
+"""
+Semantic Cache - Reuse LLM replies for near-duplicate user messages.
+
+Single Responsibility: Look up and store LLM replies by embedding similarity.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+from src.agents.logging_config import get_logger
+from src.agents.agents.config import (
+    SEMANTIC_CACHE_COLLECTION,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL,
+)
+
+logger = get_logger("agents.semantic_cache")
+
+
+class SemanticCache:
+    """
+    Qdrant-backed cache of LLM replies keyed by user-message embeddings.
+
+    A lookup embeds the user message and returns the stored reply of the
+    closest unexpired entry in the same scope, if its cosine similarity is at
+    least the threshold. Lookups and stores degrade to misses on errors, so
+    the cache never blocks an LLM call. The synchronous Qdrant calls run in
+    a worker thread so they do not stall the event loop.
+
+    Attributes:
+        embedder: Object with an async embed(text) -> vector method
+                  (e.g. the memory EmbeddingBatcher)
+        qdrant_client: Qdrant client instance
+        collection: Qdrant collection holding the cached replies
+        threshold: Minimum cosine similarity for a hit
+        ttl: Seconds a stored reply stays valid
+    """
+
+    def __init__(
+        self,
+        embedder,
+        qdrant_client,
+        collection: str = SEMANTIC_CACHE_COLLECTION,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = SEMANTIC_CACHE_TTL,
+    ):
+        self.embedder = embedder
+        self.qdrant_client = qdrant_client
+        self.collection = collection
+        self.threshold = threshold
+        self.ttl = ttl
+
+    def ensure_collection(self, vector_size: int = 1024) -> None:
+        """Create the cache collection (cosine distance) if it does not exist yet."""
+        from qdrant_client.models import Distance, VectorParams
+
+        if self.qdrant_client.collection_exists(collection_name=self.collection):
+            return
+
+        self.qdrant_client.create_collection(
+            collection_name=self.collection,
+            vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+        )
+
+    def _filter(self, scope: str):
+        """Restrict matches to unexpired entries of one scope."""
+        from qdrant_client.models import FieldCondition, Filter, MatchValue, Range
+
+        return Filter(
+            must=[
+                FieldCondition(key="scope", match=MatchValue(value=scope)),
+                FieldCondition(key="expires_at", range=Range(gt=time.time())),
+            ]
+        )
+
+    async def get(self, user_msg: str, scope: str = "") -> Optional[str]:
+        """
+        Return a cached reply for a message similar to user_msg, or None.
+
+        Args:
+            user_msg: The user message to look up
+            scope: Key of everything else the reply depends on (system prompt,
+                   history, sampling settings); only entries with the same
+                   scope can match
+
+        Returns:
+            The cached reply content, or None on a miss or error
+        """
+        content, _ = await self.lookup(user_msg, scope)
+        return content
+
+    async def lookup(
+        self, user_msg: str, scope: str = ""
+    ) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        Like get(), but also return the embedding of user_msg.
+
+        Pass the vector on to put() after a miss so the message is not
+        embedded twice.
+
+        Returns:
+            Tuple of (cached reply or None, embedding or None if embedding failed)
+        """
+        vector = None
+        try:
+            vector = await self.embedder.embed(user_msg)
+            results = await asyncio.to_thread(
+                self.qdrant_client.search,
+                collection_name=self.collection,
+                query_vector=vector,
+                query_filter=self._filter(scope),
+                limit=1,
+                score_threshold=self.threshold,
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None, vector
+
+        if not results:
+            return None, vector
+
+        logger.debug(f"Semantic cache hit (score={results[0].score:.3f})")
+        return results[0].payload["response"], vector
+
+    async def put(
+        self,
+        user_msg: str,
+        response: str,
+        scope: str = "",
+        vector: Optional[List[float]] = None,
+    ) -> None:
+        """
+        Store the reply to user_msg for later similar messages.
+
+        Args:
+            user_msg: The user message that produced the reply
+            response: The LLM's reply content
+            scope: Same scope key that get() will be called with
+            vector: Embedding of user_msg from lookup(); embedded here if None
+        """
+        from qdrant_client.models import PointStruct
+
+        try:
+            if vector is None:
+                vector = await self.embedder.embed(user_msg)
+            await asyncio.to_thread(
+                self.qdrant_client.upsert,
+                collection_name=self.collection,
+                points=[
+                    PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector=vector,
+                        payload={
+                            "scope": scope,
+                            "prompt": user_msg,
+                            "response": response,
+                            "expires_at": time.time() + self.ttl,
+                        },
+                    )
+                ],
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
+
+__all__ = ["SemanticCache"]
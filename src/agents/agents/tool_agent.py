@@ -15,11 +15,27 @@ Architecture:
 
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Callable, Dict, List, Optional, Awaitable
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
 from src.agents.agents.base import BaseAgent
 from src.agents.agents.llm import call_llm
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_text(obj: Any) -> str:
+    """Encode a tool result to a JSON string, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
 
 @dataclass
 class ToolAgent(BaseAgent):
@@ -61,17 +77,14 @@ async def default_tool_executor(
     Returns:
         Tool execution result
     """
-    from src.agents.indexer import dispatch_tool, INDEXER_TOOLS
-    from src.agents.todo import dispatch_todo_tool, TODO_TOOLS
+    source = _tool_sources().get(tool_name)
 
-    # Check if tool is a known indexer tool
-    indexer_tool_names = [t["function"]["name"] for t in INDEXER_TOOLS]
-    if tool_name in indexer_tool_names:
+    if source == "indexer":
+        from src.agents.indexer import dispatch_tool
         return await dispatch_tool(tool_name, arguments, progress_callback=progress_callback)
 
-    # Check if tool is a known todo tool
-    todo_tool_names = [t["function"]["name"] for t in TODO_TOOLS]
-    if tool_name in todo_tool_names:
+    if source == "todo":
+        from src.agents.todo import dispatch_todo_tool
         # dispatch_todo_tool is sync (fast in-memory operations)
         return dispatch_todo_tool(tool_name, arguments)
 
@@ -79,6 +92,22 @@ async def default_tool_executor(
     return {"error": f"Unknown tool: {tool_name}"}
 
 
+@lru_cache(maxsize=1)
+def _tool_sources() -> Dict[str, str]:
+    """
+    Map each built-in tool name to the package that dispatches it.
+
+    Built on first use (the tool packages are imported lazily) and reused
+    for every later call. Indexer tools win over todo tools on a name clash.
+    """
+    from src.agents.indexer import INDEXER_TOOL_NAMES
+    from src.agents.todo import TODO_TOOLS
+
+    sources = {t["function"]["name"]: "todo" for t in TODO_TOOLS}
+    sources.update(dict.fromkeys(INDEXER_TOOL_NAMES, "indexer"))
+    return sources
+
+
 class ToolAgentRunner:
     """
     Executes ToolAgents with tool calling loop.
@@ -187,8 +216,8 @@ class ToolAgentRunner:
 
                 # Parse arguments
                 try:
-                    arguments = json.loads(arguments_str)
-                except json.JSONDecodeError:
+                    arguments = _json_loads(arguments_str)
+                except ValueError:
                     arguments = {}
 
                 # Execute tool
@@ -196,7 +225,7 @@ class ToolAgentRunner:
 
                 # Convert result to string if needed
                 if isinstance(result, dict):
-                    result_str = json.dumps(result)
+                    result_str = _json_text(result)
                 else:
                     result_str = str(result)
 
@@ -227,15 +256,9 @@ class ToolAgentRunner:
         Returns:
             Merged list of tools
         """
-        # Build map of agent tools by name
+        # One pass in order: later (external) tools replace same-named agent tools
         tools_map = {}
-        for tool in agent_tools:
-            name = tool.get("function", {}).get("name")
-            if name:
-                tools_map[name] = tool
-
-        # External tools override
-        for tool in external_tools:
+        for tool in chain(agent_tools, external_tools):
             name = tool.get("function", {}).get("name")
             if name:
                 tools_map[name] = tool
@@ -1,9 +1,11 @@
 """
 BaseChain - Foundation class for agent workflow chains.
 
-Provides common functionality for sequential agent execution.
+Provides common functionality for sequential agent execution, running
+agents concurrently where their declared dependencies allow.
 """
 
+import asyncio
 import time
 from dataclasses import dataclass, field
 from typing import List
@@ -72,13 +74,15 @@ class BaseChain:
             }
         )
 
-        for i, agent in enumerate(self.agents):
-            result = await self._execute_agent(
-                context, agent, i, chain_start_time, http_client
+        index = 0
+        for stage in self._stages():
+            result = await self._execute_stage(
+                context, stage, index, chain_start_time, http_client
             )
             if result is not None:
                 # Agent failed, return partial results
                 return result
+            index += len(stage)
 
         chain_duration_ms = (time.time() - chain_start_time) * 1000
         logger.info(
@@ -93,20 +97,83 @@ class BaseChain:
         )
         return context
 
-    async def _execute_agent(
+    def _stages(self) -> List[List[BaseAgent]]:
+        """
+        Group agents into stages that can run concurrently.
+
+        An agent joins the previous agent's stage when it declares depends_on
+        and none of its dependencies are in that stage; otherwise it starts a
+        new stage. Agents without depends_on always run on their own.
+        """
+        stages: List[List[BaseAgent]] = []
+        for agent in self.agents:
+            if (
+                stages
+                and agent.depends_on is not None
+                and not any(a.id in agent.depends_on for a in stages[-1])
+            ):
+                stages[-1].append(agent)
+            else:
+                stages.append([agent])
+        return stages
+
+    async def _execute_stage(
         self,
         context: ChainContext,
-        agent: BaseAgent,
+        stage: List[BaseAgent],
         index: int,
         chain_start_time: float,
         http_client
     ) -> ChainContext | None:
         """
-        Execute a single agent in the chain.
+        Execute one stage, running its agents concurrently if there are several.
 
-        Returns None on success, or the context with error info on failure.
+        Agents only report their outcome; outputs and failure info are written
+        to the shared context here, in chain order, so a stage with several
+        failures deterministically reports the first one in the chain.
+
+        Returns None on success, or the context with error info if any failed.
+        """
+        if len(stage) == 1:
+            context.current_agent = stage[0].id
+            outcomes = [await self._execute_agent(
+                context, stage[0], index, http_client
+            )]
+        else:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._execute_agent(
+                        context, agent, index + offset, http_client
+                    ))
+                    for offset, agent in enumerate(stage)
+                ]
+            outcomes = [task.result() for task in tasks]
+
+        # Keep every successful output (partial results), in chain order
+        for agent, outcome in zip(stage, outcomes):
+            if not isinstance(outcome, Exception):
+                context.agent_outputs[agent.id] = outcome
+
+        for agent, outcome in zip(stage, outcomes):
+            if isinstance(outcome, Exception):
+                return self._handle_agent_failure(context, agent, outcome, chain_start_time)
+
+        context.current_agent = stage[-1].id
+        return None
+
+    async def _execute_agent(
+        self,
+        context: ChainContext,
+        agent: BaseAgent,
+        index: int,
+        http_client
+    ) -> str | Exception:
+        """
+        Execute a single agent in the chain without writing to the context.
+
+        Returns the agent's output, or the exception it failed with (logged,
+        not raised, so sibling agents in a stage keep running).
         """
-        context.current_agent = agent.id
         agent_start_time = time.time()
 
         logger.info(
@@ -132,58 +199,50 @@ class BaseChain:
                 conversation_history=context.conversation_history,
                 http_client=http_client
             )
-
-            # Store the output
-            context.agent_outputs[agent.id] = output
+        except Exception as e:
             agent_duration_ms = (time.time() - agent_start_time) * 1000
-
-            logger.info(
-                LogEvent.AGENT_COMPLETED,
+            logger.error(
+                LogEvent.AGENT_FAILED,
                 extra={
                     "chain_id": self.id,
                     "agent_id": agent.id,
                     "agent_index": index + 1,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
                     "duration_ms": round(agent_duration_ms, 2),
-                    "output_length": len(output),
-                    "output_preview": output[:200] + "..." if len(output) > 200 else output
-                }
+                    "partial_outputs": list(context.agent_outputs.keys())
+                },
+                exc_info=True
             )
-            return None  # Success
+            return e
 
-        except Exception as e:
-            return self._handle_agent_failure(
-                context, agent, index, e, agent_start_time, chain_start_time
-            )
+        agent_duration_ms = (time.time() - agent_start_time) * 1000
+        logger.info(
+            LogEvent.AGENT_COMPLETED,
+            extra={
+                "chain_id": self.id,
+                "agent_id": agent.id,
+                "agent_index": index + 1,
+                "duration_ms": round(agent_duration_ms, 2),
+                "output_length": len(output),
+                "output_preview": output[:200] + "..." if len(output) > 200 else output
+            }
+        )
+        return output
 
     def _handle_agent_failure(
         self,
         context: ChainContext,
         agent: BaseAgent,
-        index: int,
         error: Exception,
-        agent_start_time: float,
         chain_start_time: float
     ) -> ChainContext:
-        """Handle agent failure and return context with error info."""
+        """Record the chain's failing agent in the context and return it."""
         context.error = str(error)
         context.failed_agent = agent.id
-        agent_duration_ms = (time.time() - agent_start_time) * 1000
+        context.current_agent = agent.id
         chain_duration_ms = (time.time() - chain_start_time) * 1000
 
-        logger.error(
-            LogEvent.AGENT_FAILED,
-            extra={
-                "chain_id": self.id,
-                "agent_id": agent.id,
-                "agent_index": index + 1,
-                "error": str(error),
-                "error_type": type(error).__name__,
-                "duration_ms": round(agent_duration_ms, 2),
-                "partial_outputs": list(context.agent_outputs.keys())
-            },
-            exc_info=True
-        )
-
         logger.warning(
             LogEvent.CHAIN_FAILED,
             extra={
@@ -43,7 +43,8 @@ def build_agent_context(
     """
     Build the context string to pass to an agent.
 
-    Includes user message, memory context, and previous agent outputs.
+    Includes user message, memory context, and previous agent outputs
+    (only those listed in agent.depends_on, when it is set).
 
     Args:
         context: The current chain context
@@ -66,8 +67,11 @@ def build_agent_context(
     if context.agent_outputs:
         outputs_parts = []
         for agent_id, output in context.agent_outputs.items():
+            if agent.depends_on is not None and agent_id not in agent.depends_on:
+                continue
             outputs_parts.append(f"### {agent_id}\n{output}")
-        parts.append(f"## Previous Agent Outputs\n" + "\n\n".join(outputs_parts))
+        if outputs_parts:
+            parts.append(f"## Previous Agent Outputs\n" + "\n\n".join(outputs_parts))
 
     return "\n\n".join(parts)
 
@@ -15,12 +15,13 @@ Usage:
     run()  # Starts server on configured port
 """
 
+import signal
 from contextlib import asynccontextmanager
 import httpx
 from fastapi import FastAPI
 
 from src.agents.logging_config import setup_logging
-from src.agents.gateway.config import AGENT_PORT, GB10_URL, QDRANT_URL, HTTP_TIMEOUT
+from src.agents.gateway.config import AGENT_PORT, GB10_URL, QDRANT_URL
 from src.agents.gateway.models import Message, ChatRequest, ChatResponse
 from src.agents.gateway.registry import AGENTS
 from src.agents.gateway.responses import create_error_response
@@ -29,12 +30,17 @@ import src.agents.gateway.memory as _memory_module
 from src.agents.gateway.memory import (
     get_memory_client, store_conversation_memory,
     set_http_client as set_memory_http_client,
+    close_memory_batcher,
     _reset_memory_client,
 )
 from src.agents.gateway.routes import router, set_http_client as set_routes_http_client
 
 # Re-export orchestrator for backward compatibility (tests mock this)
-from src.agents.orchestrator import run_orchestrator, OrchestratorResult
+from src.agents.orchestrator import (
+    run_orchestrator, OrchestratorResult, ClassifyBatcher, set_classify_batcher
+)
+from src.agents.agents.runner import get_http_client, close_http_client, warm_http_client
+from src.agents.prompts import clear_prompt_cache
 
 
 # Module-level attribute access for memory_client backward compatibility
@@ -57,15 +63,26 @@ http_client: httpx.AsyncClient = None
 async def lifespan(app: FastAPI):
     """Application lifespan manager - handles startup/shutdown."""
     global http_client
-    http_client = httpx.AsyncClient(timeout=HTTP_TIMEOUT)
+    # Share the agent runner's pooled client so every LLM call reuses its connections
+    http_client = get_http_client()
+    app.state.http = http_client
+    await warm_http_client()
 
     # Wire up HTTP client to modules that need it
     set_routes_http_client(http_client)
     set_memory_http_client(http_client)
 
+    # Concurrent requests share batched intent-classification LLM calls
+    classify_batcher = ClassifyBatcher(http_client)
+    set_classify_batcher(classify_batcher)
+
     yield
 
-    await http_client.aclose()
+    # Stop the batchers before the client their workers send requests on
+    set_classify_batcher(None)
+    await classify_batcher.close()
+    await close_memory_batcher()
+    await close_http_client()
 
 
 # Create FastAPI application
@@ -87,6 +104,10 @@ def run():
     print(f"   GB10: {GB10_URL}")
     print(f"   Qdrant: {QDRANT_URL}")
     print(f"   Agents: {len(AGENTS)}")
+    # SIGHUP reloads prompts edited on disk without restarting the server
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signum, frame: clear_prompt_cache())
+    # uvicorn's default loop="auto" already runs on uvloop when it is installed
     uvicorn.run(app, host="0.0.0.0", port=AGENT_PORT)
 
 
@@ -16,13 +16,12 @@ from src.agents.logging_config import (
 # Import from gateway for backward compatibility with test mocks
 import src.agents.gateway as gateway
 from src.agents.gateway.models import ChatRequest
-from fastapi.responses import StreamingResponse
 
 from src.agents.gateway.endpoints.helpers import (
-    extract_result, log_completion, store_memory, build_response, build_tool_response, handle_error
+    extract_result, log_completion, store_memory, build_response,
+    build_tool_stream_response, build_tool_response, handle_error
 )
-from src.agents.gateway.streaming import generate_tool_stream_response
-from src.agents.agents.llm import call_llm
+from src.agents.agents.llm import call_llm, stream_llm
 
 logger = get_logger("gateway.chat")
 
@@ -101,6 +100,23 @@ async def chat_completions(request: ChatRequest):
                     msg["tool_call_id"] = m.tool_call_id
                 messages.append(msg)
 
+            # Handle streaming for tool-enabled requests: relay upstream chunks as they
+            # arrive; completion and mid-stream errors are logged by the relay itself
+            if request.stream:
+                return build_tool_stream_response(
+                    request,
+                    stream_llm(
+                        http_client=_http_client,
+                        messages=messages,
+                        temperature=request.temperature,
+                        max_tokens=request.max_tokens,
+                        tools=tools_dict,
+                        tool_choice=tool_choice
+                    ),
+                    request_id,
+                    start_time
+                )
+
             llm_message = await call_llm(
                 http_client=_http_client,
                 messages=messages,
@@ -113,21 +129,6 @@ async def chat_completions(request: ChatRequest):
             response_time_ms = (time.time() - start_time) * 1000
             log_completion("tool_call", 1.0, None, response_time_ms, str(llm_message))
 
-            # Handle streaming for tool-enabled requests
-            if request.stream:
-                completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
-                model_name = f"agent-gateway/{request.model}"
-                logger.debug(f"Streaming tool response: {completion_id}")
-                return StreamingResponse(
-                    generate_tool_stream_response(llm_message, model_name, completion_id),
-                    media_type="text/event-stream",
-                    headers={
-                        "Cache-Control": "no-cache",
-                        "Connection": "keep-alive",
-                        "X-Accel-Buffering": "no"
-                    }
-                )
-
             return build_tool_response(request, llm_message, request_id)
 
         # Standard orchestrator flow (no tools)
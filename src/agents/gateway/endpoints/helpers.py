@@ -6,14 +6,19 @@ Single Responsibility: Support functions for chat endpoint.
 
 import time
 import uuid
+from typing import Any, AsyncGenerator, AsyncIterator, Dict
 
 from fastapi.responses import JSONResponse, StreamingResponse
 
-from src.agents.logging_config import get_logger, LogEvent
+from src.agents.logging_config import (
+    get_logger, set_request_context, clear_request_context, LogEvent
+)
 import src.agents.gateway as gateway
 from src.agents.gateway.models import ChatRequest, ChatResponse
 from src.agents.gateway.responses import create_error_response
-from src.agents.gateway.streaming import generate_stream_response
+from src.agents.gateway.streaming import (
+    generate_stream_response, relay_llm_stream, sse_error_events
+)
 
 logger = get_logger("gateway.chat")
 
@@ -112,6 +117,77 @@ def build_response(request: ChatRequest, response_text: str, request_id: str):
     )
 
 
+async def relay_tool_stream(
+    chunks: AsyncIterator[Dict[str, Any]],
+    request: ChatRequest,
+    request_id: str,
+    completion_id: str,
+    start_time: float
+) -> AsyncGenerator[bytes, None]:
+    """
+    Relay a tool-enabled upstream stream, logging how it ended.
+
+    Runs after the endpoint has returned, so it restores the request's log
+    context itself. An upstream failure mid-stream is logged and sent to the
+    client as an SSE error event plus [DONE] instead of cutting the stream off.
+    """
+    set_request_context(
+        request_id=request_id,
+        user_id=request.user or "default",
+        model=request.model
+    )
+    content: list[str] = []
+    tool_names: list[str] = []
+
+    async def observed() -> AsyncIterator[Dict[str, Any]]:
+        async for chunk in chunks:
+            for choice in chunk.get("choices", ()):
+                delta = choice.get("delta") or {}
+                if delta.get("content"):
+                    content.append(delta["content"])
+                for tc in delta.get("tool_calls") or ():
+                    name = (tc.get("function") or {}).get("name")
+                    if name:
+                        tool_names.append(name)
+            yield chunk
+
+    try:
+        async for event in relay_llm_stream(observed(), f"agent-gateway/{request.model}", completion_id):
+            yield event
+
+        response_text = "".join(content)
+        if tool_names:
+            response_text += f" [tool_calls: {', '.join(tool_names)}]"
+        response_time_ms = (time.time() - start_time) * 1000
+        log_completion("tool_call", 1.0, None, response_time_ms, response_text)
+    except Exception as e:
+        log_error(e, start_time)
+        yield sse_error_events(llm_error_body(e))
+    finally:
+        clear_request_context()
+
+
+def build_tool_stream_response(
+    request: ChatRequest,
+    chunks: AsyncIterator[Dict[str, Any]],
+    request_id: str,
+    start_time: float
+):
+    """Build the streaming response for a tool-enabled request, relaying upstream chunks."""
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+    logger.debug(f"Streaming tool response: {completion_id}")
+
+    return StreamingResponse(
+        relay_tool_stream(chunks, request, request_id, completion_id, start_time),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 def build_tool_response(request: ChatRequest, llm_message: dict, request_id: str):
     """Build response for tool-enabled requests (may include tool_calls)."""
     completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
@@ -142,8 +218,8 @@ def build_tool_response(request: ChatRequest, llm_message: dict, request_id: str
     )
 
 
-def handle_error(e: Exception, start_time: float):
-    """Handle request errors."""
+def log_error(e: Exception, start_time: float):
+    """Log a failed request."""
     error_time_ms = (time.time() - start_time) * 1000
     logger.error(
         LogEvent.REQUEST_FAILED,
@@ -155,14 +231,24 @@ def handle_error(e: Exception, start_time: float):
         exc_info=True
     )
 
-    return JSONResponse(
-        status_code=503,
-        content=create_error_response(
-            message=f"LLM service unavailable: {str(e)}",
-            error_type="service_unavailable",
-            code="llm_unavailable"
-        )
+
+def llm_error_body(e: Exception) -> dict:
+    """OpenAI-style error body for an unavailable LLM service."""
+    return create_error_response(
+        message=f"LLM service unavailable: {str(e)}",
+        error_type="service_unavailable",
+        code="llm_unavailable"
     )
 
 
-__all__ = ["extract_result", "log_completion", "store_memory", "build_response", "build_tool_response", "handle_error"]
+def handle_error(e: Exception, start_time: float):
+    """Handle request errors."""
+    log_error(e, start_time)
+    return JSONResponse(status_code=503, content=llm_error_body(e))
+
+
+__all__ = [
+    "extract_result", "log_completion", "store_memory", "build_response",
+    "relay_tool_stream", "build_tool_stream_response", "build_tool_response",
+    "log_error", "llm_error_body", "handle_error",
+]
@@ -12,6 +12,8 @@ logger = get_logger("gateway.memory")
 # Global memory client (initialized lazily)
 _memory_client = None
 _http_client = None
+# Embedding batcher owned by the memory client (closed on shutdown)
+_embedding_batcher = None
 
 
 def set_http_client(client):
@@ -22,7 +24,7 @@ def set_http_client(client):
 
 async def get_memory_client():
     """Get or create the memory client."""
-    global _memory_client
+    global _memory_client, _embedding_batcher
 
     # Sync from gateway module if memory_client was explicitly set (test compatibility)
     # PEP 562: __setattr__ not supported at module level, so tests set directly in __dict__
@@ -36,12 +38,16 @@ async def get_memory_client():
         try:
             from qdrant_client import QdrantClient
             from src.agents.memory.client import MemoryClient
+            from src.agents.memory.batcher import EmbeddingBatcher
 
             qdrant = QdrantClient(url=QDRANT_URL)
+            batcher = EmbeddingBatcher(_http_client)
             _memory_client = MemoryClient(
                 qdrant_client=qdrant,
-                http_client=_http_client
+                http_client=_http_client,
+                embedding_batcher=batcher
             )
+            _embedding_batcher = batcher
             logger.info(f"Memory client initialized with Qdrant at {QDRANT_URL}")
         except Exception as e:
             logger.warning(f"Failed to initialize memory client: {e}")
@@ -49,10 +55,20 @@ async def get_memory_client():
     return _memory_client
 
 
+async def close_memory_batcher():
+    """Stop the memory client's embedding batcher (before the HTTP client is closed)."""
+    global _embedding_batcher
+    if _embedding_batcher is not None:
+        await _embedding_batcher.close()
+        _embedding_batcher = None
+
+
 def _reset_memory_client():
     """Reset the memory client (for testing)."""
-    global _memory_client
+    global _memory_client, _embedding_batcher
     _memory_client = None
+    # The batcher's worker may be bound to a loop that no longer runs
+    _embedding_batcher = None
 
 
 async def store_conversation_memory(
@@ -96,4 +112,7 @@ async def store_conversation_memory(
         )
 
 
-__all__ = ["get_memory_client", "store_conversation_memory", "set_http_client", "_memory_client", "_reset_memory_client"]
+__all__ = [
+    "get_memory_client", "store_conversation_memory", "set_http_client",
+    "close_memory_batcher", "_memory_client", "_reset_memory_client",
+]
@@ -4,7 +4,9 @@ Agent Registry - Available agents and their descriptions.
 Single Responsibility: Agent metadata only.
 """
 
-AGENTS = {
+from types import MappingProxyType
+
+_AGENTS = {
     # Orchestrator (main entry point)
     "orchestrator": "Routes to appropriate flow (SDD/TDD/Retro)",
 
@@ -31,4 +33,7 @@ AGENTS = {
     "todo": "Task management for agents - add, list, update, remove tasks",
 }
 
+# Read-only view, so callers (and tests) cannot mutate the shared registry
+AGENTS = MappingProxyType(_AGENTS)
+
 __all__ = ["AGENTS"]
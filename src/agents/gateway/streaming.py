@@ -6,14 +6,51 @@ Single Responsibility: OpenAI-compatible streaming response generation.
 
 import json
 import time
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Dict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Raw SSE framing, so relayed chunks are written as bytes without a str round-trip
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode a chunk to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _chunk_skeleton(model: str, completion_id: str) -> Dict[str, Any]:
+    """Chunk dict with the fields that stay constant for a whole stream."""
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "delta": {},
+            "finish_reason": None
+        }]
+    }
+
+
+def _sse_event(chunk: Dict[str, Any]) -> bytes:
+    """Frame one chunk as an SSE data event."""
+    return _SSE_PREFIX + _json_bytes(chunk) + _SSE_SUFFIX
 
 
 async def generate_stream_response(
     response_text: str,
     model: str,
     completion_id: str
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Generate SSE stream chunks for OpenAI-compatible streaming.
 
@@ -23,145 +60,75 @@ async def generate_stream_response(
     3. Final chunk: delta is {}, finish_reason is "stop"
     4. Stream ends with "data: [DONE]"
 
+    One chunk dict is built per stream; only its delta and finish_reason
+    change between events.
+
     Args:
         response_text: Full response to stream
         model: Model name for chunk metadata
         completion_id: Unique completion ID
 
     Yields:
-        SSE-formatted chunks
+        SSE-formatted chunks as bytes
     """
+    chunk = _chunk_skeleton(model, completion_id)
+    choice = chunk["choices"][0]
+
     # First chunk: role announcement (required by OpenAI spec)
-    first_chunk = {
-        "id": completion_id,
-        "object": "chat.completion.chunk",
-        "created": int(time.time()),
-        "model": model,
-        "choices": [{
-            "index": 0,
-            "delta": {"role": "assistant", "content": ""},
-            "finish_reason": None
-        }]
-    }
-    yield f"data: {json.dumps(first_chunk)}\n\n"
+    choice["delta"] = {"role": "assistant", "content": ""}
+    yield _sse_event(chunk)
 
     # Content chunks: stream word by word
     words = response_text.split(' ')
     for i, word in enumerate(words):
-        content = word if i == 0 else ' ' + word
-        chunk = {
-            "id": completion_id,
-            "object": "chat.completion.chunk",
-            "created": int(time.time()),
-            "model": model,
-            "choices": [{
-                "index": 0,
-                "delta": {"content": content},
-                "finish_reason": None
-            }]
-        }
-        yield f"data: {json.dumps(chunk)}\n\n"
+        choice["delta"] = {"content": word if i == 0 else ' ' + word}
+        yield _sse_event(chunk)
 
     # Final chunk: finish_reason
-    final_chunk = {
-        "id": completion_id,
-        "object": "chat.completion.chunk",
-        "created": int(time.time()),
-        "model": model,
-        "choices": [{
-            "index": 0,
-            "delta": {},
-            "finish_reason": "stop"
-        }]
-    }
-    yield f"data: {json.dumps(final_chunk)}\n\n"
-    yield "data: [DONE]\n\n"
+    choice["delta"] = {}
+    choice["finish_reason"] = "stop"
+    yield _sse_event(chunk)
+    yield _SSE_DONE
 
 
-async def generate_tool_stream_response(
-    llm_message: dict,
+async def relay_llm_stream(
+    chunks: AsyncIterator[Dict[str, Any]],
     model: str,
     completion_id: str
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
-    Generate SSE stream for tool-enabled responses.
+    Forward upstream LLM stream chunks as SSE without buffering the reply.
 
-    Handles both content-only and tool_calls responses.
+    Each chunk is re-labelled with the gateway's completion id and model
+    name and sent on as soon as it arrives, so time-to-first-token follows
+    the upstream LLM rather than the full generation time.
 
     Args:
-        llm_message: LLM response dict with 'content' and/or 'tool_calls'
+        chunks: OpenAI-format chunk dicts, e.g. from agents.llm.stream_llm
         model: Model name for chunk metadata
         completion_id: Unique completion ID
 
     Yields:
-        SSE-formatted chunks
+        SSE-formatted chunks as bytes, ending with "data: [DONE]"
     """
-    content = llm_message.get("content", "")
-    tool_calls = llm_message.get("tool_calls")
+    async for chunk in chunks:
+        chunk["id"] = completion_id
+        chunk["model"] = model
+        yield _sse_event(chunk)
+    yield _SSE_DONE
 
-    # First chunk: role announcement
-    first_chunk = {
-        "id": completion_id,
-        "object": "chat.completion.chunk",
-        "created": int(time.time()),
-        "model": model,
-        "choices": [{
-            "index": 0,
-            "delta": {"role": "assistant"},
-            "finish_reason": None
-        }]
-    }
-    yield f"data: {json.dumps(first_chunk)}\n\n"
-
-    # Stream content if present
-    if content:
-        words = content.split(' ')
-        for i, word in enumerate(words):
-            word_content = word if i == 0 else ' ' + word
-            chunk = {
-                "id": completion_id,
-                "object": "chat.completion.chunk",
-                "created": int(time.time()),
-                "model": model,
-                "choices": [{
-                    "index": 0,
-                    "delta": {"content": word_content},
-                    "finish_reason": None
-                }]
-            }
-            yield f"data: {json.dumps(chunk)}\n\n"
-
-    # Stream tool_calls if present
-    if tool_calls:
-        for tc in tool_calls:
-            chunk = {
-                "id": completion_id,
-                "object": "chat.completion.chunk",
-                "created": int(time.time()),
-                "model": model,
-                "choices": [{
-                    "index": 0,
-                    "delta": {"tool_calls": [tc]},
-                    "finish_reason": None
-                }]
-            }
-            yield f"data: {json.dumps(chunk)}\n\n"
-
-    # Final chunk
-    finish_reason = "tool_calls" if tool_calls else "stop"
-    final_chunk = {
-        "id": completion_id,
-        "object": "chat.completion.chunk",
-        "created": int(time.time()),
-        "model": model,
-        "choices": [{
-            "index": 0,
-            "delta": {},
-            "finish_reason": finish_reason
-        }]
-    }
-    yield f"data: {json.dumps(final_chunk)}\n\n"
-    yield "data: [DONE]\n\n"
+
+def sse_error_events(error: Dict[str, Any]) -> bytes:
+    """
+    Frame an error body as the final events of a stream that failed mid-way.
+
+    Args:
+        error: OpenAI-style error dict (see responses.create_error_response)
+
+    Returns:
+        The error as an SSE data event followed by "data: [DONE]"
+    """
+    return _sse_event(error) + _SSE_DONE
 
 
-__all__ = ["generate_stream_response", "generate_tool_stream_response"]
+__all__ = ["generate_stream_response", "relay_llm_stream", "sse_error_events"]
@@ -36,6 +36,7 @@ from .scanner import (
 # Hasher exports
 from .hasher import (
     compute_file_hash,
+    compute_file_hashes,
     compute_content_hash,
     compare_hashes,
 )
@@ -43,6 +44,7 @@ from .hasher import (
 # Parser exports
 from .parser import (
     parse_file,
+    parse_source,
     get_parser,
     extract_functions,
     extract_classes,
@@ -71,6 +73,7 @@ from .yaml_writer import (
 # Tool exports
 from .tools import (
     INDEXER_TOOLS,
+    INDEXER_TOOL_NAMES,
     dispatch_tool,
     handle_index_project,
     handle_update_project,
@@ -106,10 +109,12 @@ __all__ = [
     "detect_language",
     # Hasher
     "compute_file_hash",
+    "compute_file_hashes",
     "compute_content_hash",
     "compare_hashes",
     # Parser
     "parse_file",
+    "parse_source",
     "get_parser",
     "extract_functions",
     "extract_classes",
@@ -129,6 +134,7 @@ __all__ = [
     "sanitize_path_for_filename",
     # Tools
     "INDEXER_TOOLS",
+    "INDEXER_TOOL_NAMES",
     "dispatch_tool",
     "handle_index_project",
     "handle_update_project",
@@ -5,8 +5,9 @@ Provides path validation, language mappings, and output directory configuration.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 
 
 # T028: Mapping of file extensions to language identifiers
@@ -20,16 +21,21 @@ SUPPORTED_EXTENSIONS: dict[str, str] = {
 }
 
 
-def _get_allowed_roots() -> List[Path]:
+def _get_allowed_roots() -> Tuple[Path, ...]:
     """
     T029: Get allowed index roots from environment variable.
 
     Returns:
-        List of resolved Path objects for allowed roots
+        Tuple of resolved Path objects for allowed roots
     """
-    roots_str = os.environ.get("ALLOWED_INDEX_ROOTS", "/opt/projects")
+    return _parse_allowed_roots(os.environ.get("ALLOWED_INDEX_ROOTS", "/opt/projects"))
+
+
+@lru_cache(maxsize=8)
+def _parse_allowed_roots(roots_str: str) -> Tuple[Path, ...]:
+    """Split and resolve ALLOWED_INDEX_ROOTS, once per distinct value."""
     roots = [r.strip() for r in roots_str.split(",") if r.strip()]
-    return [Path(r).resolve() for r in roots]
+    return tuple(Path(r).resolve() for r in roots)
 
 
 def validate_path(path: str) -> Tuple[bool, Optional[str]]:
@@ -44,7 +50,8 @@ def validate_path(path: str) -> Tuple[bool, Optional[str]]:
         path: Absolute path to validate
 
     Returns:
-        Tuple of (is_valid, error_message). error_message is None if valid.
+        Always a (is_valid, error_message) 2-tuple, never None.
+        error_message is None if valid and a str describing the rejection otherwise.
     """
     # Check for path traversal in the original path string
     if ".." in path:
@@ -96,14 +103,7 @@ def get_output_dir(project_name: str) -> Path:
     return Path(base_dir) / project_name
 
 
-def get_language_for_extension(extension: str) -> Optional[str]:
-    """
-    T032: Get the language identifier for a file extension.
-
-    Args:
-        extension: File extension including dot (e.g., ".py")
-
-    Returns:
-        Language identifier or None if unsupported
-    """
-    return SUPPORTED_EXTENSIONS.get(extension)
+# T032: Get the language identifier for a file extension (including the dot,
+# e.g. ".py"), or None if unsupported. Bound dict.get: no extra Python frame
+# per scanned file.
+get_language_for_extension = SUPPORTED_EXTENSIONS.get
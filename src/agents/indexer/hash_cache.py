@@ -0,0 +1,111 @@
+"""
+Persistent file-hash manifest for the Project Architecture Indexer.
+
+Remembers each file's (mtime_ns, size, hash) between runs so unchanged
+files are detected with a stat() instead of being re-read and re-hashed.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .hasher import compute_file_hashes
+
+
+# Manifest location, relative to a project's output directory
+MANIFEST_DIR = ".indexer_cache"
+MANIFEST_FILE = "hashes.json"
+
+# relative path -> (mtime_ns, size, hash)
+Manifest = Dict[str, Tuple[int, int, str]]
+
+
+def get_manifest_path(output_dir: Path) -> Path:
+    """
+    Get the manifest file path for a project's output directory.
+
+    Args:
+        output_dir: Directory the project's YAML files are written to
+
+    Returns:
+        Path to the hashes.json manifest
+    """
+    return output_dir / MANIFEST_DIR / MANIFEST_FILE
+
+
+def load_manifest(output_dir: Path) -> Manifest:
+    """
+    Load the hash manifest written by the previous run.
+
+    Args:
+        output_dir: Directory the project's YAML files are written to
+
+    Returns:
+        Manifest dict, or an empty dict if missing or unreadable
+    """
+    try:
+        with open(get_manifest_path(output_dir), "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        return {path: (int(m), int(s), str(h)) for path, (m, s, h) in raw.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def save_manifest(output_dir: Path, manifest: Manifest) -> None:
+    """
+    Write the hash manifest atomically (temp file + rename).
+
+    Args:
+        output_dir: Directory the project's YAML files are written to
+        manifest: Manifest to persist
+    """
+    path = get_manifest_path(output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def hash_files_cached(
+    files: Dict[str, Path],
+    manifest: Manifest,
+) -> Tuple[Dict[str, Optional[str]], Manifest]:
+    """
+    Hash files, reusing manifest entries whose mtime and size still match.
+
+    Args:
+        files: Dict mapping relative paths to file paths
+        manifest: Manifest from the previous run
+
+    Returns:
+        Tuple of (relative path -> hash or None, manifest for the current files)
+    """
+    hashes: Dict[str, Optional[str]] = {}
+    new_manifest: Manifest = {}
+    stale: Dict[str, Tuple[Path, int, int]] = {}
+
+    for relative_path, file_path in files.items():
+        try:
+            st = file_path.stat()
+        except OSError:
+            hashes[relative_path] = None
+            continue
+
+        cached = manifest.get(relative_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            hashes[relative_path] = cached[2]
+            new_manifest[relative_path] = cached
+        else:
+            stale[relative_path] = (file_path, st.st_mtime_ns, st.st_size)
+
+    computed = compute_file_hashes(file_path for file_path, _, _ in stale.values())
+    for relative_path, (file_path, mtime_ns, size) in stale.items():
+        digest = computed[str(file_path)]
+        hashes[relative_path] = digest
+        if digest is not None:
+            new_manifest[relative_path] = (mtime_ns, size, digest)
+
+    return hashes, new_manifest
+
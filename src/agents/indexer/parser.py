@@ -5,6 +5,7 @@ Uses tree-sitter for multi-language code parsing.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Optional
 
@@ -28,6 +29,8 @@ def get_parser(language: str) -> Optional[Any]:
     """
     T065: Get a tree-sitter parser for a language.
 
+    Parsers are cached per language, so repeated calls return the same instance.
+
     Args:
         language: Language identifier (e.g., "python", "javascript")
 
@@ -39,11 +42,22 @@ def get_parser(language: str) -> Optional[Any]:
         return None
 
     try:
-        return tree_sitter_languages.get_parser(ts_lang)
+        return _load_parser(ts_lang)
     except Exception:
         return None
 
 
+@lru_cache(maxsize=None)
+def _load_parser(ts_lang: str) -> Any:
+    """
+    Build the tree-sitter parser for a grammar once per process.
+
+    Parsers are reused across files; parse() is called without an old tree,
+    so no state carries over between calls. Failures raise and are not cached.
+    """
+    return tree_sitter_languages.get_parser(ts_lang)
+
+
 def _get_node_text(node: Any, source_code: bytes) -> str:
     """Extract text from a tree-sitter node."""
     return source_code[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
@@ -357,6 +371,8 @@ async def parse_file(file_path: Path, language: str) -> Optional[FileNode]:
     """
     T070: Parse a source file and extract symbols.
 
+    Reads the file and delegates to parse_source().
+
     Args:
         file_path: Path to the source file
         language: Language identifier
@@ -364,15 +380,40 @@ async def parse_file(file_path: Path, language: str) -> Optional[FileNode]:
     Returns:
         FileNode with extracted functions and classes, or None on error
     """
-    parser = get_parser(language)
-    if parser is None:
+    if get_parser(language) is None:
         return None
 
     try:
         source_code = file_path.read_bytes()
+        last_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
     except (OSError, IOError):
         return None
 
+    return await parse_source(source_code, language, file_path, last_modified)
+
+
+async def parse_source(
+    source_code: bytes,
+    language: str,
+    file_path: Optional[Path] = None,
+    last_modified: Optional[datetime] = None,
+) -> Optional[FileNode]:
+    """
+    Parse in-memory source code and extract symbols.
+
+    Args:
+        source_code: Raw file content
+        language: Language identifier
+        file_path: Path recorded as the FileNode's relative_path (optional)
+        last_modified: Modification time to record (defaults to now)
+
+    Returns:
+        FileNode with extracted functions and classes, or None on error
+    """
+    parser = get_parser(language)
+    if parser is None:
+        return None
+
     # T113: Handle encoding errors gracefully
     # Check if content is likely binary (non-text) by looking for null bytes
     if b"\x00" in source_code[:8192]:  # Check first 8KB for null bytes
@@ -392,15 +433,19 @@ async def parse_file(file_path: Path, language: str) -> Optional[FileNode]:
     except Exception:
         return None
 
+    relative_path = str(file_path) if file_path is not None else ""
+    if last_modified is None:
+        last_modified = datetime.now()
+
     try:
         tree = parser.parse(source_code)
     except Exception:
         return FileNode(
-            relative_path=str(file_path),
+            relative_path=relative_path,
             language=language,
             content_hash=compute_content_hash(source_code),
             size_bytes=len(source_code),
-            last_modified=datetime.fromtimestamp(file_path.stat().st_mtime),
+            last_modified=last_modified,
             parse_status=ParseStatus.ERROR,
             error_message="Failed to parse AST",
         )
@@ -409,11 +454,11 @@ async def parse_file(file_path: Path, language: str) -> Optional[FileNode]:
     classes = extract_classes(tree, source_code, language)
 
     return FileNode(
-        relative_path=str(file_path),
+        relative_path=relative_path,
         language=language,
         content_hash=compute_content_hash(source_code),
         size_bytes=len(source_code),
-        last_modified=datetime.fromtimestamp(file_path.stat().st_mtime),
+        last_modified=last_modified,
         parse_status=ParseStatus.SUCCESS,
         functions=functions,
         classes=classes,
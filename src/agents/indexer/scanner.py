@@ -5,12 +5,37 @@ Scans directories to find source files, respecting exclude patterns.
 """
 
 import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import AsyncIterator, List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Pattern, Tuple
 
 from src.agents.indexer.config import SUPPORTED_EXTENSIONS
 
 
+def _union(patterns) -> Optional[Pattern[str]]:
+    """Compile glob patterns into one regex alternation, or None if empty."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(
+    patterns: Tuple[str, ...],
+) -> Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]:
+    """
+    Compile exclude patterns once per distinct pattern list.
+
+    Returns:
+        Tuple of (regex matched against the whole path, regex matched
+        against each directory prefix and name for "dir/**" patterns)
+    """
+    subtree_bases = [p[:-3] for p in patterns if p.endswith("/**")]
+    return _union(patterns), _union(subtree_bases)
+
+
 async def scan_directory(
     root_path: Path,
     exclude_patterns: Optional[List[str]] = None,
@@ -19,6 +44,10 @@ async def scan_directory(
     """
     T062: Scan a directory for source files.
 
+    Walks the tree with os.scandir so directory checks reuse the d_type from
+    the listing, and prunes directories excluded by "dir/**" patterns instead
+    of visiting every file beneath them.
+
     Args:
         root_path: Root directory to scan
         exclude_patterns: Glob patterns to exclude
@@ -27,68 +56,87 @@ async def scan_directory(
     Yields:
         Tuples of (file_path, language)
     """
-    if exclude_patterns is None:
-        exclude_patterns = []
-
     root = Path(root_path)
     if not root.exists() or not root.is_dir():
         return
 
-    # T112: Track visited real file paths to detect circular symlinks
+    path_re, subtree_re = _compile_patterns(tuple(exclude_patterns or ()))
+
+    # T112: Track visited real file paths to detect circular symlinks.
+    # Symlinked directories are not descended into, so only symlinked
+    # files need resolving; other files derive their real path from
+    # the (already resolved) directory they were listed in.
     visited_files: set = set()
 
-    # Walk directory tree
-    for file_path in root.rglob("*"):
-        # Skip directories
-        if file_path.is_dir():
+    # Stack of (directory path, path relative to root, resolved directory path)
+    stack: List[Tuple[str, str, str]] = [(str(root), "", str(root.resolve()))]
+    while stack:
+        dir_path, rel_dir, real_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
             continue
 
-        # T112: Handle symlinks - check for circular references
-        try:
-            # Check if path exists (handles broken symlinks)
-            if not file_path.exists():
+        for entry in entries:
+            name = entry.name
+            relative_path = f"{rel_dir}/{name}" if rel_dir else name
+
+            try:
+                if entry.is_dir():
+                    # Skip symlinked directories (cycle-safe, matches rglob)
+                    if entry.is_symlink():
+                        continue
+                    if subtree_re is not None and (
+                        subtree_re.match(relative_path) or subtree_re.match(name)
+                    ):
+                        continue
+                    stack.append(
+                        (entry.path, relative_path, os.path.join(real_dir, name))
+                    )
+                    continue
+            except OSError:
                 continue
 
-            # Resolve to real path for cycle detection
-            real_path = file_path.resolve()
-
-            # Check if this real file was already visited (circular symlink)
-            if real_path in visited_files:
+            # Check exclusion patterns
+            if path_re is not None and path_re.match(relative_path):
+                continue
+            if subtree_re is not None and (
+                subtree_re.match(relative_path) or subtree_re.match(name)
+            ):
                 continue
-            visited_files.add(real_path)
-
-        except (OSError, ValueError):
-            # Skip files we can't resolve
-            continue
 
-        # T115: Skip files larger than max_file_size
-        try:
-            if file_path.stat().st_size > max_file_size:
+            # Detect language
+            language = SUPPORTED_EXTENSIONS.get(os.path.splitext(name)[1].lower())
+            if language is None:
                 continue
-        except (OSError, ValueError):
-            continue
 
-        # Get relative path for pattern matching
-        try:
-            relative_path = file_path.relative_to(root)
-        except ValueError:
-            continue
+            # T112/T115: stat() follows symlinks, so broken links raise here;
+            # skip files larger than max_file_size
+            try:
+                if entry.stat().st_size > max_file_size:
+                    continue
+                if entry.is_symlink():
+                    real_path = os.path.realpath(entry.path)
+                else:
+                    real_path = os.path.join(real_dir, name)
+            except (OSError, ValueError):
+                continue
 
-        # Check exclusion patterns
-        if should_exclude(relative_path, exclude_patterns):
-            continue
+            # Check if this real file was already visited (circular symlink)
+            if real_path in visited_files:
+                continue
+            visited_files.add(real_path)
 
-        # Detect language
-        language = detect_language(file_path)
-        if language is not None:
-            yield file_path, language
+            yield Path(entry.path), language
 
 
 def should_exclude(path: Path, patterns: List[str]) -> bool:
     """
     T060: Check if a path should be excluded based on patterns.
 
-    Uses fnmatch for glob-style pattern matching.
+    Uses fnmatch-style glob matching, with all patterns compiled into a
+    single cached regex union.
 
     Args:
         path: Path to check (relative to root)
@@ -100,26 +148,19 @@ def should_exclude(path: Path, patterns: List[str]) -> bool:
     if not patterns:
         return False
 
-    path_str = str(path)
+    path_re, subtree_re = _compile_patterns(tuple(patterns))
 
-    for pattern in patterns:
-        # Handle patterns like "node_modules/**" and "**/__pycache__/**"
-        if fnmatch.fnmatch(path_str, pattern):
-            return True
+    # Handle patterns like "node_modules/**" and "**/__pycache__/**"
+    if path_re.match(str(path)):
+        return True
 
-        # Also check each component of the path
-        # This handles patterns like ".git/**" matching ".git/objects/abc"
+    # Also check each component of the path, so patterns that exclude a
+    # directory subtree (".git/**") match ".git/objects/abc"
+    if subtree_re is not None:
         parts = path.parts
-        for i in range(len(parts)):
-            partial_path = "/".join(parts[: i + 1])
-            # Match patterns that should exclude this directory subtree
-            if pattern.endswith("/**"):
-                base_pattern = pattern[:-3]  # Remove "/**"
-                if fnmatch.fnmatch(partial_path, base_pattern):
-                    return True
-                # Also try matching just the directory name
-                if fnmatch.fnmatch(parts[i], base_pattern):
-                    return True
+        for i, part in enumerate(parts):
+            if subtree_re.match("/".join(parts[: i + 1])) or subtree_re.match(part):
+                return True
 
     return False
 
@@ -103,6 +103,9 @@ INDEXER_TOOLS: List[dict] = [
     },
 ]
 
+# Names of the tools above, for O(1) membership checks
+INDEXER_TOOL_NAMES: frozenset = frozenset(t["function"]["name"] for t in INDEXER_TOOLS)
+
 
 async def handle_index_project(
     path: str,
@@ -238,9 +241,11 @@ async def handle_update_project(
     Returns:
         Dict with update statistics
     """
+    import asyncio
     from pathlib import Path as PathLib
 
-    from .hasher import compare_hashes, compute_file_hash
+    from .hash_cache import hash_files_cached, load_manifest, save_manifest
+    from .hasher import compare_hashes
     from .models import ProjectStatus
     from .parser import parse_file
     from .scanner import scan_directory
@@ -272,7 +277,7 @@ async def handle_update_project(
     report_progress(f"Found {len(stored_hashes)} previously indexed files")
 
     # Scan current files and compute new hashes
-    current_hashes: Dict[str, str] = {}
+    output_dir = project_path / ".agents" / "architecture"
     default_excludes = [
         ".git/**",
         "node_modules/**",
@@ -285,14 +290,17 @@ async def handle_update_project(
     ]
 
     report_progress("Scanning for changes...")
+    scanned: Dict[str, PathLib] = {}
     async for file_path, language in scan_directory(project_path, default_excludes):
         try:
-            relative_path = str(file_path.relative_to(project_path))
-            content_hash = compute_file_hash(file_path)
-            current_hashes[relative_path] = content_hash
-        except (ValueError, OSError):
+            scanned[str(file_path.relative_to(project_path))] = file_path
+        except ValueError:
             continue
 
+    # Hash off the event loop, reusing last run's hashes for unchanged files
+    manifest = await asyncio.to_thread(load_manifest, output_dir)
+    current_hashes, manifest = await asyncio.to_thread(hash_files_cached, scanned, manifest)
+
     # Compare hashes to detect changes
     if force_full:
         # Force full re-index: treat all files as added
@@ -361,10 +369,10 @@ async def handle_update_project(
     await store_project(project)
 
     # Write updated YAML output
-    output_dir = project_path / ".agents" / "architecture"
     report_progress(f"Writing YAML output to {output_dir}")
 
     await write_project_yaml(project, output_dir)
+    await asyncio.to_thread(save_manifest, output_dir, manifest)
 
     report_progress("Update complete!")
 
@@ -35,6 +35,7 @@ class LogEvent:
     LLM_CALLING = "llm_calling"
     LLM_RESPONSE = "llm_response"
     LLM_ERROR = "llm_error"
+    LLM_CACHE_HIT = "llm_cache_hit"
 
     # Memory operations
     MEMORY_RETRIEVING = "memory_retrieving"
@@ -4,6 +4,7 @@ Memory Module - Qdrant-based conversation memory with semantic search.
 This package provides modular memory operations:
 - config.py: Configuration constants
 - embeddings.py: Vector embedding generation
+- batcher.py: EmbeddingBatcher for coalescing concurrent embeddings
 - storage.py: Store/retrieve operations
 - client.py: MemoryClient class
 
@@ -15,6 +16,7 @@ Usage:
 """
 
 from src.agents.memory.client import MemoryClient
+from src.agents.memory.batcher import EmbeddingBatcher
 from src.agents.memory.config import (
     DEFAULT_COLLECTION_NAME,
     DEFAULT_EMBEDDING_URL,
@@ -23,6 +25,7 @@ from src.agents.memory.config import (
 
 __all__ = [
     "MemoryClient",
+    "EmbeddingBatcher",
     "DEFAULT_COLLECTION_NAME",
     "DEFAULT_EMBEDDING_URL",
     "DEFAULT_MEMORY_LIMIT",
@@ -0,0 +1,125 @@
+"""
+Memory Batcher - Coalesce concurrent embedding requests.
+
+Single Responsibility: Group texts that need embedding at the same time
+into one embedding service call.
+"""
+
+import asyncio
+import contextlib
+
+from src.agents.logging_config import get_logger
+
+from src.agents.memory.config import (
+    DEFAULT_EMBEDDING_URL,
+    EMBEDDING_BATCH_MAX_SIZE,
+    EMBEDDING_BATCH_MAX_WAIT_MS,
+)
+from src.agents.memory.embeddings import generate_embeddings
+
+logger = get_logger("memory.batcher")
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batcher for embedding generation.
+
+    Texts that queue up while a text is pending are given max_wait_ms to
+    join it (up to max_batch_size of them) and are embedded together with
+    generate_embeddings; a text arriving alone is sent straight away. Each
+    batch runs in its own task, so a slow or retrying call does not hold up
+    the batches after it.
+    The background worker starts on the first embed call and runs on the
+    caller's event loop until close() is awaited; if a later call comes from
+    a different loop, a fresh worker and queue are started on that loop.
+
+    Usage:
+        batcher = EmbeddingBatcher(http_client)
+        vector = await batcher.embed("How did we handle auth?")
+        await batcher.close()
+    """
+
+    def __init__(
+        self,
+        http_client,
+        embedding_url: str = DEFAULT_EMBEDDING_URL,
+        max_batch_size: int = EMBEDDING_BATCH_MAX_SIZE,
+        max_wait_ms: float = EMBEDDING_BATCH_MAX_WAIT_MS,
+    ):
+        self.http_client = http_client
+        self.embedding_url = embedding_url
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        """Queue a text and wait for its embedding vector."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and self._worker.get_loop() is not loop:
+            # Queues and tasks are bound to their loop; start over on this one
+            self._queue = asyncio.Queue()
+            self._worker = None
+            self._batches = set()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the worker, let batches in flight finish and cancel queued texts."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and embed them until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+
+            # Only hold the batch open when other callers are already queued
+            if 0 < self._queue.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # Each batch runs in its own task so a slow call never blocks the next
+            task = asyncio.create_task(self._dispatch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch and resolve its futures."""
+        logger.debug(f"Embedding batch of {len(batch)} text(s)")
+        try:
+            vectors = await generate_embeddings(
+                [text for text, _ in batch], self.http_client, self.embedding_url
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+
+__all__ = ["EmbeddingBatcher"]
@@ -42,12 +42,15 @@ class MemoryClient:
         collection_name: Name of the Qdrant collection
         http_client: HTTP client for embedding service calls
         embedding_url: URL of the embedding service
+        embedding_batcher: Optional EmbeddingBatcher that coalesces query
+                           embeddings from concurrent retrievals
     """
 
     qdrant_client: object
     collection_name: str = field(default=DEFAULT_COLLECTION_NAME)
     http_client: Optional[object] = field(default=None)
     embedding_url: str = field(default=DEFAULT_EMBEDDING_URL)
+    embedding_batcher: Optional[object] = field(default=None)
 
     async def _generate_embedding(self, text: str) -> list[float]:
         """
@@ -112,7 +115,8 @@ class MemoryClient:
             collection_name=self.collection_name,
             http_client=self.http_client,
             embedding_url=self.embedding_url,
-            limit=limit
+            limit=limit,
+            embedding_batcher=self.embedding_batcher
         )
 
 
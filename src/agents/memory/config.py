@@ -20,6 +20,10 @@ EMBEDDING_TIMEOUT = 30.0
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 0.5
 
+# Query embedding batching (concurrent retrievals share one request)
+EMBEDDING_BATCH_MAX_SIZE = 32
+EMBEDDING_BATCH_MAX_WAIT_MS = 5
+
 __all__ = [
     "DEFAULT_COLLECTION_NAME",
     "DEFAULT_EMBEDDING_URL",
@@ -27,4 +31,6 @@ __all__ = [
     "EMBEDDING_TIMEOUT",
     "MAX_RETRIES",
     "RETRY_DELAY_SECONDS",
+    "EMBEDDING_BATCH_MAX_SIZE",
+    "EMBEDDING_BATCH_MAX_WAIT_MS",
 ]
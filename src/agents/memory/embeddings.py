@@ -17,36 +17,22 @@ from src.agents.memory.config import (
 logger = get_logger("memory.embeddings")
 
 
-async def generate_embedding(
-    text: str,
+async def _request_embeddings(
+    payload: dict,
     http_client,
-    embedding_url: str
-) -> list[float]:
+    embedding_url: str,
+    text_preview: str
+) -> list[dict]:
     """
-    Generate embedding vector for text using BGE-M3.
-
-    Includes retry logic for transient failures.
-
-    Args:
-        text: Text to embed
-        http_client: Async HTTP client for service calls
-        embedding_url: URL of the embedding service
-
-    Returns:
-        1024-dimensional embedding vector
+    POST an embedding request with retries and return the response's data items.
 
     Raises:
-        RuntimeError: If http_client is not configured or embedding fails
+        RuntimeError: If http_client is not configured or the request fails
                       after all retries
     """
     if http_client is None:
         raise RuntimeError("http_client required for embedding generation")
 
-    payload = {
-        "input": text,
-        "model": "bge-m3"
-    }
-
     last_error = None
     start_time = time.time()
 
@@ -57,7 +43,7 @@ async def generate_embedding(
                 extra={
                     "attempt": attempt + 1,
                     "max_retries": MAX_RETRIES,
-                    "text_preview": text[:50] + "...",
+                    "text_preview": text_preview[:50] + "...",
                     "url": embedding_url
                 }
             )
@@ -69,19 +55,19 @@ async def generate_embedding(
             )
             response.raise_for_status()
 
-            data = response.json()
-            embedding = data["data"][0]["embedding"]
+            items = response.json()["data"]
             duration_ms = (time.time() - start_time) * 1000
 
             logger.debug(
                 "embedding_generated",
                 extra={
-                    "dimensions": len(embedding),
+                    "count": len(items),
+                    "dimensions": len(items[0]["embedding"]) if items else 0,
                     "duration_ms": round(duration_ms, 2),
                     "attempts_used": attempt + 1
                 }
             )
-            return embedding
+            return items
 
         except Exception as e:
             last_error = e
@@ -113,4 +99,68 @@ async def generate_embedding(
     )
 
 
-__all__ = ["generate_embedding"]
+async def generate_embedding(
+    text: str,
+    http_client,
+    embedding_url: str
+) -> list[float]:
+    """
+    Generate embedding vector for text using BGE-M3.
+
+    Includes retry logic for transient failures.
+
+    Args:
+        text: Text to embed
+        http_client: Async HTTP client for service calls
+        embedding_url: URL of the embedding service
+
+    Returns:
+        1024-dimensional embedding vector
+
+    Raises:
+        RuntimeError: If http_client is not configured or embedding fails
+                      after all retries
+    """
+    payload = {
+        "input": text,
+        "model": "bge-m3"
+    }
+    items = await _request_embeddings(payload, http_client, embedding_url, text)
+    return items[0]["embedding"]
+
+
+async def generate_embeddings(
+    texts: list[str],
+    http_client,
+    embedding_url: str
+) -> list[list[float]]:
+    """
+    Generate embedding vectors for several texts with one BGE-M3 request.
+
+    Args:
+        texts: Texts to embed
+        http_client: Async HTTP client for service calls
+        embedding_url: URL of the embedding service
+
+    Returns:
+        One 1024-dimensional embedding vector per text, in input order
+
+    Raises:
+        RuntimeError: If http_client is not configured, embedding fails
+                      after all retries, or the reply has the wrong length
+    """
+    payload = {
+        "input": texts,
+        "model": "bge-m3"
+    }
+    items = await _request_embeddings(payload, http_client, embedding_url, texts[0])
+    if len(items) != len(texts):
+        raise RuntimeError(
+            f"Expected {len(texts)} embeddings, got {len(items)}"
+        )
+    # The OpenAI format tags each item with its input index; order by it
+    items = sorted(items, key=lambda item: item.get("index", 0))
+    return [item["embedding"] for item in items]
+
+
+__all__ = ["generate_embedding", "generate_embeddings"]
@@ -22,7 +22,8 @@ async def retrieve_memories(
     collection_name: str,
     http_client,
     embedding_url: str,
-    limit: int = DEFAULT_MEMORY_LIMIT
+    limit: int = DEFAULT_MEMORY_LIMIT,
+    embedding_batcher=None
 ) -> list[str]:
     """
     Retrieve relevant memories for a query.
@@ -38,6 +39,8 @@ async def retrieve_memories(
         http_client: HTTP client for embedding service
         embedding_url: URL of the embedding service
         limit: Maximum number of results (default: 3)
+        embedding_batcher: Optional EmbeddingBatcher; when given, the query is
+                           embedded together with other concurrent queries
 
     Returns:
         List of memory content strings, ordered by relevance.
@@ -72,7 +75,10 @@ async def retrieve_memories(
     )
 
     try:
-        embedding = await generate_embedding(query, http_client, embedding_url)
+        if embedding_batcher is not None:
+            embedding = await embedding_batcher.embed(query)
+        else:
+            embedding = await generate_embedding(query, http_client, embedding_url)
     except RuntimeError as e:
         logger.error(
             LogEvent.MEMORY_ERROR,
@@ -22,13 +22,23 @@ from src.agents.orchestrator import (
     CLASSIFICATION_TEMPERATURE,
     CLASSIFICATION_MAX_TOKENS,
     CLASSIFICATION_MODEL,
+    CLASSIFICATION_CACHE_SIZE,
+    CLASSIFY_BATCH_MAX_SIZE,
+    CLASSIFY_BATCH_MAX_WAIT_MS,
     CLARIFYING_QUESTION,
     INTENT_DISPLAY_NAMES,
     CLASSIFICATION_PROMPT,
+    BATCH_CLASSIFICATION_PROMPT,
+
+    # Classes
+    ClassifyBatcher,
 
     # Functions
     classify_intent,
+    classify_intents,
+    clear_classification_cache,
     run_orchestrator,
+    set_classify_batcher,
 )
 
 __all__ = [
@@ -39,9 +49,17 @@ __all__ = [
     "CLASSIFICATION_TEMPERATURE",
     "CLASSIFICATION_MAX_TOKENS",
     "CLASSIFICATION_MODEL",
+    "CLASSIFICATION_CACHE_SIZE",
+    "CLASSIFY_BATCH_MAX_SIZE",
+    "CLASSIFY_BATCH_MAX_WAIT_MS",
     "CLARIFYING_QUESTION",
     "INTENT_DISPLAY_NAMES",
     "CLASSIFICATION_PROMPT",
+    "BATCH_CLASSIFICATION_PROMPT",
+    "ClassifyBatcher",
     "classify_intent",
+    "classify_intents",
+    "clear_classification_cache",
     "run_orchestrator",
+    "set_classify_batcher",
 ]
@@ -5,6 +5,7 @@ This package provides modular orchestration:
 - models.py: Data structures (Intent, IntentClassification, OrchestratorResult)
 - constants.py: Configuration values and prompts
 - classifier.py: LLM-based intent classification
+- batcher.py: Micro-batching of concurrent classifications
 - runner.py: Main orchestration and chain execution
 
 Usage:
@@ -22,12 +23,21 @@ from src.agents.orchestrator.constants import (
     CLASSIFICATION_TEMPERATURE,
     CLASSIFICATION_MAX_TOKENS,
     CLASSIFICATION_MODEL,
+    CLASSIFICATION_CACHE_SIZE,
+    CLASSIFY_BATCH_MAX_SIZE,
+    CLASSIFY_BATCH_MAX_WAIT_MS,
     CLARIFYING_QUESTION,
     INTENT_DISPLAY_NAMES,
     CLASSIFICATION_PROMPT,
+    BATCH_CLASSIFICATION_PROMPT,
 )
-from src.agents.orchestrator.classifier import classify_intent
-from src.agents.orchestrator.runner import run_orchestrator
+from src.agents.orchestrator.classifier import (
+    classify_intent,
+    classify_intents,
+    clear_classification_cache,
+)
+from src.agents.orchestrator.batcher import ClassifyBatcher
+from src.agents.orchestrator.runner import run_orchestrator, set_classify_batcher
 
 __all__ = [
     # Models
@@ -39,10 +49,19 @@ __all__ = [
     "CLASSIFICATION_TEMPERATURE",
     "CLASSIFICATION_MAX_TOKENS",
     "CLASSIFICATION_MODEL",
+    "CLASSIFICATION_CACHE_SIZE",
+    "CLASSIFY_BATCH_MAX_SIZE",
+    "CLASSIFY_BATCH_MAX_WAIT_MS",
     "CLARIFYING_QUESTION",
     "INTENT_DISPLAY_NAMES",
     "CLASSIFICATION_PROMPT",
+    "BATCH_CLASSIFICATION_PROMPT",
+    # Classes
+    "ClassifyBatcher",
     # Functions
     "classify_intent",
+    "classify_intents",
+    "clear_classification_cache",
     "run_orchestrator",
+    "set_classify_batcher",
 ]
@@ -0,0 +1,115 @@
+"""
+Orchestrator Batcher - Coalesce concurrent intent classifications.
+
+Single Responsibility: Group classification requests that arrive together
+into one LLM call.
+"""
+
+import asyncio
+import contextlib
+
+from src.agents.logging_config import get_logger
+
+from src.agents.orchestrator.models import IntentClassification
+from src.agents.orchestrator.constants import (
+    CLASSIFY_BATCH_MAX_SIZE,
+    CLASSIFY_BATCH_MAX_WAIT_MS,
+)
+from src.agents.orchestrator.classifier import classify_intents
+
+logger = get_logger("orchestrator.batcher")
+
+
+class ClassifyBatcher:
+    """
+    Micro-batcher for intent classification.
+
+    Messages that queue up while a message is pending are given max_wait_ms
+    to join it (up to max_batch_size of them) and are classified together
+    with classify_intents; a message arriving alone is sent straight away.
+    Each batch runs in its own task, so several LLM calls can be in flight.
+    The background worker starts on the first submit and runs on the
+    caller's event loop until close() is awaited.
+
+    Usage:
+        batcher = ClassifyBatcher(http_client)
+        classification = await batcher.submit("Write a spec for login")
+        await batcher.close()
+    """
+
+    def __init__(
+        self,
+        http_client,
+        max_batch_size: int = CLASSIFY_BATCH_MAX_SIZE,
+        max_wait_ms: float = CLASSIFY_BATCH_MAX_WAIT_MS,
+    ):
+        self.http_client = http_client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def submit(self, user_message: str) -> IntentClassification:
+        """Queue a message and wait for its classification."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((user_message, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the worker, let batches in flight finish and cancel queued messages."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and classify them until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+
+            # Only hold the batch open when other callers are already queued
+            if 0 < self._queue.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # Each batch runs in its own task so a slow call never blocks the next
+            task = asyncio.create_task(self._dispatch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Classify one batch and resolve its futures."""
+        logger.debug(f"Classifying batch of {len(batch)} message(s)")
+        try:
+            results = await classify_intents(
+                [message for message, _ in batch], self.http_client
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), classification in zip(batch, results):
+            if not future.done():
+                future.set_result(classification)
+
+
+__all__ = ["ClassifyBatcher"]
@@ -4,8 +4,16 @@ Orchestrator Classifier - Intent classification using LLM.
 Single Responsibility: Classify user intent from natural language.
 """
 
+import asyncio
 import json
+import re
 import time
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
 from src.agents.logging_config import get_logger, LogEvent
 
@@ -13,17 +21,71 @@ from src.agents.orchestrator.models import Intent, IntentClassification
 from src.agents.orchestrator.constants import (
     CLASSIFICATION_MODEL,
     CLASSIFICATION_PROMPT,
+    BATCH_CLASSIFICATION_PROMPT,
     CLASSIFICATION_TEMPERATURE,
     CLASSIFICATION_MAX_TOKENS,
+    CLASSIFICATION_CACHE_SIZE,
 )
 
 logger = get_logger("orchestrator.classifier")
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Fallback for replies that wrap the classification object in prose or code fences
+_INTENT_JSON_RE = re.compile(r'\{[^{}]*"intent"[^{}]*\}', re.DOTALL)
+
+
+def _parse_classification(content: str) -> dict:
+    """Parse the LLM's JSON reply, extracting an embedded object if needed."""
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError:
+        match = _INTENT_JSON_RE.search(content)
+        if match is None:
+            raise
+        return _json_loads(match.group(0))
+
+
+# Successful classifications keyed by message text, most recently used last
+_classification_cache: "OrderedDict[str, IntentClassification]" = OrderedDict()
+
+
+def clear_classification_cache() -> None:
+    """Forget all cached classifications."""
+    _classification_cache.clear()
+
+
+def _remember(user_message: str, classification: IntentClassification) -> None:
+    """Cache a successful classification, evicting the least recently used."""
+    _classification_cache[user_message] = classification
+    if len(_classification_cache) > CLASSIFICATION_CACHE_SIZE:
+        _classification_cache.popitem(last=False)
+
+
+def _build_classification(classification_data: dict) -> IntentClassification:
+    """Build an IntentClassification from one parsed LLM classification object."""
+    intent_str = classification_data.get("intent", "unclear").lower()
+    confidence = float(classification_data.get("confidence", 0.5))
+    reasoning = classification_data.get("reasoning", "")
+
+    # Map string to Intent enum via the enum's own value lookup table
+    intent = Intent._value2member_map_.get(intent_str, Intent.UNCLEAR)
+
+    return IntentClassification(
+        intent=intent,
+        confidence=confidence,
+        reasoning=reasoning
+    )
+
 
 async def classify_intent(user_message: str, http_client) -> IntentClassification:
     """
     Classify the user's intent using the LLM.
 
+    Successful classifications are cached per message text (LRU); failures
+    are not cached so they are retried on the next call.
+
     Args:
         user_message: The user's input message to classify
         http_client: Async HTTP client for LLM calls
@@ -33,6 +95,13 @@ async def classify_intent(user_message: str, http_client) -> IntentClassificatio
     """
     from src.agents.agents.runner import LLM_BASE_URL, LLM_TIMEOUT
 
+    # Identical messages classify identically; skip the LLM round-trip on repeats
+    cached = _classification_cache.get(user_message)
+    if cached is not None:
+        _classification_cache.move_to_end(user_message)
+        logger.debug("Intent classification cache hit")
+        return cached
+
     url = f"{LLM_BASE_URL}/v1/chat/completions"
 
     payload = {
@@ -63,39 +132,24 @@ async def classify_intent(user_message: str, http_client) -> IntentClassificatio
         content = data["choices"][0]["message"]["content"]
 
         # Parse JSON response from LLM
-        classification_data = json.loads(content)
-
-        intent_str = classification_data.get("intent", "unclear").lower()
-        confidence = float(classification_data.get("confidence", 0.5))
-        reasoning = classification_data.get("reasoning", "")
-
-        # Map string to Intent enum
-        intent_map = {
-            "sdd": Intent.SDD,
-            "tdd": Intent.TDD,
-            "retro": Intent.RETRO,
-            "general": Intent.GENERAL,
-            "unclear": Intent.UNCLEAR
-        }
-        intent = intent_map.get(intent_str, Intent.UNCLEAR)
+        classification_data = _parse_classification(content)
+
+        classification = _build_classification(classification_data)
 
         duration_ms = (time.time() - start_time) * 1000
         logger.info(
             LogEvent.INTENT_CLASSIFIED,
             extra={
-                "intent": intent.value,
-                "intent_name": intent.name,
-                "confidence": round(confidence, 3),
-                "reasoning": reasoning,
+                "intent": classification.intent.value,
+                "intent_name": classification.intent.name,
+                "confidence": round(classification.confidence, 3),
+                "reasoning": classification.reasoning,
                 "duration_ms": round(duration_ms, 2)
             }
         )
 
-        return IntentClassification(
-            intent=intent,
-            confidence=confidence,
-            reasoning=reasoning
-        )
+        _remember(user_message, classification)
+        return classification
 
     except json.JSONDecodeError as e:
         duration_ms = (time.time() - start_time) * 1000
@@ -130,4 +184,96 @@ async def classify_intent(user_message: str, http_client) -> IntentClassificatio
         )
 
 
-__all__ = ["classify_intent"]
+async def classify_intents(
+    user_messages: list[str], http_client
+) -> list[IntentClassification]:
+    """
+    Classify several independent messages with a single LLM call.
+
+    Cached messages are answered from the cache and duplicates are sent once.
+    If the batched reply cannot be matched to the messages, each message is
+    classified individually with classify_intent instead.
+
+    Args:
+        user_messages: The messages to classify
+        http_client: Async HTTP client for LLM calls
+
+    Returns:
+        One IntentClassification per input message, in input order
+    """
+    from src.agents.agents.runner import LLM_BASE_URL, LLM_TIMEOUT
+
+    results: dict[str, IntentClassification] = {}
+    pending: list[str] = []
+    for message in dict.fromkeys(user_messages):
+        cached = _classification_cache.get(message)
+        if cached is not None:
+            _classification_cache.move_to_end(message)
+            results[message] = cached
+        else:
+            pending.append(message)
+
+    if len(pending) == 1:
+        results[pending[0]] = await classify_intent(pending[0], http_client)
+    elif pending:
+        numbered = "\n".join(f"{i}. {message}" for i, message in enumerate(pending, 1))
+        payload = {
+            "model": CLASSIFICATION_MODEL,
+            "messages": [
+                {"role": "system", "content": BATCH_CLASSIFICATION_PROMPT},
+                {"role": "user", "content": numbered}
+            ],
+            "temperature": CLASSIFICATION_TEMPERATURE,
+            "max_tokens": CLASSIFICATION_MAX_TOKENS * len(pending)
+        }
+
+        start_time = time.time()
+        logger.info(
+            LogEvent.INTENT_CLASSIFYING,
+            extra={"batch_size": len(pending), "model": CLASSIFICATION_MODEL}
+        )
+
+        try:
+            response = await http_client.post(
+                f"{LLM_BASE_URL}/v1/chat/completions", json=payload, timeout=LLM_TIMEOUT
+            )
+            response.raise_for_status()
+
+            content = response.json()["choices"][0]["message"]["content"]
+            items = _json_loads(content)
+            if not isinstance(items, list) or len(items) != len(pending):
+                raise ValueError(
+                    f"Expected {len(pending)} classifications, got "
+                    f"{len(items) if isinstance(items, list) else type(items).__name__}"
+                )
+
+            for message, item in zip(pending, items):
+                classification = _build_classification(item)
+                _remember(message, classification)
+                results[message] = classification
+
+            duration_ms = (time.time() - start_time) * 1000
+            logger.info(
+                LogEvent.INTENT_CLASSIFIED,
+                extra={"batch_size": len(pending), "duration_ms": round(duration_ms, 2)}
+            )
+        except Exception as e:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.warning(
+                LogEvent.INTENT_UNCLEAR,
+                extra={
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "batch_size": len(pending),
+                    "duration_ms": round(duration_ms, 2)
+                }
+            )
+            singles = await asyncio.gather(
+                *(classify_intent(message, http_client) for message in pending)
+            )
+            results.update(zip(pending, singles))
+
+    return [results[message] for message in user_messages]
+
+
+__all__ = ["classify_intent", "classify_intents", "clear_classification_cache"]
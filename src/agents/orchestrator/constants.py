@@ -20,6 +20,13 @@ CLASSIFICATION_MAX_TOKENS = 256
 # Model for classification (qwen is fast and sufficient for intent detection)
 CLASSIFICATION_MODEL = "qwen"
 
+# Number of recent message classifications kept in memory (LRU)
+CLASSIFICATION_CACHE_SIZE = 1024
+
+# Micro-batching of concurrent classifications (see ClassifyBatcher)
+CLASSIFY_BATCH_MAX_SIZE = 16
+CLASSIFY_BATCH_MAX_WAIT_MS = 10
+
 # Intent to human-readable name mapping
 INTENT_DISPLAY_NAMES = {
     "SDD": "Specification-Driven Development",
@@ -31,6 +38,7 @@ INTENT_DISPLAY_NAMES = {
 
 # Load prompts from YAML
 CLASSIFICATION_PROMPT = get_prompt_content("classifications/intent.yaml", "classification")
+BATCH_CLASSIFICATION_PROMPT = get_prompt_content("classifications/intent.yaml", "batch_classification")
 CLARIFYING_QUESTION = get_prompt_content("classifications/intent.yaml", "clarifying_question")
 
 __all__ = [
@@ -38,7 +46,11 @@ __all__ = [
     "CLASSIFICATION_TEMPERATURE",
     "CLASSIFICATION_MAX_TOKENS",
     "CLASSIFICATION_MODEL",
+    "CLASSIFICATION_CACHE_SIZE",
+    "CLASSIFY_BATCH_MAX_SIZE",
+    "CLASSIFY_BATCH_MAX_WAIT_MS",
     "CLARIFYING_QUESTION",
     "INTENT_DISPLAY_NAMES",
     "CLASSIFICATION_PROMPT",
+    "BATCH_CLASSIFICATION_PROMPT",
 ]
@@ -5,17 +5,19 @@ Single Responsibility: Define types for orchestrator workflow.
 """
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.agents.chains.base import ChainContext
 
 
-class Intent(Enum):
+class Intent(StrEnum):
     """
     Classification of user intent for workflow routing.
 
+    Members are str instances, so they compare equal to their raw values.
+
     Values:
         SDD: Specification-Driven Development workflow
         TDD: Test-Driven Development workflow
@@ -31,11 +33,13 @@ class Intent(Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntentClassification:
     """
     Result of analyzing a user request for intent classification.
 
+    Immutable, so cached classifications can be shared between callers.
+
     Attributes:
         intent: The classified intent (SDD, TDD, RETRO, or UNCLEAR)
         confidence: Confidence score from 0.0 to 1.0
@@ -13,9 +13,27 @@ from src.agents.orchestrator.constants import (
     INTENT_DISPLAY_NAMES,
 )
 from src.agents.orchestrator.classifier import classify_intent
+from src.agents.orchestrator.batcher import ClassifyBatcher
 
 logger = get_logger("orchestrator.runner")
 
+# Process-wide classification batcher (installed by the gateway lifespan)
+_classify_batcher: ClassifyBatcher | None = None
+
+
+def set_classify_batcher(batcher: ClassifyBatcher | None) -> None:
+    """Install (or with None, remove) the batcher concurrent requests classify through."""
+    global _classify_batcher
+    _classify_batcher = batcher
+
+
+async def _classify(user_message: str, http_client):
+    """Classify through the installed batcher when it uses this client, else directly."""
+    batcher = _classify_batcher
+    if batcher is not None and batcher.http_client is http_client:
+        return await batcher.submit(user_message)
+    return await classify_intent(user_message, http_client)
+
 
 async def run_orchestrator(
     user_message: str,
@@ -78,8 +96,8 @@ async def _run_orchestrator_internal(
     """Internal implementation of run_orchestrator with injected HTTP client."""
     logger.debug(f"Orchestrator processing request for user: {user_id}")
 
-    # Classify the user's intent
-    classification = await classify_intent(user_message, http_client)
+    # Classify the user's intent (batched with concurrent requests when possible)
+    classification = await _classify(user_message, http_client)
 
     # Check if clarification is needed
     needs_clarification = (
@@ -211,4 +229,4 @@ async def _execute_chain(
     return result
 
 
-__all__ = ["run_orchestrator"]
+__all__ = ["run_orchestrator", "set_classify_batcher"]
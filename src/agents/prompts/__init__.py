@@ -12,6 +12,7 @@ from src.agents.prompts.loader import (
     get_prompt_content,
     load_agent_prompt,
     get_prompt_path,
+    clear_prompt_cache,
 )
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "get_prompt_content",
     "load_agent_prompt",
     "get_prompt_path",
+    "clear_prompt_cache",
 ]
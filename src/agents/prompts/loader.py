@@ -4,6 +4,9 @@ YAML and Markdown Prompt Loader.
 Loads prompts from src/agents/prompts/ YAML and markdown files.
 Single Responsibility: Load and provide access to prompt content.
 
+Each file is read and parsed once per process; call clear_prompt_cache()
+after editing prompts on disk.
+
 Folder structure:
   src/agents/prompts/
   ├── INDEX.yaml              # Master index
@@ -13,6 +16,7 @@ Folder structure:
       └── core.yaml or core.md
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import yaml
@@ -23,6 +27,26 @@ PROMPTS_YAML_PATH = Path(__file__).parent
 PROMPTS_DIR = PROMPTS_YAML_PATH
 
 
+@lru_cache(maxsize=128)
+def _read_yaml(full_path: Path) -> dict:
+    """Parse a YAML prompt file once per process, keyed by its absolute path."""
+    with open(full_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@lru_cache(maxsize=128)
+def _read_text(full_path: Path) -> str:
+    """Read a markdown prompt file once per process, keyed by its absolute path."""
+    return full_path.read_text(encoding="utf-8")
+
+
+def clear_prompt_cache() -> None:
+    """Forget cached prompt files so edits on disk are picked up."""
+    _read_yaml.cache_clear()
+    _read_text.cache_clear()
+    load_agent_prompt.cache_clear()
+
+
 def load_yaml_prompt(file_path: str, prompt_key: str) -> dict:
     """
     Load a specific prompt from a YAML file.
@@ -33,6 +57,7 @@ def load_yaml_prompt(file_path: str, prompt_key: str) -> dict:
 
     Returns:
         Dictionary containing prompt data with at least 'content' key.
+        The dictionary is shared through the file cache; treat it as read-only.
 
     Raises:
         FileNotFoundError: If the YAML file doesn't exist.
@@ -43,8 +68,7 @@ def load_yaml_prompt(file_path: str, prompt_key: str) -> dict:
     if not full_path.exists():
         raise FileNotFoundError(f"Prompt file not found: {full_path}")
 
-    with open(full_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _read_yaml(full_path)
 
     if "prompts" not in data:
         raise KeyError(f"No 'prompts' section in {file_path}")
@@ -72,12 +96,14 @@ def get_prompt_content(file_path: str, prompt_key: str) -> str:
     return prompt["content"]
 
 
+@lru_cache(maxsize=128)
 def load_agent_prompt(agent_name: str, filename: Optional[str] = None) -> str:
     """
     Load an agent's core prompt from YAML or markdown.
 
     Agents have prompts in src/agents/prompts/{agent-name}/.
-    Tries core.md first, then core.yaml.
+    Tries core.md first, then core.yaml. The resolved prompt is cached per
+    (agent_name, filename), so repeat calls skip the file lookups entirely.
 
     Args:
         agent_name: Name of the agent (e.g., "spec-analyst", "test-architect")
@@ -99,7 +125,7 @@ def load_agent_prompt(agent_name: str, filename: Optional[str] = None) -> str:
                 f"Prompt file not found: {prompt_file}. "
                 f"Create {agent_name}/{filename} in src/agents/prompts/"
             )
-        return prompt_file.read_text(encoding="utf-8")
+        return _read_text(prompt_file)
 
     # Try .md first (preferred), then .yaml
     for ext_file in ["core.md", "core.yaml"]:
@@ -107,11 +133,9 @@ def load_agent_prompt(agent_name: str, filename: Optional[str] = None) -> str:
         if prompt_file.exists():
             if ext_file.endswith(".yaml"):
                 # For YAML files, return the 'role' field
-                with open(prompt_file, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                return data.get("role", "")
+                return _read_yaml(prompt_file).get("role", "")
             else:
-                return prompt_file.read_text(encoding="utf-8")
+                return _read_text(prompt_file)
 
     raise FileNotFoundError(
         f"Agent prompt not found in: {prompt_dir}. "
@@ -139,4 +163,5 @@ __all__ = [
     "get_prompt_content",
     "load_agent_prompt",
     "get_prompt_path",
+    "clear_prompt_cache",
 ]
@@ -4,7 +4,8 @@ Tool dispatch and progress event handlers for Agent Todo Tool.
 Provides dispatch_todo_tool() entry point and emit_progress() for streaming output.
 """
 
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+from uuid import UUID
 from . import store
 from .models import TaskStatus
 
@@ -24,6 +25,14 @@ def emit_progress(operation: str, summary: str, status: str) -> None:
     print(f"[TODO] {operation}: {summary} ({status})")
 
 
+def _parse_task_id(task_id: str) -> Optional[UUID]:
+    """Parse a task ID from the tool boundary, returning None if it is not a UUID."""
+    try:
+        return UUID(task_id)
+    except (TypeError, ValueError):
+        return None
+
+
 def handle_add_task(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Handle add_task operation.
@@ -53,12 +62,13 @@ def handle_add_task(params: Dict[str, Any]) -> Dict[str, Any]:
             "error": "Validation failed: content and activeForm are required, must be non-empty"
         }
 
-    emit_progress("add_task", f"Task {task.id[:8]}... created successfully", "success")
+    task_id = str(task.id)
+    emit_progress("add_task", f"Task {task_id[:8]}... created successfully", "success")
     return {
         "success": True,
         "operation": "add_task",
         "message": "Task created successfully",
-        "task_id": task.id,
+        "task_id": task_id,
         "tasks": None,
         "error": None
     }
@@ -150,7 +160,8 @@ def handle_update_status(params: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     # Update task
-    success = store.update_task(task_id, new_status)
+    tid = _parse_task_id(task_id)
+    success = tid is not None and store.update_task(tid, new_status)
 
     if not success:
         emit_progress("update_task_status", f"Task {task_id[:8]}... not found", "failed")
@@ -199,7 +210,8 @@ def handle_remove_task(params: Dict[str, Any]) -> Dict[str, Any]:
             "error": "Missing task_id parameter"
         }
 
-    success = store.remove_task(task_id)
+    tid = _parse_task_id(task_id)
+    success = tid is not None and store.remove_task(tid)
 
     if not success:
         emit_progress("remove_task", f"Task {task_id[:8]}... not found", "failed")
@@ -248,6 +260,16 @@ def handle_clear_completed(params: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Operation name -> handler, built once at import
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "add_task": handle_add_task,
+    "list_tasks": handle_list_tasks,
+    "update_task_status": handle_update_status,
+    "remove_task": handle_remove_task,
+    "clear_completed": handle_clear_completed,
+}
+
+
 def dispatch_todo_tool(operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Dispatch a todo tool operation.
@@ -259,15 +281,7 @@ def dispatch_todo_tool(operation: str, params: Dict[str, Any]) -> Dict[str, Any]
     Returns:
         ToolResponse as dict
     """
-    handlers = {
-        "add_task": handle_add_task,
-        "list_tasks": handle_list_tasks,
-        "update_task_status": handle_update_status,
-        "remove_task": handle_remove_task,
-        "clear_completed": handle_clear_completed,
-    }
-
-    handler = handlers.get(operation)
+    handler = _HANDLERS.get(operation)
     if handler is None:
         return {
             "success": False,
@@ -275,7 +289,7 @@ def dispatch_todo_tool(operation: str, params: Dict[str, Any]) -> Dict[str, Any]
             "message": f"Unknown operation: {operation}",
             "task_id": None,
             "tasks": None,
-            "error": f"Valid operations: {', '.join(handlers.keys())}"
+            "error": f"Valid operations: {', '.join(_HANDLERS)}"
         }
 
     return handler(params)
@@ -8,6 +8,7 @@ These are full implementations - data classes don't need stubs.
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from typing import Optional, List, Any
+from uuid import UUID
 import time
 
 
@@ -18,10 +19,13 @@ class TaskStatus(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
-    """Represents a single work item in the todo list."""
-    id: str
+    """Represents a single work item in the todo list.
+
+    The ID is held as a UUID and only rendered as a string in to_dict().
+    """
+    id: UUID
     content: str
     status: TaskStatus
     activeForm: str
@@ -31,7 +35,7 @@ class Task:
     def to_dict(self) -> dict:
         """Convert task to dictionary for JSON serialization."""
         return {
-            "id": self.id,
+            "id": str(self.id),
             "content": self.content,
             "status": self.status.value,
             "activeForm": self.activeForm,
@@ -40,7 +44,7 @@ class Task:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResponse:
     """Standardized response from tool operations."""
     success: bool
@@ -4,13 +4,33 @@ In-memory task storage for Agent Todo Tool.
 Provides CRUD operations on a module-level dictionary (shared singleton).
 """
 
-from typing import Optional, List, Dict
-from uuid import uuid4
+import itertools
+from collections import defaultdict
+from typing import Optional, List, Dict, Set
+from uuid import UUID, uuid4
 from .models import Task, TaskStatus
 
 
-# Module-level store - shared singleton across all agents
-_todo_store: Dict[str, Task] = {}
+# Module-level store - shared singleton across all agents, keyed by task ID
+_todo_store: Dict[UUID, Task] = {}
+
+# Inverted index: status -> IDs of tasks in that status (kept in sync with _todo_store)
+_ids_by_status: Dict[TaskStatus, Set[UUID]] = defaultdict(set)
+
+# Task IDs: a counter (from a random per-process offset) in the top 32 bits,
+# which are the first 8 hex digits the progress messages show, over random
+# per-process low bits. IDs stay unique without an os.urandom read per task.
+_id_offset = uuid4().int >> 96
+_id_rest = uuid4().int & ((1 << 96) - 1)
+_id_counter = itertools.count()
+
+
+def _new_task_id() -> UUID:
+    """Generate a process-unique, RFC 4122 version 4 task ID."""
+    n = next(_id_counter)
+    # Counter overflow past 2**32 tasks flips low bits, so IDs never repeat
+    high = (_id_offset + n) & 0xFFFFFFFF
+    return UUID(int=(high << 96) | (_id_rest ^ (n >> 32)), version=4)
 
 
 def add_task(content: str, active_form: str, priority: Optional[int] = None) -> Optional[Task]:
@@ -34,7 +54,7 @@ def add_task(content: str, active_form: str, priority: Optional[int] = None) ->
         return None
 
     # Create task with UUID
-    task_id = str(uuid4())
+    task_id = _new_task_id()
     task = Task(
         id=task_id,
         content=content,
@@ -45,10 +65,11 @@ def add_task(content: str, active_form: str, priority: Optional[int] = None) ->
 
     # Store and return
     _todo_store[task_id] = task
+    _ids_by_status[task.status].add(task_id)
     return task
 
 
-def get_task(task_id: str) -> Optional[Task]:
+def get_task(task_id: UUID) -> Optional[Task]:
     """
     Get a task by ID.
 
@@ -71,10 +92,10 @@ def list_tasks(status_filter: Optional[TaskStatus] = None) -> List[Task]:
     Returns:
         List of tasks (all or filtered by status)
     """
-    tasks = list(_todo_store.values())
-
-    if status_filter is not None:
-        tasks = [t for t in tasks if t.status == status_filter]
+    if status_filter is None:
+        tasks = list(_todo_store.values())
+    else:
+        tasks = [_todo_store[task_id] for task_id in _ids_by_status[status_filter]]
 
     # Sort by priority (None last), then by created_at
     return sorted(
@@ -83,7 +104,7 @@ def list_tasks(status_filter: Optional[TaskStatus] = None) -> List[Task]:
     )
 
 
-def update_task(task_id: str, status: TaskStatus) -> bool:
+def update_task(task_id: UUID, status: TaskStatus) -> bool:
     """
     Update a task's status.
 
@@ -108,10 +129,12 @@ def update_task(task_id: str, status: TaskStatus) -> bool:
         created_at=task.created_at,
     )
     _todo_store[task_id] = updated_task
+    _ids_by_status[task.status].discard(task_id)
+    _ids_by_status[status].add(task_id)
     return True
 
 
-def remove_task(task_id: str) -> bool:
+def remove_task(task_id: UUID) -> bool:
     """
     Remove a task by ID.
 
@@ -121,10 +144,11 @@ def remove_task(task_id: str) -> bool:
     Returns:
         True if task found and removed, False otherwise
     """
-    if task_id in _todo_store:
-        del _todo_store[task_id]
-        return True
-    return False
+    task = _todo_store.pop(task_id, None)
+    if task is None:
+        return False
+    _ids_by_status[task.status].discard(task_id)
+    return True
 
 
 def clear_completed() -> int:
@@ -134,11 +158,15 @@ def clear_completed() -> int:
     Returns:
         Number of tasks removed
     """
-    global _todo_store
-    completed_ids = [
-        task_id for task_id, task in _todo_store.items()
-        if task.status == TaskStatus.COMPLETED
-    ]
+    completed_ids = _ids_by_status[TaskStatus.COMPLETED]
     for task_id in completed_ids:
         del _todo_store[task_id]
-    return len(completed_ids)
+    count = len(completed_ids)
+    completed_ids.clear()
+    return count
+
+
+def clear_store() -> None:
+    """Remove every task (and its status index entry) from the store."""
+    _todo_store.clear()
+    _ids_by_status.clear()
@@ -3,7 +3,10 @@ Pytest fixtures for agent tests.
 
 Provides mock fixtures for:
 - httpx client (LLM calls)
+- workflow chains (orchestrator dispatch)
+- prompt folder snapshot
 - qdrant client (vector memory)
+- todo tool (dispatcher and task store)
 - Common test data
 """
 
@@ -16,31 +19,48 @@ from dataclasses import dataclass
 # HTTP Client Fixtures (for LLM calls to GB10)
 # ============================================================================
 
-@pytest.fixture
-def mock_httpx_client():
-    """Mock httpx.AsyncClient for LLM service calls."""
-    client = AsyncMock()
+DEFAULT_LLM_RESPONSE = {
+    "id": "chatcmpl-test123",
+    "object": "chat.completion",
+    "created": 1234567890,
+    "model": "gpt-oss-120b",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "Test response"},
+        "finish_reason": "stop"
+    }],
+    "usage": {
+        "prompt_tokens": 10,
+        "completion_tokens": 5,
+        "total_tokens": 15
+    }
+}
+
 
-    # Default successful response - using MagicMock for synchronous methods
+@pytest.fixture(scope="session")
+def _httpx_client_template():
+    """Shared AsyncMock client and default response, built once per session."""
+    client = AsyncMock()
+    # Using MagicMock for synchronous response methods
     mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "id": "chatcmpl-test123",
-        "object": "chat.completion",
-        "created": 1234567890,
-        "model": "gpt-oss-120b",
-        "choices": [{
-            "index": 0,
-            "message": {"role": "assistant", "content": "Test response"},
-            "finish_reason": "stop"
-        }],
-        "usage": {
-            "prompt_tokens": 10,
-            "completion_tokens": 5,
-            "total_tokens": 15
-        }
-    }
     mock_response.raise_for_status = MagicMock()
+    return client, mock_response
+
+
+@pytest.fixture
+def mock_httpx_client(_httpx_client_template):
+    """Mock httpx.AsyncClient for LLM service calls.
+
+    Reuses the session-scoped mock tree and resets call history,
+    return values and side effects so each test starts clean.
+    """
+    client, mock_response = _httpx_client_template
+    client.reset_mock(return_value=True, side_effect=True)
+    mock_response.reset_mock(return_value=True, side_effect=True)
+
+    # Default successful response
+    mock_response.status_code = 200
+    mock_response.json.return_value = DEFAULT_LLM_RESPONSE
 
     client.post.return_value = mock_response
     return client
@@ -54,39 +74,116 @@ def mock_httpx_error():
     return client
 
 
+@pytest.fixture(autouse=True)
+def _clear_classification_cache():
+    """Start every test with an empty intent classification cache."""
+    from src.agents.orchestrator import clear_classification_cache
+
+    clear_classification_cache()
+    yield
+    clear_classification_cache()
+
+
+# ============================================================================
+# Chain Fixtures (for orchestrator chain dispatch)
+# ============================================================================
+
+CHAIN_CLASS_PATHS = (
+    "src.agents.chains.sdd.SDDChain",
+    "src.agents.chains.tdd.TDDChain",
+    "src.agents.chains.retro.RetroChain",
+)
+
+
+@pytest.fixture(scope="session")
+def _chain_mock_template():
+    """Shared chain instance mock with an async execute, built once per session."""
+    chain = MagicMock()
+    chain.execute = AsyncMock()
+    return chain
+
+
+@pytest.fixture
+def chain_mock(_chain_mock_template):
+    """Mock chain instance whose execute returns an empty successful ChainContext.
+
+    Reuses the session-scoped mock and resets it so each test starts clean.
+    """
+    from src.agents.chains.base import ChainContext
+
+    chain = _chain_mock_template
+    chain.reset_mock(return_value=True, side_effect=True)
+    chain.execute.return_value = ChainContext(
+        user_message="",
+        conversation_history=[],
+        memory_context=[],
+        agent_outputs={},
+        current_agent="",
+        chain_id=""
+    )
+    return chain
+
+
+@pytest.fixture
+def patched_chains(monkeypatch, chain_mock):
+    """Make every workflow chain class construct chain_mock.
+
+    Uses monkeypatch.setattr (a plain attribute swap) rather than mock.patch.
+    """
+    for path in CHAIN_CLASS_PATHS:
+        monkeypatch.setattr(path, lambda *args, **kwargs: chain_mock)
+    return chain_mock
+
+
 # ============================================================================
 # Qdrant Client Fixtures (for vector memory)
 # ============================================================================
 
+@dataclass(frozen=True)
+class MockScoredPoint:
+    """Minimal stand-in for a Qdrant ScoredPoint."""
+    id: str
+    score: float
+    payload: dict
+
+
+MOCK_SCORED_POINTS = (
+    MockScoredPoint(
+        id="mem-1",
+        score=0.92,
+        payload={"content": "Previous conversation 1", "user_id": "test-user"}
+    ),
+    MockScoredPoint(
+        id="mem-2",
+        score=0.85,
+        payload={"content": "Previous conversation 2", "user_id": "test-user"}
+    ),
+    MockScoredPoint(
+        id="mem-3",
+        score=0.78,
+        payload={"content": "Previous conversation 3", "user_id": "test-user"}
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def _qdrant_client_template():
+    """Shared MagicMock Qdrant client, built once per session."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_qdrant_client():
-    """Mock QdrantClient for memory operations."""
-    client = MagicMock()
+def mock_qdrant_client(_qdrant_client_template):
+    """Mock QdrantClient for memory operations.
+
+    Reuses the session-scoped mock and resets call history,
+    return values and side effects so each test starts clean.
+    """
+    client = _qdrant_client_template
+    client.reset_mock(return_value=True, side_effect=True)
 
     # Mock search results
-    @dataclass
-    class MockScoredPoint:
-        id: str
-        score: float
-        payload: dict
-
-    client.search.return_value = [
-        MockScoredPoint(
-            id="mem-1",
-            score=0.92,
-            payload={"content": "Previous conversation 1", "user_id": "test-user"}
-        ),
-        MockScoredPoint(
-            id="mem-2",
-            score=0.85,
-            payload={"content": "Previous conversation 2", "user_id": "test-user"}
-        ),
-        MockScoredPoint(
-            id="mem-3",
-            score=0.78,
-            payload={"content": "Previous conversation 3", "user_id": "test-user"}
-        )
-    ]
+    client.search.return_value = list(MOCK_SCORED_POINTS)
 
     # Mock upsert
     client.upsert.return_value = None
@@ -112,9 +209,12 @@ def mock_qdrant_empty():
 # Embedding Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_embedding_response():
-    """Mock embedding response (1024-dim BGE-M3 format)."""
+    """Mock embedding response (1024-dim BGE-M3 format).
+
+    Built once per session; treat it as read-only.
+    """
     return {
         "object": "list",
         "data": [{
@@ -127,6 +227,59 @@ def mock_embedding_response():
     }
 
 
+# ============================================================================
+# Prompt Tree Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def prompts_tree():
+    """Relative POSIX paths of every file and folder under PROMPTS_YAML_PATH.
+
+    Walked once per session so folder-structure tests are set lookups.
+    """
+    from src.agents.prompts.loader import PROMPTS_YAML_PATH
+    return frozenset(
+        p.relative_to(PROMPTS_YAML_PATH).as_posix()
+        for p in PROMPTS_YAML_PATH.rglob("*")
+    )
+
+
+# ============================================================================
+# Todo Tool Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def dispatch():
+    """Todo tool dispatcher, imported once per module."""
+    from src.agents.todo.handlers import dispatch_todo_tool
+    return dispatch_todo_tool
+
+
+@pytest.fixture
+def clean_store():
+    """Empty the shared todo store before the test and hand it over."""
+    from src.agents.todo.store import _todo_store, clear_store
+
+    clear_store()
+    yield _todo_store
+
+
+@pytest.fixture
+def seed_task(clean_store):
+    """Insert a Task straight into the empty store, skipping the tool handlers."""
+    from uuid import uuid4
+    from src.agents.todo.models import Task, TaskStatus
+    from src.agents.todo.store import _ids_by_status
+
+    def _seed(content: str, status: TaskStatus = TaskStatus.PENDING) -> Task:
+        task = Task(id=uuid4(), content=content, status=status, activeForm=content)
+        clean_store[task.id] = task
+        _ids_by_status[status].add(task.id)
+        return task
+
+    return _seed
+
+
 # ============================================================================
 # Test Data Fixtures
 # ============================================================================
@@ -165,8 +318,14 @@ def sample_agent_output():
 # Async Test Helpers
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run @pytest.mark.anyio tests on asyncio, sharing one runner per session."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
 def event_loop_policy():
-    """Use default event loop policy for async tests."""
+    """Use default event loop policy for async tests (shared by all loop scopes)."""
     import asyncio
     return asyncio.DefaultEventLoopPolicy()
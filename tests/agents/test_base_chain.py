@@ -226,3 +226,127 @@ class TestBaseChainExecuteSignature:
             except NotImplementedError:
                 # Base class may raise NotImplementedError
                 pass
+
+
+class TestBaseChainStages:
+    """Test concurrent execution of agents that declare depends_on."""
+
+    @staticmethod
+    def _chain():
+        """a -> (b, c both depend only on a) -> d (depends on everything)."""
+        from src.agents.chains.base import BaseChain
+        from src.agents.agents.base import BaseAgent
+
+        return BaseChain(
+            id="dag",
+            name="DAG Chain",
+            agents=[
+                BaseAgent(id="a", name="A", prompt_path="spec-analyst"),
+                BaseAgent(id="b", name="B", prompt_path="spec-analyst", depends_on=["a"]),
+                BaseAgent(id="c", name="C", prompt_path="spec-analyst", depends_on=["a"]),
+                BaseAgent(id="d", name="D", prompt_path="spec-analyst"),
+            ]
+        )
+
+    @staticmethod
+    def _context():
+        from src.agents.chains.base import ChainContext
+
+        return ChainContext(
+            user_message="Write a spec",
+            conversation_history=[],
+            memory_context=[],
+            agent_outputs={},
+            current_agent="",
+            chain_id="dag"
+        )
+
+    def test_independent_agents_share_a_stage(self):
+        """Agents whose dependencies are all earlier must be grouped together."""
+        stages = self._chain()._stages()
+
+        assert [[a.id for a in stage] for stage in stages] == [["a"], ["b", "c"], ["d"]]
+
+    @pytest.mark.asyncio
+    async def test_stage_runs_concurrently_and_keeps_order(self):
+        """A stage must run its agents together and record outputs in chain order."""
+        import asyncio
+        from unittest.mock import patch
+
+        both_started = asyncio.Event()
+        started = []
+
+        async def fake_run_agent(agent, context, **kwargs):
+            started.append(agent.id)
+            if agent.id in ("b", "c"):
+                if len(started) == 3:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                # c finishes before b
+                if agent.id == "b":
+                    await asyncio.sleep(0.01)
+            return f"{agent.id} output"
+
+        with patch("src.agents.chains.base.run_agent", side_effect=fake_run_agent):
+            result = await self._chain().execute(self._context())
+
+        assert list(result.agent_outputs) == ["a", "b", "c", "d"]
+        assert result.current_agent == "d"
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_stage_context_only_includes_dependencies(self):
+        """Agents with depends_on must not see outputs they did not declare."""
+        from unittest.mock import patch
+
+        contexts = {}
+
+        async def fake_run_agent(agent, context, **kwargs):
+            contexts[agent.id] = context
+            return f"{agent.id} output"
+
+        with patch("src.agents.chains.base.run_agent", side_effect=fake_run_agent):
+            await self._chain().execute(self._context())
+
+        assert "a output" in contexts["c"]
+        assert "b output" not in contexts["c"]
+        assert "b output" in contexts["d"] and "c output" in contexts["d"]
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_returns_partial_results(self):
+        """A failing agent in a stage must stop the chain with partial results."""
+        from unittest.mock import patch
+
+        async def fake_run_agent(agent, context, **kwargs):
+            if agent.id == "b":
+                raise RuntimeError("LLM unavailable")
+            return f"{agent.id} output"
+
+        with patch("src.agents.chains.base.run_agent", side_effect=fake_run_agent):
+            result = await self._chain().execute(self._context())
+
+        assert result.failed_agent == "b"
+        assert result.current_agent == "b"
+        assert "d" not in result.agent_outputs
+
+    @pytest.mark.asyncio
+    async def test_stage_reports_first_failure_in_chain_order(self):
+        """When several agents in a stage fail, the earliest in the chain is reported."""
+        import asyncio
+        from unittest.mock import patch
+
+        async def fake_run_agent(agent, context, **kwargs):
+            if agent.id == "b":
+                # b fails last, but comes first in the chain
+                await asyncio.sleep(0.01)
+                raise RuntimeError("b failed")
+            if agent.id == "c":
+                raise RuntimeError("c failed")
+            return f"{agent.id} output"
+
+        with patch("src.agents.chains.base.run_agent", side_effect=fake_run_agent):
+            result = await self._chain().execute(self._context())
+
+        assert result.failed_agent == "b"
+        assert result.error == "b failed"
+        assert list(result.agent_outputs) == ["a"]
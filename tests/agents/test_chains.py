@@ -62,6 +62,25 @@ class TestSDDChain:
         chain = SDDChain()
         assert chain.agents[-1].id == "vibe-check-guardian"
 
+    def test_vibe_check_guardian_sees_alignment_analysis(self):
+        """vibe-check-guardian must receive alignment-analyzer's output."""
+        from src.agents.chains.sdd import SDDChain
+        from src.agents.chains.context import ChainContext, build_agent_context
+
+        chain = SDDChain()
+        context = ChainContext(
+            user_message="Plan login",
+            conversation_history=[],
+            memory_context=[],
+            agent_outputs={agent.id: f"{agent.id} output" for agent in chain.agents[:-1]},
+            current_agent="",
+            chain_id="sdd"
+        )
+
+        agent_context = build_agent_context(context, chain.agents[-1])
+
+        assert "alignment-analyzer output" in agent_context
+
     def test_sdd_chain_extends_base_chain(self):
         """SDDChain must extend BaseChain."""
         from src.agents.chains.sdd import SDDChain
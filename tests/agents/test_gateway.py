@@ -1072,3 +1072,76 @@ class TestMemoryFailureHandling:
                 assert response.status_code == 200
                 data = response.json()
                 assert "Quick response" in data["choices"][0]["message"]["content"]
+
+
+class TestLifespan:
+    """Test the resources the gateway lifespan sets up and tears down."""
+
+    @pytest.fixture
+    def stub_http_client(self):
+        """Run the lifespan on a stub client, leaving the module-level clients untouched."""
+        import src.agents.gateway as gateway
+
+        stub = MagicMock()
+        with patch("src.agents.gateway.get_http_client", return_value=stub), \
+                patch("src.agents.gateway.warm_http_client", new_callable=AsyncMock), \
+                patch("src.agents.gateway.set_routes_http_client"), \
+                patch("src.agents.gateway.set_memory_http_client"), \
+                patch.object(gateway, "http_client", None):
+            yield stub
+        if getattr(gateway.app.state, "http", None) is stub:
+            del gateway.app.state.http
+
+    @pytest.mark.asyncio
+    async def test_lifespan_installs_and_closes_classify_batcher(self, stub_http_client):
+        """A classification batcher on the shared client must live exactly as long as the app."""
+        from src.agents.gateway import app, lifespan
+        from src.agents.orchestrator import ClassifyBatcher, runner as orchestrator_runner
+
+        with patch("src.agents.gateway.close_http_client", new_callable=AsyncMock), \
+                patch.object(ClassifyBatcher, "close", new_callable=AsyncMock) as close:
+            async with lifespan(app):
+                batcher = orchestrator_runner._classify_batcher
+                assert batcher is not None
+                assert batcher.http_client is stub_http_client
+                close.assert_not_awaited()
+
+        assert orchestrator_runner._classify_batcher is None
+        close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_memory_batcher_before_http_client(self, stub_http_client):
+        """The memory embedding batcher must be closed before the shared HTTP client."""
+        import src.agents.gateway.memory as memory
+        from src.agents.gateway import app, lifespan
+        from src.agents.memory.batcher import EmbeddingBatcher
+
+        order = []
+        batcher = EmbeddingBatcher(AsyncMock())
+
+        async def close_batcher():
+            order.append("batcher")
+
+        async def close_client():
+            order.append("http_client")
+
+        with patch("src.agents.gateway.close_http_client", side_effect=close_client), \
+                patch.object(batcher, "close", side_effect=close_batcher), \
+                patch.object(memory, "_embedding_batcher", batcher):
+            async with lifespan(app):
+                pass
+
+            assert memory._embedding_batcher is None
+
+        assert order == ["batcher", "http_client"]
+
+    def test_reset_memory_client_drops_embedding_batcher(self):
+        """Resetting the memory client must not leave its batcher behind for the next loop."""
+        import src.agents.gateway.memory as memory
+
+        with patch.object(memory, "_memory_client", MagicMock()), \
+                patch.object(memory, "_embedding_batcher", MagicMock()):
+            memory._reset_memory_client()
+
+            assert memory._memory_client is None
+            assert memory._embedding_batcher is None
@@ -933,3 +933,100 @@ class TestUserIsolation:
         assert condition.key == "user_id"
         assert isinstance(condition.match, MatchValue)
         assert condition.match.value == "test-user-456"
+
+
+class TestEmbeddingBatcher:
+    """Test EmbeddingBatcher coalescing of concurrent query embeddings."""
+
+    @staticmethod
+    def _batch_response(count):
+        """Embedding response with one vector per input, listed out of order."""
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json.return_value = {
+            "data": [
+                {"index": i, "embedding": [float(i)] * 4}
+                for i in reversed(range(count))
+            ]
+        }
+        return response
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embeds_share_one_request(self, mock_httpx_client):
+        """Texts embedded together must go out as one list-input request."""
+        import asyncio
+        from src.agents.memory.batcher import EmbeddingBatcher
+
+        mock_httpx_client.post.return_value = self._batch_response(3)
+        batcher = EmbeddingBatcher(mock_httpx_client, max_wait_ms=5)
+
+        vectors = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), batcher.embed("c")
+        )
+        await batcher.close()
+
+        mock_httpx_client.post.assert_called_once()
+        assert mock_httpx_client.post.call_args[1]["json"]["input"] == ["a", "b", "c"]
+        assert vectors == [[0.0] * 4, [1.0] * 4, [2.0] * 4]
+
+    @pytest.mark.asyncio
+    async def test_slow_batch_does_not_block_later_embeds(self, mock_httpx_client):
+        """A text embedded while an earlier batch is still in flight must not wait for it."""
+        import asyncio
+        from src.agents.memory.batcher import EmbeddingBatcher
+
+        release = asyncio.Event()
+
+        async def post(*args, **kwargs):
+            if mock_httpx_client.post.call_count == 1:
+                await release.wait()
+            return self._batch_response(1)
+
+        mock_httpx_client.post.side_effect = post
+        batcher = EmbeddingBatcher(mock_httpx_client, max_wait_ms=5)
+
+        first = asyncio.create_task(batcher.embed("a"))
+        await asyncio.sleep(0.01)
+        second = await asyncio.wait_for(batcher.embed("b"), timeout=1)
+
+        assert second == [0.0] * 4
+        assert not first.done()
+        release.set()
+        assert await first == [0.0] * 4
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller(self, mock_httpx_error, monkeypatch):
+        """A failed batch must raise RuntimeError in each waiting caller."""
+        import asyncio
+        from src.agents.memory.batcher import EmbeddingBatcher
+
+        monkeypatch.setattr("src.agents.memory.embeddings.RETRY_DELAY_SECONDS", 0)
+        batcher = EmbeddingBatcher(mock_httpx_error, max_wait_ms=5)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+        await batcher.close()
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_retrieve_uses_batcher(self, mock_qdrant_client, mock_httpx_client):
+        """MemoryClient.retrieve_memories must embed through its batcher."""
+        from src.agents.memory.batcher import EmbeddingBatcher
+        from src.agents.memory.client import MemoryClient
+
+        mock_httpx_client.post.return_value = self._batch_response(1)
+        batcher = EmbeddingBatcher(mock_httpx_client, max_wait_ms=1)
+        client = MemoryClient(
+            qdrant_client=mock_qdrant_client,
+            http_client=mock_httpx_client,
+            embedding_batcher=batcher
+        )
+
+        memories = await client.retrieve_memories(query="auth", user_id="user-1")
+        await batcher.close()
+
+        assert len(memories) == 3
+        assert mock_httpx_client.post.call_args[1]["json"]["input"] == ["auth"]
@@ -15,6 +15,13 @@ import pytest
 from pathlib import Path
 
 
+@pytest.fixture(scope="session")
+def intent_yaml():
+    """The classification prompt from classifications/intent.yaml, loaded once."""
+    from src.agents.prompts.loader import load_yaml_prompt
+    return load_yaml_prompt("classifications/intent.yaml", "classification")
+
+
 # ============================================================================
 # T100: YAML Prompt Loader Module Tests
 # ============================================================================
@@ -22,39 +29,24 @@ from pathlib import Path
 class TestPromptLoaderExists:
     """Test that prompt loader module exists."""
 
-    def test_loader_module_exists(self):
-        """loader.py module must exist in src/agents/prompts/."""
+    @pytest.mark.parametrize("attr", [
+        "load_yaml_prompt",
+        "get_prompt_content",
+        "load_agent_prompt",
+    ])
+    def test_loader_symbols(self, attr):
+        """loader.py must exist in src/agents/prompts/ and expose each loader function."""
         from src.agents.prompts import loader
-        assert loader is not None
-
-    def test_load_yaml_prompt_function_exists(self):
-        """load_yaml_prompt function must exist."""
-        from src.agents.prompts.loader import load_yaml_prompt
-        assert callable(load_yaml_prompt)
-
-    def test_get_prompt_content_function_exists(self):
-        """get_prompt_content function must exist."""
-        from src.agents.prompts.loader import get_prompt_content
-        assert callable(get_prompt_content)
-
-    def test_load_agent_prompt_function_exists(self):
-        """load_agent_prompt function must exist for agent prompts."""
-        from src.agents.prompts.loader import load_agent_prompt
-        assert callable(load_agent_prompt)
+        assert callable(getattr(loader, attr))
 
 
 class TestPromptLoaderPaths:
     """Test prompt loader path configuration."""
 
-    def test_prompts_yaml_path_constant_exists(self):
-        """PROMPTS_YAML_PATH constant must be defined."""
-        from src.agents.prompts.loader import PROMPTS_YAML_PATH
-        assert PROMPTS_YAML_PATH is not None
-        assert isinstance(PROMPTS_YAML_PATH, Path)
-
     def test_prompts_yaml_path_points_to_agents_prompts(self):
-        """PROMPTS_YAML_PATH must point to src/agents/prompts/."""
+        """PROMPTS_YAML_PATH must be a Path pointing to src/agents/prompts/."""
         from src.agents.prompts.loader import PROMPTS_YAML_PATH
+        assert isinstance(PROMPTS_YAML_PATH, Path)
         assert PROMPTS_YAML_PATH.name == "prompts"
         assert PROMPTS_YAML_PATH.parent.name == "agents"
 
@@ -66,30 +58,22 @@ class TestPromptLoaderPaths:
 class TestFolderStructure:
     """Test that folder structure is correct."""
 
-    def test_index_yaml_at_root(self):
+    def test_index_yaml_at_root(self, prompts_tree):
         """INDEX.yaml must exist at .agents/prompts/ root."""
-        from src.agents.prompts.loader import PROMPTS_YAML_PATH
-        index_path = PROMPTS_YAML_PATH / "INDEX.yaml"
-        assert index_path.exists(), f"Missing: {index_path}"
+        assert "INDEX.yaml" in prompts_tree
 
-    def test_classifications_folder_exists(self):
+    def test_classifications_folder_exists(self, prompts_tree):
         """classifications/ folder must exist."""
-        from src.agents.prompts.loader import PROMPTS_YAML_PATH
-        classifications_path = PROMPTS_YAML_PATH / "classifications"
-        assert classifications_path.exists(), f"Missing: {classifications_path}"
-        assert classifications_path.is_dir()
+        assert "classifications" in prompts_tree
+        assert any(n.startswith("classifications/") for n in prompts_tree)
 
-    def test_intent_yaml_in_classifications(self):
+    def test_intent_yaml_in_classifications(self, prompts_tree):
         """intent.yaml must exist in classifications/."""
-        from src.agents.prompts.loader import PROMPTS_YAML_PATH
-        intent_path = PROMPTS_YAML_PATH / "classifications" / "intent.yaml"
-        assert intent_path.exists(), f"Missing: {intent_path}"
+        assert "classifications/intent.yaml" in prompts_tree
 
-    def test_no_yaml_files_at_root_except_index(self):
+    def test_no_yaml_files_at_root_except_index(self, prompts_tree):
         """Only INDEX.yaml should be at root, others in subfolders."""
-        from src.agents.prompts.loader import PROMPTS_YAML_PATH
-        root_yaml_files = list(PROMPTS_YAML_PATH.glob("*.yaml"))
-        yaml_names = [f.name for f in root_yaml_files]
+        yaml_names = sorted(n for n in prompts_tree if "/" not in n and n.endswith(".yaml"))
         assert yaml_names == ["INDEX.yaml"], f"Unexpected files at root: {yaml_names}"
 
 
@@ -100,12 +84,10 @@ class TestFolderStructure:
 class TestClassificationPrompts:
     """Test classification prompts loading."""
 
-    def test_load_classification_prompt(self):
+    def test_load_classification_prompt(self, intent_yaml):
         """Must load classification prompt from classifications/intent.yaml."""
-        from src.agents.prompts.loader import load_yaml_prompt
-        result = load_yaml_prompt("classifications/intent.yaml", "classification")
-        assert isinstance(result, dict)
-        assert "content" in result
+        assert isinstance(intent_yaml, dict)
+        assert "content" in intent_yaml
 
     def test_classification_content_has_intent_keywords(self):
         """Classification prompt must contain intent keywords."""
@@ -120,12 +102,10 @@ class TestClassificationPrompts:
         result = get_prompt_content("classifications/intent.yaml", "clarifying_question")
         assert "clarify" in result.lower() or "help" in result.lower()
 
-    def test_classification_has_config(self):
+    def test_classification_has_config(self, intent_yaml):
         """Classification prompt should have config section."""
-        from src.agents.prompts.loader import load_yaml_prompt
-        result = load_yaml_prompt("classifications/intent.yaml", "classification")
-        assert "config" in result
-        assert "temperature" in result["config"]
+        assert "config" in intent_yaml
+        assert "temperature" in intent_yaml["config"]
 
 
 # ============================================================================
@@ -135,17 +115,13 @@ class TestClassificationPrompts:
 class TestAgentPrompts:
     """Test agent prompt loading."""
 
-    def test_spec_analyst_folder_exists(self):
+    def test_spec_analyst_folder_exists(self, prompts_tree):
         """spec-analyst/ folder must exist."""
-        from src.agents.prompts.loader import PROMPTS_YAML_PATH
-        path = PROMPTS_YAML_PATH / "spec-analyst"
-        assert path.exists(), f"Missing: {path}"
+        assert "spec-analyst" in prompts_tree
 
-    def test_spec_analyst_core_yaml_exists(self):
+    def test_spec_analyst_core_yaml_exists(self, prompts_tree):
         """spec-analyst/core.yaml must exist."""
-        from src.agents.prompts.loader import PROMPTS_YAML_PATH
-        path = PROMPTS_YAML_PATH / "spec-analyst" / "core.yaml"
-        assert path.exists(), f"Missing: {path}"
+        assert "spec-analyst/core.yaml" in prompts_tree
 
     def test_load_agent_prompt_returns_string(self):
         """load_agent_prompt must return prompt content string."""
@@ -201,12 +177,10 @@ class TestErrorHandling:
 class TestConstantsIntegration:
     """Test that constants.py uses YAML prompts."""
 
-    def test_classification_prompt_loaded_from_yaml(self):
+    def test_classification_prompt_loaded_from_yaml(self, intent_yaml):
         """CLASSIFICATION_PROMPT in constants should match YAML."""
         from src.agents.orchestrator.constants import CLASSIFICATION_PROMPT
-        from src.agents.prompts.loader import get_prompt_content
-        yaml_content = get_prompt_content("classifications/intent.yaml", "classification")
-        assert CLASSIFICATION_PROMPT == yaml_content
+        assert CLASSIFICATION_PROMPT == intent_yaml["content"]
 
     def test_clarifying_question_loaded_from_yaml(self):
         """CLARIFYING_QUESTION in constants should match YAML."""
@@ -220,31 +194,64 @@ class TestConstantsIntegration:
 # T106: BaseAgent Integration Tests
 # ============================================================================
 
+@pytest.fixture(scope="module")
+def spec_analyst_agent():
+    """A spec-analyst BaseAgent shared by the integration tests."""
+    from src.agents.agents.base import BaseAgent
+    return BaseAgent(
+        id="spec-analyst",
+        name="Spec Analyst",
+        prompt_path="spec-analyst"
+    )
+
+
+@pytest.fixture(scope="module")
+def spec_analyst_prompt(spec_analyst_agent):
+    """The spec-analyst prompt as loaded through BaseAgent.load_prompt()."""
+    return spec_analyst_agent.load_prompt()
+
+
 class TestBaseAgentIntegration:
     """Test that BaseAgent loads prompts from YAML."""
 
-    def test_base_agent_loads_from_yaml(self):
+    def test_base_agent_loads_from_yaml(self, spec_analyst_prompt):
         """BaseAgent.load_prompt() must load from .agents/prompts/."""
-        from src.agents.agents.base import BaseAgent
-        agent = BaseAgent(
-            id="spec-analyst",
-            name="Spec Analyst",
-            prompt_path="spec-analyst"
-        )
-        prompt = agent.load_prompt()
-        assert isinstance(prompt, str)
-        assert len(prompt) > 0
-
-    def test_base_agent_prompt_matches_yaml(self):
+        assert isinstance(spec_analyst_prompt, str)
+        assert len(spec_analyst_prompt) > 0
+
+    def test_base_agent_prompt_matches_yaml(self, spec_analyst_prompt):
         """BaseAgent prompt must match YAML file content."""
-        from src.agents.agents.base import BaseAgent
         from src.agents.prompts.loader import load_agent_prompt
+        assert spec_analyst_prompt == load_agent_prompt("spec-analyst")
+
+
+# ============================================================================
+# T107: Prompt Cache Tests
+# ============================================================================
+
+class TestPromptCache:
+    """Test that prompt files are cached per process."""
+
+    def test_clear_prompt_cache_rereads_files(self):
+        """clear_prompt_cache must drop cached file contents."""
+        from src.agents.prompts.loader import _read_yaml, clear_prompt_cache, load_yaml_prompt
+        load_yaml_prompt("classifications/intent.yaml", "classification")
+        assert _read_yaml.cache_info().currsize > 0
+
+        clear_prompt_cache()
+
+        assert _read_yaml.cache_info().currsize == 0
+
+    def test_load_agent_prompt_is_memoized(self):
+        """Repeat loads of an agent prompt must come from the cache."""
+        from src.agents.prompts.loader import clear_prompt_cache, load_agent_prompt
+        clear_prompt_cache()
+
+        first = load_agent_prompt("spec-analyst")
+        second = load_agent_prompt("spec-analyst")
+
+        assert first is second
+        assert load_agent_prompt.cache_info().hits == 1
 
-        agent = BaseAgent(
-            id="spec-analyst",
-            name="Spec Analyst",
-            prompt_path="spec-analyst"
-        )
-        agent_prompt = agent.load_prompt()
-        yaml_prompt = load_agent_prompt("spec-analyst")
-        assert agent_prompt == yaml_prompt
+        clear_prompt_cache()
+        assert load_agent_prompt.cache_info().currsize == 0
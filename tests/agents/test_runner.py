@@ -7,10 +7,20 @@ TDD Tests for Phase 6.3:
 - T064: Memory retrieval in AgentRunner (retrieve before LLM call)
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+def _sent_json(call_args) -> dict:
+    """JSON body of a recorded post call, sent either as json= or pre-encoded content=."""
+    kwargs = call_args[1]
+    if "content" in kwargs:
+        return json.loads(kwargs["content"])
+    return kwargs.get("json", {})
+
+
 class TestAgentRunnerCallLLM:
     """Test AgentRunner.call_llm() method for GB10 LLM calls."""
 
@@ -62,7 +72,7 @@ class TestAgentRunnerCallLLM:
         await runner.call_llm(messages)
 
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         assert "messages" in json_data
         assert json_data["messages"] == messages
 
@@ -89,7 +99,7 @@ class TestAgentRunnerCallLLM:
         await runner.call_llm(messages, temperature=0.5)
 
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         assert json_data.get("temperature") == 0.5
 
     @pytest.mark.asyncio
@@ -103,7 +113,7 @@ class TestAgentRunnerCallLLM:
         await runner.call_llm(messages, max_tokens=2048)
 
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         assert json_data.get("max_tokens") == 2048
 
     @pytest.mark.asyncio
@@ -146,7 +156,7 @@ class TestAgentRunnerRunAgent:
 
         # Verify prompt was loaded and included in LLM call
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         messages = json_data.get("messages", [])
 
         # Should have system message with prompt content
@@ -169,7 +179,7 @@ class TestAgentRunnerRunAgent:
         await runner.run_agent(agent, "Write a spec for authentication")
 
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         messages = json_data.get("messages", [])
 
         # Should have user message
@@ -212,7 +222,7 @@ class TestAgentRunnerRunAgent:
         await runner.run_agent(agent, "Continue work", context=context)
 
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         messages = json_data.get("messages", [])
 
         # Context should be included somehow in the messages
@@ -239,7 +249,7 @@ class TestAgentRunnerRunAgent:
         await runner.run_agent(agent, "Show me an example", conversation_history=history)
 
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         messages = json_data.get("messages", [])
 
         # History should be included in messages
@@ -339,6 +349,52 @@ class TestMemoryRetrieval:
         # Verify memory retrieval was called
         memory_http_client.post.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_run_agent_loads_prompt_on_loop_with_memory(
+        self, mock_httpx_client, mock_qdrant_client, mock_embedding_response, monkeypatch
+    ):
+        """The cached prompt load must not be sent through the thread pool."""
+        import asyncio
+        from src.agents.agents.runner import AgentRunner
+        from src.agents.agents.base import BaseAgent
+        from src.agents.memory.client import MemoryClient
+
+        mock_memory_response = MagicMock()
+        mock_memory_response.json.return_value = mock_embedding_response
+        mock_memory_response.raise_for_status = MagicMock()
+        memory_http_client = AsyncMock()
+        memory_http_client.post.return_value = mock_memory_response
+        memory_client = MemoryClient(
+            qdrant_client=mock_qdrant_client,
+            http_client=memory_http_client
+        )
+
+        offloaded = []
+        real_to_thread = asyncio.to_thread
+
+        async def recording_to_thread(func, *args, **kwargs):
+            offloaded.append(func)
+            return await real_to_thread(func, *args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "to_thread", recording_to_thread)
+
+        runner = AgentRunner(http_client=mock_httpx_client)
+        agent = BaseAgent(
+            id="spec-analyst",
+            name="Spec Analyst",
+            prompt_path="spec-analyst"
+        )
+
+        await runner.run_agent(
+            agent=agent,
+            user_message="What did we discuss earlier?",
+            user_id="user-123",
+            memory_client=memory_client
+        )
+
+        assert agent.load_prompt not in offloaded
+        memory_http_client.post.assert_called()
+
     @pytest.mark.asyncio
     async def test_run_agent_includes_memories_in_context(
         self, mock_httpx_client, mock_qdrant_client, mock_embedding_response
@@ -377,7 +433,7 @@ class TestMemoryRetrieval:
 
         # Check that LLM was called with context containing memories
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         messages = json_data.get("messages", [])
 
         # Find system message and check for memory content
@@ -428,6 +484,28 @@ class TestMemoryRetrieval:
 
         assert result == "Test response"
 
+    @pytest.mark.asyncio
+    async def test_run_agent_plain_call_skips_message_builder(
+        self, mock_httpx_client, monkeypatch
+    ):
+        """Without memory, context or history, run_agent must send [system, user] directly."""
+        from src.agents.agents import runner as runner_module
+        from src.agents.agents.base import BaseAgent
+
+        monkeypatch.setattr(runner_module, "build_messages", MagicMock(side_effect=AssertionError))
+        agent = BaseAgent(id="spec-analyst", name="Spec Analyst", prompt_path="spec-analyst")
+
+        await runner_module.AgentRunner(http_client=mock_httpx_client).run_agent(
+            agent=agent,
+            user_message="Test message"
+        )
+
+        messages = _sent_json(mock_httpx_client.post.call_args)["messages"]
+        assert messages == [
+            {"role": "system", "content": agent.load_prompt()},
+            {"role": "user", "content": "Test message"}
+        ]
+
     @pytest.mark.asyncio
     async def test_run_agent_handles_empty_memories(
         self, mock_httpx_client, mock_qdrant_empty, mock_embedding_response
@@ -492,3 +570,360 @@ class TestMemoryRetrieval:
         )
 
         assert result is not None
+
+
+class TestAgentRunnerSharedClient:
+    """Test that AgentRunner instances share one pooled HTTP client."""
+
+    def test_default_runners_share_client(self):
+        """Runners built without a client must reuse the shared client."""
+        from src.agents.agents.runner import AgentRunner, get_http_client
+
+        first = AgentRunner()
+        second = AgentRunner()
+
+        assert first.http_client is second.http_client
+        assert first.http_client is get_http_client()
+
+    def test_injected_client_is_kept(self, mock_httpx_client):
+        """An injected client must be used instead of the shared one."""
+        from src.agents.agents.runner import AgentRunner
+
+        runner = AgentRunner(http_client=mock_httpx_client)
+
+        assert runner.http_client is mock_httpx_client
+
+    @pytest.mark.asyncio
+    async def test_close_http_client_resets_shared_client(self):
+        """Closing the shared client must make the next call build a new one."""
+        from src.agents.agents.runner import get_http_client, close_http_client
+
+        client = get_http_client()
+        await close_http_client()
+
+        assert client.is_closed
+        assert get_http_client() is not client
+
+    def test_shared_client_is_rebuilt_on_another_loop(self):
+        """A client built on a finished event loop must not be reused."""
+        import asyncio
+        from src.agents.agents.runner import get_http_client
+
+        async def build():
+            client = get_http_client()
+            await asyncio.sleep(0)  # let the replaced client's close start
+            return client
+
+        first = asyncio.run(build())
+        second = asyncio.run(build())
+
+        assert second is not first
+        assert first.is_closed, "the replaced client's pool must be closed"
+        assert second.timeout.connect == 10.0
+
+    @pytest.mark.asyncio
+    async def test_runner_does_not_close_shared_client(self):
+        """Closing a default runner must leave the shared client open for others."""
+        from src.agents.agents.runner import AgentRunner, get_http_client
+
+        async with AgentRunner():
+            pass
+
+        assert not get_http_client().is_closed
+
+    @pytest.mark.asyncio
+    async def test_runner_follows_shared_client_after_close(self):
+        """A runner built before close_http_client() must use the new client."""
+        from src.agents.agents.runner import AgentRunner, get_http_client, close_http_client
+
+        runner = AgentRunner()
+        await close_http_client()
+
+        assert not runner.http_client.is_closed
+        assert runner.http_client is get_http_client()
+
+    @pytest.mark.asyncio
+    async def test_warm_http_client_ignores_unreachable_service(self, monkeypatch):
+        """Warm-up must swallow connection errors so startup continues."""
+        import httpx
+        from src.agents.agents import runner
+
+        def refuse(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        monkeypatch.setattr(
+            runner, "_shared_client", httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+        )
+        monkeypatch.setattr(runner, "_shared_client_loop", None)
+
+        await runner.warm_http_client()
+
+
+class TestAgentRunnerResponseCache:
+    """Test the optional LLMCache for deterministic AgentRunner.call_llm calls."""
+
+    @pytest.mark.asyncio
+    async def test_temperature_zero_repeat_is_cached(self, mock_httpx_client):
+        """Identical temperature-0 calls must hit the LLM only once."""
+        from src.agents.agents.runner import AgentRunner, LLMCache
+
+        cache = LLMCache()
+        runner = AgentRunner(http_client=mock_httpx_client, cache=cache)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        first = await runner.call_llm(messages, temperature=0.0)
+        second = await runner.call_llm(messages, temperature=0.0)
+
+        assert first == second == "Test response"
+        assert mock_httpx_client.post.call_count == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_nonzero_temperature_bypasses_cache(self, mock_httpx_client):
+        """Sampled calls must always reach the LLM."""
+        from src.agents.agents.runner import AgentRunner, LLMCache
+
+        cache = LLMCache()
+        runner = AgentRunner(http_client=mock_httpx_client, cache=cache)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        await runner.call_llm(messages, temperature=0.7)
+        await runner.call_llm(messages, temperature=0.7)
+
+        assert mock_httpx_client.post.call_count == 2
+        assert len(cache) == 0
+
+    def test_expired_entry_is_a_miss(self):
+        """Entries older than the TTL must not be returned."""
+        from src.agents.agents.cache import LLMCache
+
+        cache = LLMCache(ttl=-1.0)
+        cache.put("key", "content")
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The cache must not grow beyond maxsize."""
+        from src.agents.agents.cache import LLMCache
+
+        cache = LLMCache(maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+
+class TestBuildMessagesOrdering:
+    """Test that build_messages keeps the system prompt as a stable prefix."""
+
+    def test_system_message_is_prompt_only(self):
+        """Memories and context must not be folded into the system message."""
+        from src.agents.agents.context import build_messages
+
+        messages = build_messages(
+            "You are a spec analyst.",
+            ["Earlier chat"],
+            "Spec draft",
+            [{"role": "assistant", "content": "Hi"}],
+            "Refine it"
+        )
+
+        assert messages[0] == {"role": "system", "content": "You are a spec analyst."}
+        assert messages[1] == {"role": "assistant", "content": "Hi"}
+        assert messages[-1]["role"] == "user"
+        assert messages[-1]["content"].index("Earlier chat") < messages[-1]["content"].index("Spec draft")
+        assert messages[-1]["content"].endswith("Refine it")
+
+    def test_prefix_is_identical_across_requests(self):
+        """Different memories must leave the system message byte-identical."""
+        from src.agents.agents.context import build_messages
+
+        first = build_messages("Prompt", ["a"], None, None, "one")
+        second = build_messages("Prompt", ["b", "c"], "ctx", None, "two")
+
+        assert first[0] == second[0]
+
+    def test_plain_message_is_unchanged(self):
+        """Without memories or context the user message is sent as-is."""
+        from src.agents.agents.context import build_messages
+
+        messages = build_messages("Prompt", [], None, None, "Hello")
+
+        assert messages == [
+            {"role": "system", "content": "Prompt"},
+            {"role": "user", "content": "Hello"}
+        ]
+
+
+class TestAgentRunnerSemanticCache:
+    """Test the optional SemanticCache in front of AgentRunner.call_llm."""
+
+    @staticmethod
+    def _semantic_cache(search_results):
+        """SemanticCache over a stub embedder and a mock Qdrant client."""
+        from src.agents.agents.semantic_cache import SemanticCache
+
+        embedder = MagicMock()
+        embedder.embed = AsyncMock(return_value=[0.1] * 4)
+        qdrant = MagicMock()
+        qdrant.search.return_value = search_results
+        return SemanticCache(embedder, qdrant)
+
+    @pytest.mark.asyncio
+    async def test_similar_message_returns_cached_reply(self, mock_httpx_client):
+        """A hit above the threshold must skip the LLM call."""
+        from src.agents.agents.runner import AgentRunner
+
+        hit = MagicMock(score=0.97, payload={"response": "Cached answer"})
+        runner = AgentRunner(
+            http_client=mock_httpx_client,
+            semantic_cache=self._semantic_cache([hit])
+        )
+
+        result = await runner.call_llm(
+            [{"role": "user", "content": "How do I log in?"}], temperature=0.0
+        )
+
+        assert result == "Cached answer"
+        mock_httpx_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_calls_llm_and_stores_reply(self, mock_httpx_client):
+        """A miss must call the LLM and store its reply under the same scope."""
+        from src.agents.agents.runner import AgentRunner
+
+        cache = self._semantic_cache([])
+        runner = AgentRunner(http_client=mock_httpx_client, semantic_cache=cache)
+        messages = [
+            {"role": "system", "content": "Prompt"},
+            {"role": "user", "content": "How do I log in?"}
+        ]
+
+        result = await runner.call_llm(messages, temperature=0.0)
+        await runner.aclose()  # wait for the background store
+
+        assert result == "Test response"
+        search_scope = cache.qdrant_client.search.call_args[1]["query_filter"].must[0].match.value
+        point = cache.qdrant_client.upsert.call_args[1]["points"][0]
+        assert point.payload["response"] == "Test response"
+        assert point.payload["scope"] == search_scope
+        cache.embedder.embed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reply_does_not_wait_for_store(self, mock_httpx_client):
+        """call_llm must return before a slow cache store finishes."""
+        import asyncio
+        from src.agents.agents.runner import AgentRunner
+
+        cache = self._semantic_cache([])
+        release = asyncio.Event()
+
+        async def slow_put(*args, **kwargs):
+            await release.wait()
+
+        cache.put = slow_put
+        runner = AgentRunner(http_client=mock_httpx_client, semantic_cache=cache)
+
+        result = await asyncio.wait_for(
+            runner.call_llm([{"role": "user", "content": "Hi"}], temperature=0.0), 1
+        )
+
+        assert result == "Test response"
+        release.set()
+        await runner.aclose()
+
+    def test_runner_imports_without_qdrant(self):
+        """The runner and gateway must import when qdrant_client is missing."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys; sys.modules['qdrant_client'] = None; "
+            "import src.agents.agents.runner, src.agents.gateway"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2]
+        )
+
+    @pytest.mark.asyncio
+    async def test_lookup_errors_fall_through_to_llm(self, mock_httpx_client):
+        """A failing cache backend must not break the LLM call."""
+        from src.agents.agents.runner import AgentRunner
+
+        cache = self._semantic_cache([])
+        cache.qdrant_client.search.side_effect = Exception("Qdrant down")
+        runner = AgentRunner(http_client=mock_httpx_client, semantic_cache=cache)
+
+        result = await runner.call_llm(
+            [{"role": "user", "content": "Hi"}], temperature=0.0
+        )
+
+        assert result == "Test response"
+
+
+class TestLongHistoryOffload:
+    """Test that long requests are encoded and hashed in a worker thread."""
+
+    @pytest.mark.asyncio
+    async def test_long_history_is_encoded_in_thread(self, mock_httpx_client, monkeypatch):
+        """Requests above LLM_OFFLOAD_MESSAGE_COUNT must use asyncio.to_thread."""
+        import asyncio
+        from src.agents.agents.config import LLM_OFFLOAD_MESSAGE_COUNT
+        from src.agents.agents.runner import AgentRunner, LLMCache
+
+        offloaded = []
+        real_to_thread = asyncio.to_thread
+
+        async def spy(func, *args, **kwargs):
+            offloaded.append(func.__name__)
+            return await real_to_thread(func, *args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "to_thread", spy)
+        messages = [
+            {"role": "user", "content": f"turn {i}"}
+            for i in range(LLM_OFFLOAD_MESSAGE_COUNT + 1)
+        ]
+        runner = AgentRunner(http_client=mock_httpx_client, cache=LLMCache())
+
+        await runner.call_llm(messages, temperature=0.0)
+
+        assert offloaded == ["make_key", "_json_dumps"]
+        assert len(_sent_json(mock_httpx_client.post.call_args)["messages"]) == len(messages)
+
+    @pytest.mark.asyncio
+    async def test_short_request_stays_on_loop(self, mock_httpx_client, monkeypatch):
+        """Short requests must not pay for a thread hop."""
+        import asyncio
+        from src.agents.agents.runner import AgentRunner
+
+        monkeypatch.setattr(asyncio, "to_thread", AsyncMock(side_effect=AssertionError))
+        runner = AgentRunner(http_client=mock_httpx_client)
+
+        assert await runner.call_llm([{"role": "user", "content": "Hi"}]) == "Test response"
+
+    @pytest.mark.asyncio
+    async def test_payload_dump_skipped_without_debug_logging(self, mock_httpx_client, monkeypatch):
+        """The full payload must not be pretty-printed on the loop unless debug logging is on."""
+        import json
+        import logging
+        from src.agents.agents import llm
+        from src.agents.agents.runner import AgentRunner
+
+        dumps = MagicMock(side_effect=json.dumps)
+        monkeypatch.setattr(llm.json, "dumps", dumps)
+        runner = AgentRunner(http_client=mock_httpx_client)
+
+        level = llm.logger.level
+        llm.logger.setLevel(logging.INFO)
+        try:
+            await runner.call_llm([{"role": "user", "content": "Hi"}])
+        finally:
+            llm.logger.setLevel(level)
+
+        assert not any(call.kwargs.get("indent") for call in dumps.call_args_list)
@@ -5,9 +5,14 @@ TDD RED Phase: These tests define expected streaming behavior.
 """
 
 import pytest
+import httpx
 import json
+import re
 from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
+
+
+# Payload of each SSE "data:" line, found without splitting the whole body
+SSE_DATA_RE = re.compile(r"^data: (.+)$", re.MULTILINE)
 
 
 # =============================================================================
@@ -29,23 +34,31 @@ def mock_orchestrator():
         yield mock
 
 
-@pytest.fixture
-def client(mock_orchestrator):
-    """Create test client with mocked orchestrator."""
+@pytest.fixture(scope="module")
+def asgi_transport():
+    """ASGI transport for the gateway app, built once per module."""
     from src.agents.gateway import app
-    return TestClient(app)
+    return httpx.ASGITransport(app=app)
+
+
+@pytest.fixture
+async def client(asgi_transport, mock_orchestrator):
+    """In-process async client with the orchestrator mocked for this test."""
+    async with httpx.AsyncClient(transport=asgi_transport, base_url="http://test") as c:
+        yield c
 
 
 # =============================================================================
 # Test: Streaming Response Type
 # =============================================================================
 
+@pytest.mark.anyio
 class TestStreamingResponseType:
     """Verify streaming returns correct response type."""
 
-    def test_stream_true_returns_event_stream(self, client):
+    async def test_stream_true_returns_event_stream(self, client):
         """When stream=True, Content-Type should be text/event-stream."""
-        response = client.post(
+        response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -56,9 +69,9 @@ class TestStreamingResponseType:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers.get("content-type", "")
 
-    def test_stream_false_returns_json(self, client):
+    async def test_stream_false_returns_json(self, client):
         """When stream=False, Content-Type should be application/json."""
-        response = client.post(
+        response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -74,24 +87,24 @@ class TestStreamingResponseType:
 # Test: SSE Chunk Format
 # =============================================================================
 
+@pytest.mark.anyio
 class TestSSEChunkFormat:
     """Verify SSE chunks follow OpenAI format."""
 
     def parse_sse_chunks(self, response_text: str) -> list:
         """Parse SSE response into list of data chunks."""
         chunks = []
-        for line in response_text.split("\n"):
-            if line.startswith("data: "):
-                data = line[6:]  # Remove "data: " prefix
-                if data != "[DONE]":
-                    chunks.append(json.loads(data))
-                else:
-                    chunks.append("[DONE]")
+        for match in SSE_DATA_RE.finditer(response_text):
+            data = match.group(1)
+            if data != "[DONE]":
+                chunks.append(json.loads(data))
+            else:
+                chunks.append("[DONE]")
         return chunks
 
-    def test_first_chunk_has_role(self, client):
+    async def test_first_chunk_has_role(self, client):
         """First chunk delta should contain role: assistant."""
-        response = client.post(
+        response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -105,9 +118,9 @@ class TestSSEChunkFormat:
         first_chunk = chunks[0]
         assert first_chunk["choices"][0]["delta"].get("role") == "assistant"
 
-    def test_chunks_have_correct_structure(self, client):
+    async def test_chunks_have_correct_structure(self, client):
         """Each chunk should have id, object, created, model, choices."""
-        response = client.post(
+        response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -127,9 +140,9 @@ class TestSSEChunkFormat:
             assert "choices" in chunk
             assert len(chunk["choices"]) > 0
 
-    def test_content_chunks_have_delta_content(self, client):
+    async def test_content_chunks_have_delta_content(self, client):
         """Middle chunks should have content in delta."""
-        response = client.post(
+        response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -149,9 +162,9 @@ class TestSSEChunkFormat:
                 # Content chunks should have content key
                 assert "content" in delta or delta == {}
 
-    def test_final_chunk_has_finish_reason(self, client):
+    async def test_final_chunk_has_finish_reason(self, client):
         """Last data chunk (before [DONE]) should have finish_reason: stop."""
-        response = client.post(
+        response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -168,9 +181,9 @@ class TestSSEChunkFormat:
         final_chunk = data_chunks[-1]
         assert final_chunk["choices"][0]["finish_reason"] == "stop"
 
-    def test_stream_ends_with_done(self, client):
+    async def test_stream_ends_with_done(self, client):
         """Stream should end with data: [DONE]."""
-        response = client.post(
+        response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -187,23 +200,22 @@ class TestSSEChunkFormat:
 # Test: Content Reconstruction
 # =============================================================================
 
+@pytest.mark.anyio
 class TestContentReconstruction:
     """Verify streamed content matches non-streamed response."""
 
     def parse_sse_chunks(self, response_text: str) -> list:
         """Parse SSE response into list of data chunks."""
-        chunks = []
-        for line in response_text.split("\n"):
-            if line.startswith("data: "):
-                data = line[6:]
-                if data != "[DONE]":
-                    chunks.append(json.loads(data))
-        return chunks
+        return [
+            json.loads(match.group(1))
+            for match in SSE_DATA_RE.finditer(response_text)
+            if match.group(1) != "[DONE]"
+        ]
 
-    def test_streamed_content_matches_full_response(self, client):
+    async def test_streamed_content_matches_full_response(self, client):
         """Concatenated stream content should match non-stream response."""
         # Get non-streaming response
-        non_stream_response = client.post(
+        non_stream_response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -214,7 +226,7 @@ class TestContentReconstruction:
         expected_content = non_stream_response.json()["choices"][0]["message"]["content"]
 
         # Get streaming response
-        stream_response = client.post(
+        stream_response = await client.post(
             "/v1/chat/completions",
             json={
                 "model": "orchestrator",
@@ -232,3 +244,143 @@ class TestContentReconstruction:
                 reconstructed += delta["content"]
 
         assert reconstructed.strip() == expected_content.strip()
+
+
+# =============================================================================
+# Test: Upstream LLM Stream Relay
+# =============================================================================
+
+UPSTREAM_SSE = (
+    'data: {"id": "up-1", "model": "gpt-oss", "choices": [{"index": 0, "delta": {"role": "assistant"}}]}\n\n'
+    'data: {"id": "up-1", "model": "gpt-oss", "choices": [{"index": 0, "delta": {"content": "Hello"}}]}\n\n'
+    ': keep-alive\n\n'
+    'data: {"id": "up-1", "model": "gpt-oss", "choices": [{"index": 0, "delta": {"content": " world"}}]}\n\n'
+    'data: [DONE]\n\n'
+)
+
+
+@pytest.fixture
+def upstream_client():
+    """Real httpx.AsyncClient whose transport replies with UPSTREAM_SSE."""
+    def handler(request):
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(
+            200,
+            text=UPSTREAM_SSE,
+            headers={"content-type": "text/event-stream"}
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.anyio
+class TestLLMStreamRelay:
+    """Verify upstream chunks are parsed and relayed as they arrive."""
+
+    async def test_stream_llm_yields_upstream_chunks(self, upstream_client):
+        """stream_llm must yield each data chunk and stop at [DONE]."""
+        from src.agents.agents.llm import stream_llm
+
+        chunks = [c async for c in stream_llm(upstream_client, [{"role": "user", "content": "Hi"}])]
+
+        assert len(chunks) == 3
+        assert chunks[1]["choices"][0]["delta"]["content"] == "Hello"
+
+    async def test_runner_stream_llm_yields_content_deltas(self, upstream_client):
+        """AgentRunner.stream_llm must yield only the content fragments."""
+        from src.agents.agents.runner import AgentRunner
+
+        runner = AgentRunner(http_client=upstream_client)
+        deltas = [d async for d in runner.stream_llm([{"role": "user", "content": "Hi"}])]
+
+        assert deltas == ["Hello", " world"]
+
+    async def test_relay_relabels_chunks_and_ends_with_done(self, upstream_client):
+        """relay_llm_stream must stamp the gateway id/model and finish with [DONE]."""
+        from src.agents.agents.llm import stream_llm
+        from src.agents.gateway.streaming import relay_llm_stream
+
+        lines = [
+            line async for line in relay_llm_stream(
+                stream_llm(upstream_client, [{"role": "user", "content": "Hi"}]),
+                "agent-gateway/orchestrator",
+                "chatcmpl-test"
+            )
+        ]
+
+        assert lines[-1] == b"data: [DONE]\n\n"
+        assert all(line.startswith(b"data: ") for line in lines)
+        chunks = [json.loads(line[6:]) for line in lines[:-1]]
+        assert all(c["id"] == "chatcmpl-test" for c in chunks)
+        assert all(c["model"] == "agent-gateway/orchestrator" for c in chunks)
+
+    async def test_stream_llm_handles_lines_split_across_reads(self):
+        """Data lines split over several network reads must still parse."""
+        from src.agents.agents.llm import stream_llm
+
+        body = UPSTREAM_SSE.encode()
+
+        class Trickle(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for i in range(0, len(body), 7):
+                    yield body[i:i + 7]
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=Trickle()))
+        )
+
+        chunks = [c async for c in stream_llm(client, [{"role": "user", "content": "Hi"}])]
+
+        assert [c["choices"][0]["delta"].get("content") for c in chunks] == [None, "Hello", " world"]
+
+
+@pytest.mark.anyio
+class TestToolStreamRelay:
+    """Verify the tool-enabled stream path reports how the stream ended."""
+
+    @staticmethod
+    def _request():
+        from src.agents.gateway.models import ChatRequest
+        return ChatRequest(model="orchestrator", messages=[{"role": "user", "content": "Hi"}])
+
+    async def test_upstream_error_mid_stream_sends_error_and_done(self):
+        """A failure after the first chunk must end with an error event and [DONE]."""
+        from src.agents.gateway.endpoints.helpers import relay_tool_stream
+
+        async def failing():
+            yield {"choices": [{"index": 0, "delta": {"content": "Hel"}}]}
+            raise httpx.ReadTimeout("upstream timed out")
+
+        with patch("src.agents.gateway.endpoints.helpers.log_error") as log_error:
+            lines = [
+                line async for line in relay_tool_stream(
+                    failing(), self._request(), "req-test", "chatcmpl-test", 0.0
+                )
+            ]
+
+        error_event, done, _ = lines[-1].split(b"\n\n")
+        assert done == b"data: [DONE]"
+        error = json.loads(error_event[6:])
+        assert error["error"]["code"] == "llm_unavailable"
+        log_error.assert_called_once()
+
+    async def test_completed_stream_is_logged(self):
+        """A finished tool stream must be logged with its content and tool names."""
+        from src.agents.gateway.endpoints.helpers import relay_tool_stream
+
+        async def upstream():
+            yield {"choices": [{"index": 0, "delta": {"content": "Looking"}}]}
+            yield {"choices": [{"index": 0, "delta": {"tool_calls": [
+                {"index": 0, "function": {"name": "read_file", "arguments": ""}}
+            ]}}]}
+
+        with patch("src.agents.gateway.endpoints.helpers.log_completion") as log_completion:
+            lines = [
+                line async for line in relay_tool_stream(
+                    upstream(), self._request(), "req-test", "chatcmpl-test", 0.0
+                )
+            ]
+
+        assert lines[-1] == b"data: [DONE]\n\n"
+        response_text = log_completion.call_args[0][4]
+        assert response_text == "Looking [tool_calls: read_file]"
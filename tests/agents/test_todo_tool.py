@@ -7,6 +7,8 @@ TDD test suite following the stub implementation pattern:
 - Phase 3+ tests: Verify business logic (should FAIL against stubs, pass after implementation)
 """
 
+import importlib
+
 import pytest
 from pathlib import Path
 
@@ -49,33 +51,28 @@ class TestPhase1ModuleStructure:
 class TestPhase2StubsExist:
     """Verify Phase 2 stubs exist. These tests will fail until Phase 2 is complete."""
 
-    def test_models_module_exists(self):
-        """T003: Verify models.py exists with TaskStatus and Task."""
-        from src.agents.todo import models
-        assert hasattr(models, 'TaskStatus'), "models.py should define TaskStatus enum"
-        assert hasattr(models, 'Task'), "models.py should define Task dataclass"
-        assert hasattr(models, 'ToolResponse'), "models.py should define ToolResponse dataclass"
-
-    def test_store_module_exists(self):
-        """T004: Verify store.py exists with stub functions."""
-        from src.agents.todo import store
-        assert hasattr(store, 'add_task'), "store.py should define add_task()"
-        assert hasattr(store, 'get_task'), "store.py should define get_task()"
-        assert hasattr(store, 'list_tasks'), "store.py should define list_tasks()"
-        assert hasattr(store, 'update_task'), "store.py should define update_task()"
-        assert hasattr(store, 'remove_task'), "store.py should define remove_task()"
-        assert hasattr(store, 'clear_completed'), "store.py should define clear_completed()"
-
-    def test_handlers_module_exists(self):
-        """T005: Verify handlers.py exists with stub functions."""
-        from src.agents.todo import handlers
-        assert hasattr(handlers, 'dispatch_todo_tool'), "handlers.py should define dispatch_todo_tool()"
-        assert hasattr(handlers, 'emit_progress'), "handlers.py should define emit_progress()"
-
-    def test_tools_module_exists(self):
-        """T006: Verify tools.py exists with TODO_TOOLS constant."""
+    @pytest.mark.parametrize("module_name, required", [
+        # T003: models.py defines TaskStatus, Task and ToolResponse
+        ("src.agents.todo.models", {"TaskStatus", "Task", "ToolResponse"}),
+        # T004: store.py defines the CRUD functions
+        ("src.agents.todo.store", {
+            "add_task", "get_task", "list_tasks",
+            "update_task", "remove_task", "clear_completed",
+        }),
+        # T005: handlers.py defines the dispatcher and progress emitter
+        ("src.agents.todo.handlers", {"dispatch_todo_tool", "emit_progress"}),
+        # T006: tools.py defines TODO_TOOLS
+        ("src.agents.todo.tools", {"TODO_TOOLS"}),
+    ])
+    def test_module_stubs_exist(self, module_name, required):
+        """T003-T006: Verify each todo module defines its expected names."""
+        module = importlib.import_module(module_name)
+        missing = required - set(dir(module))
+        assert not missing, f"{module_name} missing: {missing}"
+
+    def test_todo_tools_is_list(self):
+        """T006: TODO_TOOLS should be a list."""
         from src.agents.todo import tools
-        assert hasattr(tools, 'TODO_TOOLS'), "tools.py should define TODO_TOOLS"
         assert isinstance(tools.TODO_TOOLS, list), "TODO_TOOLS should be a list"
 
 
@@ -87,11 +84,9 @@ class TestPhase2StubsExist:
 class TestUserStory1CreateAndTrackTasks:
     """US1: As an AI agent, I need to create tasks and track their progress."""
 
-    def test_add_task_creates_task_with_id(self):
+    def test_add_task_creates_task_with_id(self, dispatch, clean_store):
         """T007: Add task returns success=True and valid UUID task_id."""
-        from src.agents.todo.handlers import dispatch_todo_tool
-
-        result = dispatch_todo_tool("add_task", {
+        result = dispatch("add_task", {
             "content": "Implement authentication",
             "activeForm": "Implementing authentication"
         })
@@ -101,48 +96,52 @@ class TestUserStory1CreateAndTrackTasks:
         assert result["task_id"] is not None, "add_task should return a task_id"
         assert len(result["task_id"]) == 36, "task_id should be a valid UUID string"
 
-    def test_list_tasks_returns_all_tasks(self):
-        """T008: List tasks returns all added tasks."""
-        from src.agents.todo.handlers import dispatch_todo_tool
-        from src.agents.todo.store import _todo_store
+    def test_add_task_ids_are_unique(self, dispatch, clean_store):
+        """Consecutive tasks get distinct IDs, distinguishable by their short form."""
+        ids = [
+            dispatch("add_task", {"content": f"Task {i}", "activeForm": "Working"})["task_id"]
+            for i in range(3)
+        ]
+
+        assert len(set(ids)) == 3
+        assert len({task_id[:8] for task_id in ids}) == 3, "progress lines show task_id[:8]"
 
-        # Clear store for test isolation
-        _todo_store.clear()
+    def test_add_task_ids_are_rfc4122_v4(self, dispatch, clean_store):
+        """Task IDs must be valid version 4 UUIDs."""
+        import uuid
 
+        task_id = uuid.UUID(
+            dispatch("add_task", {"content": "Task", "activeForm": "Working"})["task_id"]
+        )
+
+        assert task_id.variant == uuid.RFC_4122
+        assert task_id.version == 4
+
+    def test_list_tasks_returns_all_tasks(self, dispatch, clean_store):
+        """T008: List tasks returns all added tasks."""
         # Add two tasks
-        dispatch_todo_tool("add_task", {
+        dispatch("add_task", {
             "content": "Task 1",
             "activeForm": "Working on Task 1"
         })
-        dispatch_todo_tool("add_task", {
+        dispatch("add_task", {
             "content": "Task 2",
             "activeForm": "Working on Task 2"
         })
 
-        result = dispatch_todo_tool("list_tasks", {})
+        result = dispatch("list_tasks", {})
 
         # This will FAIL with stub (returns empty), PASS after implementation
         assert result["success"] is True, "list_tasks should return success=True"
         assert "tasks" in result, "list_tasks should return tasks list"
         assert len(result["tasks"]) == 2, "Should return 2 tasks"
 
-    def test_update_status_changes_task_state(self):
+    def test_update_status_changes_task_state(self, dispatch, seed_task):
         """T009: Update status changes task from pending to in_progress."""
-        from src.agents.todo.handlers import dispatch_todo_tool
-        from src.agents.todo.store import _todo_store
-
-        # Clear store for test isolation
-        _todo_store.clear()
-
-        # Add a task
-        add_result = dispatch_todo_tool("add_task", {
-            "content": "Test task",
-            "activeForm": "Testing"
-        })
-        task_id = add_result["task_id"]
+        task_id = str(seed_task("Test task").id)
 
         # Update status
-        result = dispatch_todo_tool("update_task_status", {
+        result = dispatch("update_task_status", {
             "task_id": task_id,
             "status": "in_progress"
         })
@@ -151,7 +150,7 @@ class TestUserStory1CreateAndTrackTasks:
         assert result["success"] is True, "update_task_status should return success=True"
 
         # Verify task status changed
-        list_result = dispatch_todo_tool("list_tasks", {})
+        list_result = dispatch("list_tasks", {})
         task = next(t for t in list_result["tasks"] if t["id"] == task_id)
         assert task["status"] == "in_progress", "Task status should be in_progress"
 
@@ -163,57 +162,71 @@ class TestUserStory1CreateAndTrackTasks:
 class TestUserStory2ManageTaskLifecycle:
     """US2: As an AI agent, I need to update and complete tasks."""
 
-    def test_remove_task_deletes_task(self):
+    def test_remove_task_deletes_task(self, dispatch, seed_task):
         """T016: Remove task deletes the task from the store."""
-        from src.agents.todo.handlers import dispatch_todo_tool
-        from src.agents.todo.store import _todo_store
-
-        _todo_store.clear()
-
-        # Add a task
-        add_result = dispatch_todo_tool("add_task", {
-            "content": "Task to remove",
-            "activeForm": "Removing task"
-        })
-        task_id = add_result["task_id"]
+        task_id = str(seed_task("Task to remove").id)
 
         # Remove it
-        result = dispatch_todo_tool("remove_task", {"task_id": task_id})
+        result = dispatch("remove_task", {"task_id": task_id})
 
         assert result["success"] is True, "remove_task should return success=True"
 
         # Verify it's gone
-        list_result = dispatch_todo_tool("list_tasks", {})
+        list_result = dispatch("list_tasks", {})
         assert len(list_result["tasks"]) == 0, "Task should be removed"
 
-    def test_clear_completed_removes_only_completed(self):
-        """T016: Clear completed removes only completed tasks."""
-        from src.agents.todo.handlers import dispatch_todo_tool
-        from src.agents.todo.store import _todo_store
+    def test_remove_task_with_malformed_id_is_not_found(self, dispatch, clean_store):
+        """Task IDs that are not UUIDs are reported as missing tasks."""
+        result = dispatch("remove_task", {"task_id": "not-a-uuid"})
 
-        _todo_store.clear()
+        assert result["success"] is False
+        assert result["error"] == "Task does not exist"
 
-        # Add tasks with different statuses
-        dispatch_todo_tool("add_task", {"content": "Pending task", "activeForm": "Pending"})
-        completed_result = dispatch_todo_tool("add_task", {"content": "Completed task", "activeForm": "Completed"})
+    def test_clear_completed_removes_only_completed(self, dispatch, seed_task):
+        """T016: Clear completed removes only completed tasks."""
+        from src.agents.todo.models import TaskStatus
 
-        # Mark one as completed
-        dispatch_todo_tool("update_task_status", {
-            "task_id": completed_result["task_id"],
-            "status": "completed"
-        })
+        # Seed tasks with different statuses
+        seed_task("Pending task")
+        seed_task("Completed task", status=TaskStatus.COMPLETED)
 
         # Clear completed
-        result = dispatch_todo_tool("clear_completed", {})
+        result = dispatch("clear_completed", {})
 
         assert result["success"] is True, "clear_completed should return success=True"
 
+        assert "Removed 1 completed tasks" in result["message"]
+
         # Verify only pending remains
-        list_result = dispatch_todo_tool("list_tasks", {})
+        list_result = dispatch("list_tasks", {})
         assert len(list_result["tasks"]) == 1, "Only pending task should remain"
         assert list_result["tasks"][0]["content"] == "Pending task"
 
 
+class TestTaskStatusIndex:
+    """Status-filtered reads and clears go through the store's status index."""
+
+    def test_list_tasks_filters_by_status_after_update(self, dispatch, seed_task):
+        """A task moves between status buckets when its status is updated."""
+        first = seed_task("First")
+        seed_task("Second")
+
+        dispatch("update_task_status", {"task_id": str(first.id), "status": "in_progress"})
+
+        in_progress = dispatch("list_tasks", {"status_filter": "in_progress"})["tasks"]
+        pending = dispatch("list_tasks", {"status_filter": "pending"})["tasks"]
+        assert [t["content"] for t in in_progress] == ["First"]
+        assert [t["content"] for t in pending] == ["Second"]
+
+    def test_removed_task_leaves_status_filter(self, dispatch, seed_task):
+        """Removing a task drops it from status-filtered listings."""
+        task = seed_task("Gone")
+
+        dispatch("remove_task", {"task_id": str(task.id)})
+
+        assert dispatch("list_tasks", {"status_filter": "pending"})["tasks"] == []
+
+
 # =============================================================================
 # Phase 5: User Story 3 - Multi-Agent Task Sharing (TDD Tests)
 # =============================================================================
@@ -221,14 +234,13 @@ class TestUserStory2ManageTaskLifecycle:
 class TestUserStory3MultiAgentSharing:
     """US3: As an AI agent, I need shared access to the task list."""
 
-    def test_shared_store_across_imports(self):
+    def test_shared_store_across_imports(self, clean_store):
         """T021: Store is shared singleton across multiple imports."""
         # Import store twice (simulating two agents)
         from src.agents.todo import store as store1
         from src.agents.todo import store as store2
 
-        # Clear and add via first import
-        store1._todo_store.clear()
+        # Add via first import
         store1.add_task("Shared task", "Working on shared task")
 
         # Verify visible via second import
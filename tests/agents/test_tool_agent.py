@@ -10,10 +10,60 @@ Architecture:
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 import json
 
 
+# Pre-encoded tool call arguments for the execution loop tests
+_READ_FILE_ARGS_TEST_FILE = json.dumps({"path": "/test/file.py"})
+_READ_FILE_ARGS_TEST = json.dumps({"path": "/test"})
+
+
+def _sent_json(call_args) -> dict:
+    """JSON body of a recorded post call, sent either as json= or pre-encoded content=."""
+    kwargs = call_args[1]
+    if "content" in kwargs:
+        return json.loads(kwargs["content"])
+    return kwargs.get("json", {})
+
+
+def _sent_tools(mock_client) -> dict:
+    """Tools sent on the last LLM call, keyed by function name."""
+    return {
+        t["function"]["name"]: t
+        for t in _sent_json(mock_client.post.call_args).get("tools", [])
+    }
+
+
+@pytest.fixture(scope="module")
+def runner_factory():
+    """Bind one module-wide ToolAgentRunner to each test's client and executor.
+
+    Every call resets all runner settings, so nothing leaks between tests.
+    """
+    from src.agents.agents.tool_agent import ToolAgentRunner, default_tool_executor
+
+    runner = ToolAgentRunner()
+
+    def _bind(http_client, tool_executor=None, max_iterations=10):
+        runner._http_client = http_client
+        runner._tool_executor = tool_executor or default_tool_executor
+        runner._max_iterations = max_iterations
+        return runner
+
+    return _bind
+
+
+def _resp(payload: dict) -> SimpleNamespace:
+    """Plain stand-in for an httpx response carrying a JSON payload."""
+    return SimpleNamespace(
+        status_code=200,
+        json=lambda: payload,
+        raise_for_status=lambda: None
+    )
+
+
 # =============================================================================
 # T01: ToolAgent Class Tests
 # =============================================================================
@@ -85,6 +135,24 @@ class TestToolAgentFields:
         assert len(agent.tools) == 1
         assert agent.tools[0]["function"]["name"] == "read_file"
 
+    def test_tool_agents_share_cached_prompt(self):
+        """Agents with the same prompt_path must reuse one cached prompt load."""
+        from src.agents.agents.tool_agent import ToolAgent
+        from src.agents.prompts.loader import clear_prompt_cache, load_agent_prompt
+        clear_prompt_cache()
+
+        agents = [
+            ToolAgent(id=f"agent-{i}", name="Test Agent", prompt_path="spec-analyst")
+            for i in range(3)
+        ]
+        # Construction alone must not touch the prompt files
+        assert load_agent_prompt.cache_info().currsize == 0
+
+        prompts = [agent.load_prompt() for agent in agents]
+
+        assert prompts[0] is prompts[1] is prompts[2]
+        assert load_agent_prompt.cache_info().misses == 1
+
 
 # =============================================================================
 # T02: ToolAgentRunner.run_with_tools() Tests
@@ -166,17 +234,15 @@ class TestToolExecutionLoop:
     """T03: ToolAgentRunner executes tool calls from LLM."""
 
     @pytest.mark.asyncio
-    async def test_run_with_tools_executes_tool_calls(self):
+    async def test_run_with_tools_executes_tool_calls(self, runner_factory):
         """run_with_tools must execute tool calls returned by LLM."""
-        from src.agents.agents.tool_agent import ToolAgent, ToolAgentRunner
+        from src.agents.agents.tool_agent import ToolAgent
 
         # Mock LLM returning a tool call
         mock_client = AsyncMock()
 
         # First response: tool call
-        tool_call_response = MagicMock()
-        tool_call_response.status_code = 200
-        tool_call_response.json.return_value = {
+        tool_call_response = _resp({
             "choices": [{
                 "message": {
                     "role": "assistant",
@@ -186,26 +252,22 @@ class TestToolExecutionLoop:
                         "type": "function",
                         "function": {
                             "name": "read_file",
-                            "arguments": json.dumps({"path": "/test/file.py"})
+                            "arguments": _READ_FILE_ARGS_TEST_FILE
                         }
                     }]
                 }
             }]
-        }
-        tool_call_response.raise_for_status = MagicMock()
+        })
 
         # Second response: final answer after tool result
-        final_response = MagicMock()
-        final_response.status_code = 200
-        final_response.json.return_value = {
+        final_response = _resp({
             "choices": [{
                 "message": {
                     "role": "assistant",
                     "content": "Based on the file content, here's my analysis..."
                 }
             }]
-        }
-        final_response.raise_for_status = MagicMock()
+        })
 
         mock_client.post.side_effect = [tool_call_response, final_response]
 
@@ -226,10 +288,7 @@ class TestToolExecutionLoop:
                 }
             }]
         )
-        runner = ToolAgentRunner(
-            http_client=mock_client,
-            tool_executor=mock_executor
-        )
+        runner = runner_factory(mock_client, tool_executor=mock_executor)
 
         result = await runner.run_with_tools(
             agent=agent,
@@ -243,16 +302,48 @@ class TestToolExecutionLoop:
         assert "analysis" in result.lower()
 
     @pytest.mark.asyncio
-    async def test_run_with_tools_max_iterations(self):
+    async def test_run_with_tools_round_trips_tool_json(self, runner_factory):
+        """Malformed arguments become {} and dict results are sent back as JSON."""
+        from src.agents.agents.tool_agent import ToolAgent
+
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = [
+            _resp({
+                "choices": [{
+                    "message": {
+                        "role": "assistant",
+                        "content": None,
+                        "tool_calls": [{
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "read_file", "arguments": "{not json"}
+                        }]
+                    }
+                }]
+            }),
+            _resp({"choices": [{"message": {"role": "assistant", "content": "done"}}]}),
+        ]
+        mock_executor = AsyncMock(return_value={"lines": 2})
+
+        agent = ToolAgent(id="test-agent", name="Test Agent", prompt_path="spec-analyst")
+        runner = runner_factory(mock_client, tool_executor=mock_executor)
+
+        await runner.run_with_tools(agent=agent, user_message="Read the file")
+
+        mock_executor.assert_called_once_with("read_file", {})
+        tool_message = _sent_json(mock_client.post.call_args)["messages"][-1]
+        assert tool_message["role"] == "tool"
+        assert json.loads(tool_message["content"]) == {"lines": 2}
+
+    @pytest.mark.asyncio
+    async def test_run_with_tools_max_iterations(self, runner_factory):
         """run_with_tools must have max iteration limit to prevent infinite loops."""
-        from src.agents.agents.tool_agent import ToolAgent, ToolAgentRunner
+        from src.agents.agents.tool_agent import ToolAgent
 
         mock_client = AsyncMock()
 
         # Always return tool call (would cause infinite loop)
-        tool_call_response = MagicMock()
-        tool_call_response.status_code = 200
-        tool_call_response.json.return_value = {
+        tool_call_response = _resp({
             "choices": [{
                 "message": {
                     "role": "assistant",
@@ -262,13 +353,12 @@ class TestToolExecutionLoop:
                         "type": "function",
                         "function": {
                             "name": "read_file",
-                            "arguments": json.dumps({"path": "/test"})
+                            "arguments": _READ_FILE_ARGS_TEST
                         }
                     }]
                 }
             }]
-        }
-        tool_call_response.raise_for_status = MagicMock()
+        })
 
         mock_client.post.return_value = tool_call_response
 
@@ -280,11 +370,7 @@ class TestToolExecutionLoop:
             prompt_path="spec-analyst",
             tools=[{"type": "function", "function": {"name": "read_file", "parameters": {}}}]
         )
-        runner = ToolAgentRunner(
-            http_client=mock_client,
-            tool_executor=mock_executor,
-            max_iterations=3
-        )
+        runner = runner_factory(mock_client, tool_executor=mock_executor, max_iterations=3)
 
         # Should stop after max_iterations
         with pytest.raises(RuntimeError, match="Max iterations"):
@@ -311,16 +397,14 @@ class TestIndexerAgent:
     def test_indexer_agent_has_indexer_tools(self):
         """IndexerAgent must have INDEXER_TOOLS by default."""
         from src.agents.agents.tool_agent import IndexerAgent
-        from src.agents.indexer import INDEXER_TOOLS
+        from src.agents.indexer import INDEXER_TOOL_NAMES
 
         agent = IndexerAgent()
 
         # Should have all indexer tools
-        tool_names = [t["function"]["name"] for t in agent.tools]
-        indexer_tool_names = [t["function"]["name"] for t in INDEXER_TOOLS]
-
-        for name in indexer_tool_names:
-            assert name in tool_names, f"Missing tool: {name}"
+        tool_names = {t["function"]["name"] for t in agent.tools}
+        missing = INDEXER_TOOL_NAMES - tool_names
+        assert not missing, f"Missing tools: {missing}"
 
     def test_indexer_agent_has_correct_id(self):
         """IndexerAgent must have id='indexer'."""
@@ -338,9 +422,9 @@ class TestToolMerging:
     """T05: External tools merge with agent's built-in tools."""
 
     @pytest.mark.asyncio
-    async def test_external_tools_merge_with_agent_tools(self, mock_httpx_client):
+    async def test_external_tools_merge_with_agent_tools(self, mock_httpx_client, runner_factory):
         """run_with_tools should merge external tools with agent's tools."""
-        from src.agents.agents.tool_agent import ToolAgent, ToolAgentRunner
+        from src.agents.agents.tool_agent import ToolAgent
 
         agent_tools = [
             {"type": "function", "function": {"name": "tool_a", "parameters": {}}}
@@ -355,7 +439,7 @@ class TestToolMerging:
             prompt_path="spec-analyst",
             tools=agent_tools
         )
-        runner = ToolAgentRunner(http_client=mock_httpx_client)
+        runner = runner_factory(mock_httpx_client)
 
         await runner.run_with_tools(
             agent=agent,
@@ -364,17 +448,15 @@ class TestToolMerging:
         )
 
         # Check that LLM was called with both tools
-        call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
-        tool_names = [t["function"]["name"] for t in json_data.get("tools", [])]
+        tools = _sent_tools(mock_httpx_client)
 
-        assert "tool_a" in tool_names
-        assert "tool_b" in tool_names
+        assert "tool_a" in tools
+        assert "tool_b" in tools
 
     @pytest.mark.asyncio
-    async def test_external_tools_override_agent_tools(self, mock_httpx_client):
+    async def test_external_tools_override_agent_tools(self, mock_httpx_client, runner_factory):
         """External tools with same name should override agent tools."""
-        from src.agents.agents.tool_agent import ToolAgent, ToolAgentRunner
+        from src.agents.agents.tool_agent import ToolAgent
 
         agent_tools = [
             {
@@ -403,7 +485,7 @@ class TestToolMerging:
             prompt_path="spec-analyst",
             tools=agent_tools
         )
-        runner = ToolAgentRunner(http_client=mock_httpx_client)
+        runner = runner_factory(mock_httpx_client)
 
         await runner.run_with_tools(
             agent=agent,
@@ -411,14 +493,10 @@ class TestToolMerging:
             external_tools=external_tools
         )
 
-        call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
-        tools = json_data.get("tools", [])
-
         # Should only have one read_file (external version)
-        read_file_tools = [t for t in tools if t["function"]["name"] == "read_file"]
-        assert len(read_file_tools) == 1
-        assert read_file_tools[0]["function"]["description"] == "External version"
+        assert len(_sent_json(mock_httpx_client.post.call_args)["tools"]) == 1
+        tools = _sent_tools(mock_httpx_client)
+        assert tools["read_file"]["function"]["description"] == "External version"
 
 
 # =============================================================================
@@ -459,6 +537,19 @@ class TestToolExecutor:
 
         assert "error" in result or "unknown" in str(result).lower()
 
+    @pytest.mark.asyncio
+    async def test_default_executor_dispatches_todo_tools(self, clean_store):
+        """Default executor should route todo tool names to dispatch_todo_tool."""
+        from src.agents.agents.tool_agent import default_tool_executor
+
+        result = await default_tool_executor(
+            "add_task",
+            {"content": "Write docs", "activeForm": "Writing docs"}
+        )
+
+        assert result["success"] is True
+        assert len(clean_store) == 1
+
 
 # =============================================================================
 # T07: Integration with Classifier Tests
@@ -474,9 +565,9 @@ class TestClassifierIntegration:
         assert "indexer" in AGENTS
 
     @pytest.mark.asyncio
-    async def test_run_indexer_agent_with_user_tools(self, mock_httpx_client):
+    async def test_run_indexer_agent_with_user_tools(self, mock_httpx_client, runner_factory):
         """Should be able to run IndexerAgent with UI-provided tools."""
-        from src.agents.agents.tool_agent import IndexerAgent, ToolAgentRunner
+        from src.agents.agents.tool_agent import IndexerAgent
 
         # UI provides read/list tools
         ui_tools = [
@@ -507,7 +598,7 @@ class TestClassifierIntegration:
         ]
 
         agent = IndexerAgent()
-        runner = ToolAgentRunner(http_client=mock_httpx_client)
+        runner = runner_factory(mock_httpx_client)
 
         result = await runner.run_with_tools(
             agent=agent,
@@ -517,7 +608,7 @@ class TestClassifierIntegration:
 
         # Should have merged all tools
         call_args = mock_httpx_client.post.call_args
-        json_data = call_args[1].get("json", {})
+        json_data = _sent_json(call_args)
         tool_names = [t["function"]["name"] for t in json_data.get("tools", [])]
 
         # UI tools
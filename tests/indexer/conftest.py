@@ -9,6 +9,7 @@ from typing import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 
 # Fixture paths
@@ -16,51 +17,73 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_PROJECT_DIR = FIXTURES_DIR / "sample_project"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Get the fixtures directory path."""
     return FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project_dir() -> Path:
     """Get the sample project directory path."""
     return SAMPLE_PROJECT_DIR
 
 
+@pytest.fixture(scope="session")
+def _qdrant_client_template() -> MagicMock:
+    """Shared MagicMock Qdrant client, built once per session."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_qdrant_client() -> MagicMock:
-    """Create a mock Qdrant client."""
-    client = MagicMock()
-    client.get_collections = MagicMock(return_value=MagicMock(collections=[]))
-    client.create_collection = MagicMock()
-    client.upsert = MagicMock()
-    client.search = MagicMock(return_value=[])
-    client.scroll = MagicMock(return_value=([], None))
-    client.delete = MagicMock()
+def mock_qdrant_client(_qdrant_client_template) -> MagicMock:
+    """Create a mock Qdrant client.
+
+    Reuses the session-scoped mock and resets call history,
+    return values and side effects so each test starts clean.
+    """
+    client = _qdrant_client_template
+    client.reset_mock(return_value=True, side_effect=True)
+    client.get_collections.return_value = MagicMock(collections=[])
+    client.search.return_value = []
+    client.scroll.return_value = ([], None)
     return client
 
 
+@pytest.fixture(scope="session")
+def _http_client_template() -> AsyncMock:
+    """Shared AsyncMock HTTP client, built once per session."""
+    return AsyncMock()
+
+
 @pytest.fixture
-def mock_http_client() -> AsyncMock:
-    """Create a mock HTTP client for embedding requests."""
-    client = AsyncMock()
-    client.post = AsyncMock(
-        return_value=MagicMock(
-            json=MagicMock(
-                return_value={
-                    "embeddings": [[0.1] * 1024],
-                    "dimension": 1024,
-                }
-            )
+def mock_http_client(_http_client_template) -> AsyncMock:
+    """Create a mock HTTP client for embedding requests.
+
+    Reuses the session-scoped mock and resets it so each test starts clean.
+    """
+    client = _http_client_template
+    client.reset_mock(return_value=True, side_effect=True)
+    client.post.return_value = MagicMock(
+        json=MagicMock(
+            return_value={
+                "embeddings": [[0.1] * 1024],
+                "dimension": 1024,
+            }
         )
     )
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_py_source() -> str:
+    """Contents of fixtures/sample.py, read once per session."""
+    return (FIXTURES_DIR / "sample.py").read_text()
+
+
+@pytest.fixture(scope="session")
 def sample_python_code() -> str:
-    """Sample Python code for testing."""
+    """Sample Python code for testing (immutable, shared per session)."""
     return '''"""Sample module docstring."""
 
 def hello_world():
@@ -94,3 +117,63 @@ class DataProcessor:
         """Process data asynchronously."""
         return data
 '''
+
+
+@pytest.fixture(scope="session")
+def sample_parser_code() -> str:
+    """Python source exercised by the parser tests (functions, classes, docstrings)."""
+    return '''"""Module docstring."""
+
+def simple_function():
+    """A simple function."""
+    pass
+
+
+def function_with_params(name: str, count: int = 10) -> str:
+    """Function with typed parameters.
+
+    Args:
+        name: The name parameter
+        count: The count parameter
+
+    Returns:
+        Processed string
+    """
+    return name * count
+
+
+async def async_function(data: list) -> dict:
+    """An async function."""
+    return {"data": data}
+
+
+class SimpleClass:
+    """A simple class."""
+
+    def __init__(self, value: int):
+        """Initialize with a value."""
+        self.value = value
+
+    def get_value(self) -> int:
+        """Get the stored value."""
+        return self.value
+
+
+class InheritedClass(SimpleClass):
+    """A class that inherits from SimpleClass."""
+
+    def __init__(self, value: int, name: str):
+        """Initialize with value and name."""
+        super().__init__(value)
+        self.name = name
+'''
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def sample_file_node(tmp_path_factory, sample_parser_code):
+    """sample_parser_code written to disk and parsed once per session (read-only)."""
+    from src.agents.indexer.parser import parse_file
+
+    path = tmp_path_factory.mktemp("parser") / "sample.py"
+    path.write_text(sample_parser_code)
+    return await parse_file(path, "python")
@@ -0,0 +1,89 @@
+"""
+Tests for the indexer hash manifest (hash_cache module).
+
+These tests verify that unchanged files reuse their cached hash and that
+the manifest survives a save/load round trip.
+"""
+
+import os
+from unittest.mock import patch
+
+from src.agents.indexer.hash_cache import (
+    get_manifest_path,
+    hash_files_cached,
+    load_manifest,
+    save_manifest,
+)
+from src.agents.indexer.hasher import compute_content_hash
+
+
+class TestManifestPersistence:
+    """load_manifest()/save_manifest() round trip."""
+
+    def test_save_then_load_round_trips(self, tmp_path):
+        """A saved manifest should load back unchanged."""
+        manifest = {"src/app.py": (123, 45, "ab" * 32)}
+
+        save_manifest(tmp_path, manifest)
+
+        assert load_manifest(tmp_path) == manifest
+
+    def test_missing_manifest_is_empty(self, tmp_path):
+        """No manifest on disk should load as an empty dict."""
+        assert load_manifest(tmp_path) == {}
+
+    def test_corrupt_manifest_is_empty(self, tmp_path):
+        """An unreadable manifest should be ignored, not raise."""
+        path = get_manifest_path(tmp_path)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert load_manifest(tmp_path) == {}
+
+
+class TestHashFilesCached:
+    """hash_files_cached() skips re-hashing files whose stat is unchanged."""
+
+    def test_first_run_hashes_every_file(self, tmp_path):
+        """With an empty manifest every file is hashed and recorded."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"x = 1\n")
+
+        hashes, manifest = hash_files_cached({"a.py": path}, {})
+
+        assert hashes == {"a.py": compute_content_hash(b"x = 1\n")}
+        assert manifest["a.py"][2] == hashes["a.py"]
+
+    def test_unchanged_file_reuses_cached_hash(self, tmp_path):
+        """Matching mtime and size should return the cached hash without reading."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"x = 1\n")
+        _, manifest = hash_files_cached({"a.py": path}, {})
+
+        with patch("src.agents.indexer.hash_cache.compute_file_hashes", return_value={}) as mock_hash:
+            hashes, _ = hash_files_cached({"a.py": path}, manifest)
+
+        assert hashes["a.py"] == manifest["a.py"][2]
+        assert list(mock_hash.call_args[0][0]) == []
+
+    def test_modified_file_is_rehashed(self, tmp_path):
+        """A changed size/mtime should produce the new content's hash."""
+        path = tmp_path / "a.py"
+        path.write_bytes(b"x = 1\n")
+        _, manifest = hash_files_cached({"a.py": path}, {})
+
+        path.write_bytes(b"x = 22\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        hashes, _ = hash_files_cached({"a.py": path}, manifest)
+
+        assert hashes["a.py"] == compute_content_hash(b"x = 22\n")
+
+    def test_deleted_file_drops_from_manifest(self, tmp_path):
+        """Files that no longer exist map to None and leave the manifest."""
+        path = tmp_path / "gone.py"
+
+        hashes, manifest = hash_files_cached({"gone.py": path}, {"gone.py": (1, 1, "h")})
+
+        assert hashes == {"gone.py": None}
+        assert manifest == {}
@@ -123,245 +123,64 @@ class TestT003ModuleFilesExist:
         assert module_path.is_file(), f"Path is not a file: {module_path}"
 
 
-class TestT004FunctionsImportable:
-    """T004: Assert all functions can be imported from each module."""
-
-    def test_config_validate_path(self):
-        """validate_path must be importable from config."""
-        from src.agents.indexer.config import validate_path
-
-        assert callable(validate_path)
-
-    def test_config_get_output_dir(self):
-        """get_output_dir must be importable from config."""
-        from src.agents.indexer.config import get_output_dir
-
-        assert callable(get_output_dir)
-
-    def test_config_supported_extensions(self):
-        """SUPPORTED_EXTENSIONS must be importable from config."""
-        from src.agents.indexer.config import SUPPORTED_EXTENSIONS
-
-        assert isinstance(SUPPORTED_EXTENSIONS, dict)
-
-    def test_config_get_language_for_extension(self):
-        """get_language_for_extension must be importable from config."""
-        from src.agents.indexer.config import get_language_for_extension
-
-        assert callable(get_language_for_extension)
-
-    def test_models_project(self):
-        """Project must be importable from models."""
-        from src.agents.indexer.models import Project
-
-        assert Project is not None
-
-    def test_models_file_node(self):
-        """FileNode must be importable from models."""
-        from src.agents.indexer.models import FileNode
-
-        assert FileNode is not None
-
-    def test_models_function_def(self):
-        """FunctionDef must be importable from models."""
-        from src.agents.indexer.models import FunctionDef
-
-        assert FunctionDef is not None
-
-    def test_models_class_def(self):
-        """ClassDef must be importable from models."""
-        from src.agents.indexer.models import ClassDef
-
-        assert ClassDef is not None
-
-    def test_models_parameter(self):
-        """Parameter must be importable from models."""
-        from src.agents.indexer.models import Parameter
-
-        assert Parameter is not None
-
-    def test_models_project_status_enum(self):
-        """ProjectStatus enum must be importable from models."""
-        from src.agents.indexer.models import ProjectStatus
-
-        assert ProjectStatus is not None
-
-    def test_models_parse_status_enum(self):
-        """ParseStatus enum must be importable from models."""
-        from src.agents.indexer.models import ParseStatus
-
-        assert ParseStatus is not None
-
-    def test_scanner_scan_directory(self):
-        """scan_directory must be importable from scanner."""
-        from src.agents.indexer.scanner import scan_directory
-
-        assert callable(scan_directory)
-
-    def test_scanner_should_exclude(self):
-        """should_exclude must be importable from scanner."""
-        from src.agents.indexer.scanner import should_exclude
-
-        assert callable(should_exclude)
-
-    def test_scanner_detect_language(self):
-        """detect_language must be importable from scanner."""
-        from src.agents.indexer.scanner import detect_language
-
-        assert callable(detect_language)
-
-    def test_hasher_compute_file_hash(self):
-        """compute_file_hash must be importable from hasher."""
-        from src.agents.indexer.hasher import compute_file_hash
-
-        assert callable(compute_file_hash)
-
-    def test_hasher_compute_content_hash(self):
-        """compute_content_hash must be importable from hasher."""
-        from src.agents.indexer.hasher import compute_content_hash
-
-        assert callable(compute_content_hash)
-
-    def test_hasher_compare_hashes(self):
-        """compare_hashes must be importable from hasher."""
-        from src.agents.indexer.hasher import compare_hashes
-
-        assert callable(compare_hashes)
-
-    def test_parser_parse_file(self):
-        """parse_file must be importable from parser."""
-        from src.agents.indexer.parser import parse_file
-
-        assert callable(parse_file)
-
-    def test_parser_get_parser(self):
-        """get_parser must be importable from parser."""
-        from src.agents.indexer.parser import get_parser
+# (module, symbol, kind): kind is "callable", "exists", or the expected type
+INDEXER_SYMBOLS = [
+    ("config", "validate_path", "callable"),
+    ("config", "get_output_dir", "callable"),
+    ("config", "SUPPORTED_EXTENSIONS", dict),
+    ("config", "get_language_for_extension", "callable"),
+    ("models", "Project", "exists"),
+    ("models", "FileNode", "exists"),
+    ("models", "FunctionDef", "exists"),
+    ("models", "ClassDef", "exists"),
+    ("models", "Parameter", "exists"),
+    ("models", "ProjectStatus", "exists"),
+    ("models", "ParseStatus", "exists"),
+    ("scanner", "scan_directory", "callable"),
+    ("scanner", "should_exclude", "callable"),
+    ("scanner", "detect_language", "callable"),
+    ("hasher", "compute_file_hash", "callable"),
+    ("hasher", "compute_content_hash", "callable"),
+    ("hasher", "compare_hashes", "callable"),
+    ("parser", "parse_file", "callable"),
+    ("parser", "get_parser", "callable"),
+    ("parser", "extract_functions", "callable"),
+    ("parser", "extract_classes", "callable"),
+    ("storage", "store_project", "callable"),
+    ("storage", "get_project", "callable"),
+    ("storage", "search_vectors", "callable"),
+    ("storage", "delete_project", "callable"),
+    ("storage", "list_projects", "callable"),
+    ("storage", "ensure_collection", "callable"),
+    ("storage", "get_file_hashes", "callable"),
+    ("storage", "delete_symbols_by_file", "callable"),
+    ("yaml_writer", "write_project_yaml", "callable"),
+    ("yaml_writer", "write_structure_yaml", "callable"),
+    ("yaml_writer", "write_file_yaml", "callable"),
+    ("yaml_writer", "sanitize_path_for_filename", "callable"),
+    ("tools", "INDEXER_TOOLS", list),
+    ("tools", "dispatch_tool", "callable"),
+    ("tools", "handle_index_project", "callable"),
+    ("tools", "handle_update_project", "callable"),
+    ("tools", "handle_search_architecture", "callable"),
+    ("tools", "handle_list_projects", "callable"),
+    ("tools", "handle_delete_project", "callable"),
+]
 
-        assert callable(get_parser)
 
-    def test_parser_extract_functions(self):
-        """extract_functions must be importable from parser."""
-        from src.agents.indexer.parser import extract_functions
-
-        assert callable(extract_functions)
-
-    def test_parser_extract_classes(self):
-        """extract_classes must be importable from parser."""
-        from src.agents.indexer.parser import extract_classes
-
-        assert callable(extract_classes)
-
-    def test_storage_store_project(self):
-        """store_project must be importable from storage."""
-        from src.agents.indexer.storage import store_project
-
-        assert callable(store_project)
-
-    def test_storage_get_project(self):
-        """get_project must be importable from storage."""
-        from src.agents.indexer.storage import get_project
-
-        assert callable(get_project)
-
-    def test_storage_search_vectors(self):
-        """search_vectors must be importable from storage."""
-        from src.agents.indexer.storage import search_vectors
-
-        assert callable(search_vectors)
-
-    def test_storage_delete_project(self):
-        """delete_project must be importable from storage."""
-        from src.agents.indexer.storage import delete_project
-
-        assert callable(delete_project)
-
-    def test_storage_list_projects(self):
-        """list_projects must be importable from storage."""
-        from src.agents.indexer.storage import list_projects
-
-        assert callable(list_projects)
-
-    def test_storage_ensure_collection(self):
-        """ensure_collection must be importable from storage."""
-        from src.agents.indexer.storage import ensure_collection
-
-        assert callable(ensure_collection)
-
-    def test_storage_get_file_hashes(self):
-        """get_file_hashes must be importable from storage."""
-        from src.agents.indexer.storage import get_file_hashes
-
-        assert callable(get_file_hashes)
-
-    def test_storage_delete_symbols_by_file(self):
-        """delete_symbols_by_file must be importable from storage."""
-        from src.agents.indexer.storage import delete_symbols_by_file
-
-        assert callable(delete_symbols_by_file)
-
-    def test_yaml_writer_write_project_yaml(self):
-        """write_project_yaml must be importable from yaml_writer."""
-        from src.agents.indexer.yaml_writer import write_project_yaml
-
-        assert callable(write_project_yaml)
-
-    def test_yaml_writer_write_structure_yaml(self):
-        """write_structure_yaml must be importable from yaml_writer."""
-        from src.agents.indexer.yaml_writer import write_structure_yaml
-
-        assert callable(write_structure_yaml)
-
-    def test_yaml_writer_write_file_yaml(self):
-        """write_file_yaml must be importable from yaml_writer."""
-        from src.agents.indexer.yaml_writer import write_file_yaml
-
-        assert callable(write_file_yaml)
-
-    def test_yaml_writer_sanitize_path_for_filename(self):
-        """sanitize_path_for_filename must be importable from yaml_writer."""
-        from src.agents.indexer.yaml_writer import sanitize_path_for_filename
-
-        assert callable(sanitize_path_for_filename)
-
-    def test_tools_indexer_tools(self):
-        """INDEXER_TOOLS must be importable from tools."""
-        from src.agents.indexer.tools import INDEXER_TOOLS
-
-        assert isinstance(INDEXER_TOOLS, list)
-
-    def test_tools_dispatch_tool(self):
-        """dispatch_tool must be importable from tools."""
-        from src.agents.indexer.tools import dispatch_tool
-
-        assert callable(dispatch_tool)
-
-    def test_tools_handle_index_project(self):
-        """handle_index_project must be importable from tools."""
-        from src.agents.indexer.tools import handle_index_project
-
-        assert callable(handle_index_project)
-
-    def test_tools_handle_update_project(self):
-        """handle_update_project must be importable from tools."""
-        from src.agents.indexer.tools import handle_update_project
-
-        assert callable(handle_update_project)
-
-    def test_tools_handle_search_architecture(self):
-        """handle_search_architecture must be importable from tools."""
-        from src.agents.indexer.tools import handle_search_architecture
-
-        assert callable(handle_search_architecture)
-
-    def test_tools_handle_list_projects(self):
-        """handle_list_projects must be importable from tools."""
-        from src.agents.indexer.tools import handle_list_projects
-
-        assert callable(handle_list_projects)
-
-    def test_tools_handle_delete_project(self):
-        """handle_delete_project must be importable from tools."""
-        from src.agents.indexer.tools import handle_delete_project
+class TestT004FunctionsImportable:
+    """T004: Assert all functions can be imported from each module."""
 
-        assert callable(handle_delete_project)
+    @pytest.mark.parametrize("module_name, symbol, kind", INDEXER_SYMBOLS)
+    def test_symbol_importable(self, module_name: str, symbol: str, kind):
+        """Each required symbol must be importable from its module."""
+        module = importlib.import_module(f"src.agents.indexer.{module_name}")
+        assert hasattr(module, symbol), f"{symbol} missing from {module_name}"
+
+        obj = getattr(module, symbol)
+        if kind == "callable":
+            assert callable(obj), f"{module_name}.{symbol} must be callable"
+        elif kind == "exists":
+            assert obj is not None
+        else:
+            assert isinstance(obj, kind), f"{module_name}.{symbol} must be a {kind.__name__}"
@@ -21,56 +21,39 @@ from src.agents.indexer.models import (
 )
 
 
-class TestT023ProjectModel:
-    """T023: Project model has all required fields."""
-
-    def test_project_has_id_field(self):
-        """Project should have an auto-generated UUID id."""
-        project = Project(name="test", root_path="/opt/test")
-
-        assert hasattr(project, "id")
-        assert isinstance(project.id, UUID)
-
-    def test_project_has_name_field(self):
-        """Project should have a name field."""
-        project = Project(name="my-project", root_path="/opt/test")
-
-        assert project.name == "my-project"
-
-    def test_project_has_root_path_field(self):
-        """Project should have a root_path field."""
-        project = Project(name="test", root_path="/opt/projects/app")
-
-        assert project.root_path == "/opt/projects/app"
-
-    def test_project_has_status_field(self):
-        """Project should have a status field with default INDEXING."""
-        project = Project(name="test", root_path="/opt/test")
+@pytest.fixture(scope="module")
+def project() -> Project:
+    """Project with only the required fields set (read-only, shared per module)."""
+    return Project(name="my-project", root_path="/opt/projects/app")
 
-        assert hasattr(project, "status")
-        assert project.status == ProjectStatus.INDEXING
 
-    def test_project_has_indexed_at_field(self):
-        """Project should have an optional indexed_at datetime."""
-        project = Project(name="test", root_path="/opt/test")
+@pytest.fixture(scope="module")
+def file_node() -> FileNode:
+    """FileNode with only the required fields set (read-only, shared per module)."""
+    return FileNode(
+        relative_path="src/main.py",
+        language="python",
+        content_hash="sha256hash",
+        size_bytes=2048,
+        last_modified=datetime.now(),
+    )
 
-        assert hasattr(project, "indexed_at")
-        # Default should be None
-        assert project.indexed_at is None
 
-    def test_project_has_file_count_field(self):
-        """Project should have file_count with default 0."""
-        project = Project(name="test", root_path="/opt/test")
-
-        assert hasattr(project, "file_count")
-        assert project.file_count == 0
-
-    def test_project_has_symbol_count_field(self):
-        """Project should have symbol_count with default 0."""
-        project = Project(name="test", root_path="/opt/test")
+class TestT023ProjectModel:
+    """T023: Project model has all required fields."""
 
-        assert hasattr(project, "symbol_count")
-        assert project.symbol_count == 0
+    @pytest.mark.parametrize("attr, check", [
+        ("id", lambda v: isinstance(v, UUID)),
+        ("name", lambda v: v == "my-project"),
+        ("root_path", lambda v: v == "/opt/projects/app"),
+        ("status", lambda v: v == ProjectStatus.INDEXING),
+        ("indexed_at", lambda v: v is None),
+        ("file_count", lambda v: v == 0),
+        ("symbol_count", lambda v: v == 0),
+    ])
+    def test_project_field(self, project, attr, check):
+        """Each Project field should exist with its given or default value."""
+        assert check(getattr(project, attr)), f"Unexpected Project.{attr}: {getattr(project, attr)!r}"
 
     def test_project_status_can_be_set(self):
         """Project status can be set to different values."""
@@ -86,117 +69,20 @@ class TestT023ProjectModel:
 class TestT024FileNodeModel:
     """T024: FileNode model has all required fields."""
 
-    def test_file_node_has_id_field(self):
-        """FileNode should have an auto-generated UUID id."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=1024,
-            last_modified=datetime.now(),
-        )
-
-        assert hasattr(file_node, "id")
-        assert isinstance(file_node.id, UUID)
-
-    def test_file_node_has_project_id_field(self):
-        """FileNode should have an optional project_id field."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=1024,
-            last_modified=datetime.now(),
-        )
-
-        assert hasattr(file_node, "project_id")
-
-    def test_file_node_has_relative_path_field(self):
-        """FileNode should have a relative_path field."""
-        file_node = FileNode(
-            relative_path="src/utils/helpers.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=512,
-            last_modified=datetime.now(),
-        )
-
-        assert file_node.relative_path == "src/utils/helpers.py"
-
-    def test_file_node_has_language_field(self):
-        """FileNode should have a language field."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=1024,
-            last_modified=datetime.now(),
-        )
-
-        assert file_node.language == "python"
-
-    def test_file_node_has_content_hash_field(self):
-        """FileNode should have a content_hash field."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="sha256hash",
-            size_bytes=1024,
-            last_modified=datetime.now(),
-        )
-
-        assert file_node.content_hash == "sha256hash"
-
-    def test_file_node_has_size_bytes_field(self):
-        """FileNode should have a size_bytes field."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=2048,
-            last_modified=datetime.now(),
-        )
-
-        assert file_node.size_bytes == 2048
-
-    def test_file_node_has_parse_status_field(self):
-        """FileNode should have a parse_status field with default SUCCESS."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=1024,
-            last_modified=datetime.now(),
-        )
-
-        assert hasattr(file_node, "parse_status")
-        assert file_node.parse_status == ParseStatus.SUCCESS
-
-    def test_file_node_has_functions_list(self):
-        """FileNode should have a functions list."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=1024,
-            last_modified=datetime.now(),
-        )
-
-        assert hasattr(file_node, "functions")
-        assert isinstance(file_node.functions, list)
-
-    def test_file_node_has_classes_list(self):
-        """FileNode should have a classes list."""
-        file_node = FileNode(
-            relative_path="src/main.py",
-            language="python",
-            content_hash="abc123",
-            size_bytes=1024,
-            last_modified=datetime.now(),
-        )
-
-        assert hasattr(file_node, "classes")
-        assert isinstance(file_node.classes, list)
+    @pytest.mark.parametrize("attr, check", [
+        ("id", lambda v: isinstance(v, UUID)),
+        ("project_id", lambda v: v is None),
+        ("relative_path", lambda v: v == "src/main.py"),
+        ("language", lambda v: v == "python"),
+        ("content_hash", lambda v: v == "sha256hash"),
+        ("size_bytes", lambda v: v == 2048),
+        ("parse_status", lambda v: v == ParseStatus.SUCCESS),
+        ("functions", lambda v: isinstance(v, list)),
+        ("classes", lambda v: isinstance(v, list)),
+    ])
+    def test_file_node_field(self, file_node, attr, check):
+        """Each FileNode field should exist with its given or default value."""
+        assert check(getattr(file_node, attr)), f"Unexpected FileNode.{attr}: {getattr(file_node, attr)!r}"
 
 
 class TestT025FunctionDefModel:
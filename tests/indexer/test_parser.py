@@ -12,91 +12,26 @@ import pytest
 from src.agents.indexer.parser import (
     get_parser,
     parse_file,
+    parse_source,
     extract_functions,
     extract_classes,
 )
 
 
-# Sample Python code for testing
-SAMPLE_PYTHON_CODE = '''"""Module docstring."""
-
-def simple_function():
-    """A simple function."""
-    pass
-
-
-def function_with_params(name: str, count: int = 10) -> str:
-    """Function with typed parameters.
-
-    Args:
-        name: The name parameter
-        count: The count parameter
-
-    Returns:
-        Processed string
-    """
-    return name * count
-
-
-async def async_function(data: list) -> dict:
-    """An async function."""
-    return {"data": data}
-
-
-class SimpleClass:
-    """A simple class."""
-
-    def __init__(self, value: int):
-        """Initialize with a value."""
-        self.value = value
-
-    def get_value(self) -> int:
-        """Get the stored value."""
-        return self.value
-
-
-class InheritedClass(SimpleClass):
-    """A class that inherits from SimpleClass."""
-
-    def __init__(self, value: int, name: str):
-        """Initialize with value and name."""
-        super().__init__(value)
-        self.name = name
-'''
-
-
 class TestT047GetParser:
     """T047: get_parser() returns parser for language."""
 
-    def test_get_parser_python(self):
-        """get_parser should return a parser for Python."""
-        parser = get_parser("python")
-
-        assert parser is not None, "get_parser('python') should return a parser"
-
-    def test_get_parser_javascript(self):
-        """get_parser should return a parser for JavaScript."""
-        parser = get_parser("javascript")
-
-        assert parser is not None, "get_parser('javascript') should return a parser"
-
-    def test_get_parser_typescript(self):
-        """get_parser should return a parser for TypeScript."""
-        parser = get_parser("typescript")
-
-        assert parser is not None, "get_parser('typescript') should return a parser"
+    @pytest.mark.parametrize("language", ["python", "javascript", "typescript", "go", "java"])
+    def test_get_parser_supported(self, language):
+        """get_parser should return a parser for each supported language."""
+        parser = get_parser(language)
 
-    def test_get_parser_go(self):
-        """get_parser should return a parser for Go."""
-        parser = get_parser("go")
+        assert parser is not None, f"get_parser({language!r}) should return a parser"
 
-        assert parser is not None, "get_parser('go') should return a parser"
-
-    def test_get_parser_java(self):
-        """get_parser should return a parser for Java."""
-        parser = get_parser("java")
-
-        assert parser is not None, "get_parser('java') should return a parser"
+    def test_get_parser_is_cached(self):
+        """Repeated calls should reuse one parser per language."""
+        assert get_parser("python") is get_parser("python")
+        assert get_parser("python") is not get_parser("go")
 
     def test_get_parser_unsupported_returns_none(self):
         """get_parser should return None for unsupported languages."""
@@ -108,13 +43,9 @@ class TestT047GetParser:
 class TestT048ParseFileExtractsFunction:
     """T048: parse_file() extracts functions from Python file."""
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_simple_function(self, tmp_path):
+    def test_parse_extracts_simple_function(self, sample_file_node):
         """parse_file should extract a simple function."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None, "parse_file should return a FileNode"
         assert len(result.functions) > 0, "Should extract functions"
@@ -123,13 +54,9 @@ class TestT048ParseFileExtractsFunction:
         func_names = [f.name for f in result.functions]
         assert "simple_function" in func_names, "Should find simple_function"
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_function_with_params(self, tmp_path):
+    def test_parse_extracts_function_with_params(self, sample_file_node):
         """parse_file should extract function with parameters."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None
         func_names = [f.name for f in result.functions]
@@ -139,13 +66,9 @@ class TestT048ParseFileExtractsFunction:
 class TestT049ParseFileExtractsClass:
     """T049: parse_file() extracts classes from Python file."""
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_simple_class(self, tmp_path):
+    def test_parse_extracts_simple_class(self, sample_file_node):
         """parse_file should extract a simple class."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None, "parse_file should return a FileNode"
         assert len(result.classes) > 0, "Should extract classes"
@@ -154,13 +77,9 @@ class TestT049ParseFileExtractsClass:
         class_names = [c.name for c in result.classes]
         assert "SimpleClass" in class_names, "Should find SimpleClass"
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_inherited_class(self, tmp_path):
+    def test_parse_extracts_inherited_class(self, sample_file_node):
         """parse_file should extract class with inheritance."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None
         # Find InheritedClass
@@ -175,13 +94,9 @@ class TestT049ParseFileExtractsClass:
 class TestT050ParseFileExtractsDocstring:
     """T050: parse_file() extracts docstrings from functions."""
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_function_docstring(self, tmp_path):
+    def test_parse_extracts_function_docstring(self, sample_file_node):
         """parse_file should extract function docstrings."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None
         # Find function_with_params which has a docstring
@@ -193,13 +108,9 @@ class TestT050ParseFileExtractsDocstring:
         assert func.docstring is not None, "Should have docstring"
         assert "typed parameters" in func.docstring.lower(), "Docstring should contain description"
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_class_docstring(self, tmp_path):
+    def test_parse_extracts_class_docstring(self, sample_file_node):
         """parse_file should extract class docstrings."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None
         # Find SimpleClass
@@ -214,13 +125,9 @@ class TestT050ParseFileExtractsDocstring:
 class TestT051ParseFileExtractsParameters:
     """T051: parse_file() extracts parameters with types."""
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_typed_parameters(self, tmp_path):
+    def test_parse_extracts_typed_parameters(self, sample_file_node):
         """parse_file should extract parameter types."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None
         # Find function_with_params
@@ -243,13 +150,9 @@ class TestT051ParseFileExtractsParameters:
         assert count_param is not None, "Should have 'count' parameter"
         assert count_param.type == "int", f"count should be int, got {count_param.type}"
 
-    @pytest.mark.asyncio
-    async def test_parse_extracts_return_type(self, tmp_path):
+    def test_parse_extracts_return_type(self, sample_file_node):
         """parse_file should extract return types."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None
         func = next(
@@ -259,13 +162,9 @@ class TestT051ParseFileExtractsParameters:
         assert func is not None
         assert func.return_type == "str", f"Return type should be str, got {func.return_type}"
 
-    @pytest.mark.asyncio
-    async def test_parse_detects_async_function(self, tmp_path):
+    def test_parse_detects_async_function(self, sample_file_node):
         """parse_file should detect async functions."""
-        test_file = tmp_path / "test.py"
-        test_file.write_text(SAMPLE_PYTHON_CODE)
-
-        result = await parse_file(test_file, "python")
+        result = sample_file_node
 
         assert result is not None
         func = next(
@@ -276,6 +175,22 @@ class TestT051ParseFileExtractsParameters:
         assert func.is_async is True, "Should be marked as async"
 
 
+class TestParseSourceMatchesParseFile:
+    """parse_file() is a thin wrapper over parse_source()."""
+
+    @pytest.mark.asyncio
+    async def test_parse_source_matches_parse_file(self, sample_parser_code, sample_file_node):
+        """Parsing from memory should extract the same symbols as from disk."""
+        result = await parse_source(sample_parser_code.encode(), "python")
+
+        assert result.relative_path == ""
+        assert result.content_hash == sample_file_node.content_hash
+        assert [f.signature for f in result.functions] == [
+            f.signature for f in sample_file_node.functions
+        ]
+        assert [c.name for c in result.classes] == [c.name for c in sample_file_node.classes]
+
+
 class TestT109EncodingErrors:
     """T109: Parser handles encoding errors gracefully."""
 
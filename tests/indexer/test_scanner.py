@@ -55,6 +55,15 @@ class TestT040ShouldExcludeMatches:
 
         assert result is True, "vendor should be excluded"
 
+    def test_should_exclude_nested_directory_name(self):
+        """A "dir/**" pattern should also match that directory deeper in the tree."""
+        path = Path("packages/web/node_modules/react/index.js")
+        patterns = ["*.md", "node_modules/**"]
+
+        result = should_exclude(path, patterns)
+
+        assert result is True, "Nested node_modules should be excluded"
+
 
 class TestT041ShouldExcludeNotMatching:
     """T041: should_exclude() returns False for non-matching paths."""
@@ -209,6 +218,24 @@ class TestT044ScanDirectorySkipsExcluded:
         for f in files:
             assert "node_modules" not in str(f), f"Should skip node_modules: {f}"
 
+    @pytest.mark.asyncio
+    async def test_scan_matches_should_exclude(self, tmp_path):
+        """Pruned directories and file patterns should agree with should_exclude."""
+        for rel in ("main.py", "lib/util.py", "lib/build/gen.py", "build/out.py", "app.min.js"):
+            target = tmp_path / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("x = 1\n")
+        exclude_patterns = ["build/**", "*.min.js"]
+
+        files = []
+        async for file_path, language in scan_directory(
+            tmp_path,
+            exclude_patterns=exclude_patterns,
+        ):
+            files.append(file_path.relative_to(tmp_path).as_posix())
+
+        assert sorted(files) == ["lib/util.py", "main.py"]
+
 
 class TestT108CircularSymlinks:
     """T108: Scanner handles circular symlinks gracefully."""